@@ -6,6 +6,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from sentry_sdk import set_tag, start_span
 
+from sentry import options
 from sentry.api.api_owners import ApiOwner
 from sentry.api.api_publish_status import ApiPublishStatus
 from sentry.api.authentication import RelayAuthentication
@@ -17,6 +18,7 @@ from sentry.models.project import Project
 from sentry.models.projectkey import ProjectKey, ProjectKeyStatus
 from sentry.relay import config, projectconfig_cache
 from sentry.relay.globalconfig import get_global_config
+from sentry.relay.projectconfig_cache.base import UNCHANGED
 from sentry.tasks.relay import schedule_build_project_config
 from sentry.utils import metrics
 
@@ -110,6 +112,9 @@ class RelayProjectConfigsEndpoint(Endpoint):
         return post_or_schedule
 
     def _post_or_schedule_by_key(self, request: Request):
+        if options.get("relay.project-configs.bulk-fetch"):
+            return self._post_or_schedule_by_key_bulk(request)
+
         public_keys = set(request.relay_request_data.get("publicKeys") or ())
 
         proj_configs = {}
@@ -129,6 +134,42 @@ class RelayProjectConfigsEndpoint(Endpoint):
         metrics.incr("relay.project_configs.post_v3.fetched", amount=len(proj_configs))
         return {"configs": proj_configs, "pending": pending}
 
+    def _post_or_schedule_by_key_bulk(self, request: Request):
+        """Like :meth:`_post_or_schedule_by_key`, but fetches all cached configs at once.
+
+        Relay may send the revisions of the configs it already has in ``revisions``, in
+        the same order as ``publicKeys``.  Configs that still have that revision are not
+        sent again, but listed in ``unchanged``.
+        """
+        public_keys = list(request.relay_request_data.get("publicKeys") or ())
+        revisions = request.relay_request_data.get("revisions") or ()
+        known_revisions = {
+            key: rev for key, rev in zip(public_keys, revisions) if isinstance(rev, str)
+        }
+
+        cached = projectconfig_cache.backend.get_many(set(public_keys), revisions=known_revisions)
+
+        proj_configs = {}
+        pending = []
+        unchanged = []
+        for key, project_config in cached.items():
+            if project_config == UNCHANGED:
+                unchanged.append(key)
+            elif project_config:
+                proj_configs[key] = project_config
+            else:
+                schedule_build_project_config(public_key=key)
+                pending.append(key)
+
+        metrics.incr("relay.project_configs.post_v3.pending", amount=len(pending))
+        metrics.incr("relay.project_configs.post_v3.fetched", amount=len(proj_configs))
+        metrics.incr("relay.project_configs.post_v3.unchanged", amount=len(unchanged))
+
+        response: dict[str, Any] = {"configs": proj_configs, "pending": pending}
+        if unchanged:
+            response["unchanged"] = unchanged
+        return response
+
     def _get_cached_or_schedule(self, public_key) -> dict | None:
         """
         Returns the config of a project if it's in the cache; else, schedules a
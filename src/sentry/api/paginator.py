@@ -1,5 +1,8 @@
+import base64
 import bisect
 import functools
+import heapq
+import itertools
 import logging
 import math
 from collections.abc import Callable, Sequence
@@ -9,9 +12,11 @@ from urllib.parse import quote
 
 from django.core.exceptions import EmptyResultSet, ObjectDoesNotExist
 from django.db import connections
-from django.db.models.functions import Lower
+from django.db.models import F, Q
+from django.db.models.functions import Collate, Lower
 
-from sentry.utils.cursors import Cursor, CursorResult, build_cursor
+from sentry.utils import json
+from sentry.utils.cursors import Cursor, CursorResult, StringCursor, build_cursor
 from sentry.utils.pagination_factory import PaginatorLike
 
 quote_name = connections["default"].ops.quote_name
@@ -555,6 +560,7 @@ class CombinedQuerysetIntermediary:
             for key in self.order_by:
                 self._assert_has_field(instance, key)
             self.order_by_type = type(getattr(instance, self.order_by[0]))
+            self.order_by_types = [type(getattr(instance, key)) for key in self.order_by]
         except ObjectDoesNotExist:
             self.is_empty = True
 
@@ -704,6 +710,146 @@ class CombinedQuerysetPaginator:
         return CursorResult(results=results, next=next_cursor, prev=prev_cursor)
 
 
+class KeysetCombinedQuerysetPaginator(CombinedQuerysetPaginator):
+    """
+    Paginates between multiple querysets like `CombinedQuerysetPaginator`, but
+    with keyset pagination instead of offsets.
+
+    Every intermediary is ordered by its `order_by` keys, its model and the
+    primary key, which is a total order across all of them. The cursor holds
+    the position of the first or last item of the page in that order, from
+    which every queryset derives its own keyset condition. A page then only
+    fetches `limit + 1` rows per queryset and merges them, so deep pages cost
+    the same as the first one, and rows that are added or removed between
+    requests do not shift later pages.
+
+    The `order_by` keys must not be nullable. Cursors are opaque strings, use
+    this paginator with `StringCursor`.
+    """
+
+    def _keyset_field(self, index):
+        return f"_keyset_{index}"
+
+    def _build_keyset_queryset(self, intermediary):
+        annotate = {}
+        for index, (key, key_type) in enumerate(
+            zip(intermediary.order_by, intermediary.order_by_types)
+        ):
+            expression = Lower(key) if self.case_insensitive else F(key)
+            if key_type is str:
+                # Compare strings by code point in the database, like the merge does.
+                expression = Collate(expression, "C")
+            annotate[self._keyset_field(index)] = expression
+        return intermediary.queryset.annotate(**annotate)
+
+    def _get_source(self, intermediary):
+        return intermediary.instance_type._meta.label
+
+    def _get_position(self, item, source, num_keys):
+        values = [getattr(item, self._keyset_field(index)) for index in range(num_keys)]
+        return (*values, source, item.pk)
+
+    def _filter_after(self, queryset, source, position, num_keys, asc):
+        """
+        Filters `queryset` to the rows that come after `position` in the
+        direction of the page.
+        """
+        lookup = "gt" if asc else "lt"
+        *values, position_source, position_pk = position
+        if len(values) != num_keys:
+            raise BadPaginationError("Invalid cursor")
+
+        condition = Q()
+        equal = Q()
+        for index, value in enumerate(values):
+            field = self._keyset_field(index)
+            condition |= equal & Q(**{f"{field}__{lookup}": value})
+            equal &= Q(**{field: value})
+
+        if source == position_source:
+            condition |= equal & Q(**{f"pk__{lookup}": position_pk})
+        elif (source > position_source) == asc:
+            condition |= equal
+
+        return queryset.filter(condition)
+
+    def _encode_position(self, position):
+        return (
+            base64.urlsafe_b64encode(
+                json.dumps(
+                    [
+                        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+                        for value in position
+                    ]
+                ).encode("utf-8")
+            )
+            .decode("ascii")
+            .rstrip("=")
+        )
+
+    def _decode_position(self, value):
+        try:
+            decoded = json.loads(
+                base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode("utf-8")
+            )
+            return tuple(
+                datetime.fromisoformat(item["dt"]) if isinstance(item, dict) else item
+                for item in decoded
+            )
+        except (TypeError, ValueError, KeyError):
+            raise BadPaginationError("Invalid cursor")
+
+    def get_result(self, cursor=None, limit=100):
+        limit = min(limit, MAX_LIMIT)
+        position = self._decode_position(str(cursor.value)) if cursor and cursor.value else None
+        is_prev = bool(cursor and cursor.is_prev)
+        asc = self._is_asc(is_prev)
+
+        sources = []
+        for intermediary in self.intermediaries:
+            source = self._get_source(intermediary)
+            num_keys = len(intermediary.order_by)
+            queryset = self._build_keyset_queryset(intermediary)
+            if position is not None:
+                queryset = self._filter_after(queryset, source, position, num_keys, asc)
+            ordering = [self._keyset_field(index) for index in range(num_keys)] + ["pk"]
+            queryset = queryset.order_by(*(key if asc else f"-{key}" for key in ordering))
+            sources.append(
+                [
+                    (self._get_position(item, source, num_keys), item)
+                    for item in queryset[: limit + 1]
+                ]
+            )
+
+        merged = list(
+            itertools.islice(
+                heapq.merge(*sources, key=lambda row: row[0], reverse=not asc), limit + 1
+            )
+        )
+        has_more = len(merged) > limit
+        merged = merged[:limit]
+        if is_prev:
+            merged.reverse()
+
+        results = [item for _, item in merged]
+        if merged:
+            first, last = self._encode_position(merged[0][0]), self._encode_position(merged[-1][0])
+        else:
+            first = last = cursor.value if cursor else ""
+
+        if is_prev:
+            next_cursor = StringCursor(last, 0, False, True)
+            prev_cursor = StringCursor(first, 0, True, has_more)
+        else:
+            next_cursor = StringCursor(last, 0, False, has_more)
+            prev_cursor = StringCursor(first, 0, True, position is not None)
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(results=results, next=next_cursor, prev=prev_cursor)
+
+
 class ChainPaginator:
     """
     Chain multiple datasources together and paginate them as one source.
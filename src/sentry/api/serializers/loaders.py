@@ -0,0 +1,112 @@
+"""
+Dependency-aware attribute loading for serializers.
+
+`get_attrs` of a serializer typically runs a number of independent lookups,
+each of which waits on Postgres or Snuba. Declared as `AttrLoader`s, lookups
+that only wait on Snuba run on a bounded pool while the request thread keeps
+running the database lookups.
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+import sentry_sdk
+
+__all__ = ("AttrLoader", "run_attr_loaders")
+
+_loader_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="serializer-attr-loaders")
+
+atexit.register(_loader_pool.shutdown, False)
+
+
+@dataclass(frozen=True)
+class AttrLoader:
+    """
+    A single lookup of `get_attrs`. `load` is called with the results of the
+    loaders named in `depends_on` as keyword arguments.
+
+    Concurrent loaders run on a worker thread and must not use the database,
+    as Django connections are per thread. All other loaders run in the calling
+    thread, in declaration order as far as their dependencies allow.
+    """
+
+    name: str
+    load: Callable[..., Any]
+    depends_on: tuple[str, ...] = ()
+    concurrent: bool = False
+
+
+def _run_loader(loader: AttrLoader, op: str, results: Mapping[str, Any]) -> Any:
+    with sentry_sdk.start_span(op=op, description=loader.name):
+        return loader.load(**{name: results[name] for name in loader.depends_on})
+
+
+def _run_loader_in_scope(
+    isolation_scope: sentry_sdk.Scope,
+    current_scope: sentry_sdk.Scope,
+    loader: AttrLoader,
+    op: str,
+    results: Mapping[str, Any],
+) -> Any:
+    with sentry_sdk.scope.use_isolation_scope(isolation_scope):
+        with sentry_sdk.scope.use_scope(current_scope):
+            return _run_loader(loader, op, results)
+
+
+def run_attr_loaders(loaders: Sequence[AttrLoader], op: str) -> dict[str, Any]:
+    """
+    Runs all loaders and returns their results by name. Every loader is
+    recorded as a span with the given `op`.
+    """
+    names = {loader.name for loader in loaders}
+    for loader in loaders:
+        missing = set(loader.depends_on) - names
+        if missing:
+            raise ValueError(f"Loader {loader.name} depends on unknown loaders {missing}")
+
+    results: dict[str, Any] = {}
+    pending = list(loaders)
+    running: dict[Future[Any], AttrLoader] = {}
+
+    def is_ready(loader: AttrLoader) -> bool:
+        return all(name in results for name in loader.depends_on)
+
+    try:
+        while pending or running:
+            # Start concurrent loaders first, so they overlap with the next
+            # loader of the calling thread.
+            for loader in [loader for loader in pending if loader.concurrent and is_ready(loader)]:
+                pending.remove(loader)
+                future = _loader_pool.submit(
+                    _run_loader_in_scope,
+                    sentry_sdk.Scope.get_isolation_scope(),
+                    sentry_sdk.Scope.get_current_scope(),
+                    loader,
+                    op,
+                    dict(results),
+                )
+                running[future] = loader
+
+            for future in [future for future in running if future.done()]:
+                results[running.pop(future).name] = future.result()
+
+            loader = next(
+                (loader for loader in pending if not loader.concurrent and is_ready(loader)), None
+            )
+            if loader is not None:
+                pending.remove(loader)
+                results[loader.name] = _run_loader(loader, op, results)
+            elif running:
+                wait(running, return_when=FIRST_COMPLETED)
+            elif pending:
+                raise ValueError(f"Loaders {[loader.name for loader in pending]} form a cycle")
+    finally:
+        for future in running:
+            future.cancel()
+
+    return results
@@ -12,8 +12,9 @@ import sentry_sdk
 from django.conf import settings
 from django.db.models import Min, prefetch_related_objects
 
-from sentry import features, tagstore
+from sentry import features, options, tagstore
 from sentry.api.serializers import Serializer, register, serialize
+from sentry.api.serializers.loaders import AttrLoader, run_attr_loaders
 from sentry.api.serializers.models.actor import ActorSerializer
 from sentry.api.serializers.models.plugin import is_plugin_deprecated
 from sentry.app import env
@@ -56,7 +57,13 @@ from sentry.users.services.user.serial import serialize_generic_user
 from sentry.users.services.user.service import user_service
 from sentry.utils.cache import cache
 from sentry.utils.safe import safe_execute
-from sentry.utils.snuba import aliased_query, raw_query
+from sentry.utils.snuba import (
+    SnubaRequest,
+    aliased_query,
+    aliased_query_params,
+    execute_snuba_requests,
+    prepare_raw_query,
+)
 
 # TODO(jess): remove when snuba is primary backend
 snuba_tsdb = SnubaTSDB(**settings.SENTRY_TSDB_OPTIONS)
@@ -65,6 +72,28 @@ snuba_tsdb = SnubaTSDB(**settings.SENTRY_TSDB_OPTIONS)
 logger = logging.getLogger(__name__)
 
 
+def _partition_by_category(item_list: Sequence[Group]) -> tuple[list[Group], list[Group]]:
+    error_issues = [group for group in item_list if GroupCategory.ERROR == group.issue_category]
+    generic_issues = [group for group in item_list if group.issue_category != GroupCategory.ERROR]
+    return error_issues, generic_issues
+
+
+def _execute_snuba_requests(requests: Mapping[Any, Any] | None) -> dict[Any, Any] | None:
+    """
+    Executes the prepared Snuba queries among `requests` as one batch and
+    returns their results under the same keys, other values are kept as is.
+    """
+    if requests is None:
+        return None
+
+    results = dict(requests)
+    keys = [key for key, request in requests.items() if isinstance(request, SnubaRequest)]
+    if keys:
+        for key, result in zip(keys, execute_snuba_requests([requests[key] for key in keys])):
+            results[key] = result
+    return results
+
+
 def merge_list_dictionaries(
     dict1: MutableMapping[Any, list[Any]], dict2: Mapping[Any, Sequence[Any]]
 ):
@@ -201,56 +230,11 @@ class GroupSerializerBase(Serializer, ABC):
         # making unnecessary queries.
         prefetch_related_objects(item_list, "project__organization")
 
-        if user.is_authenticated and item_list:
-            bookmarks = set(
-                GroupBookmark.objects.filter(user_id=user.id, group__in=item_list).values_list(
-                    "group_id", flat=True
-                )
-            )
-            seen_groups = dict(
-                GroupSeen.objects.filter(user_id=user.id, group__in=item_list).values_list(
-                    "group_id", "last_seen"
-                )
-            )
-            subscriptions = self._get_subscriptions(item_list, user)
-        else:
-            bookmarks = set()
-            seen_groups = {}
-            subscriptions = defaultdict(lambda: (False, False, None))
-
-        resolved_assignees = self._serialize_assignees(item_list)
-
-        ignore_items = {g.group_id: g for g in GroupSnooze.objects.filter(group__in=item_list)}
-
-        release_resolutions, commit_resolutions = self._resolve_resolutions(item_list, user)
-
-        user_ids = {
-            user_id
-            for user_id in itertools.chain(
-                (r[-1] for r in release_resolutions.values()),
-                (r.actor_id for r in ignore_items.values()),
-            )
-            if user_id is not None
-        }
-        if user_ids:
-            serialized_users = user_service.serialize_many(
-                filter={"user_ids": user_ids, "is_active": True},
-                as_user=serialize_generic_user(user),
-            )
-            actors = {id: u for id, u in zip(user_ids, serialized_users)}
-        else:
-            actors = {}
-
-        share_ids = dict(
-            GroupShare.objects.filter(group__in=item_list).values_list("group_id", "uuid")
-        )
-
-        seen_stats = self._get_seen_stats(item_list, user)
-
-        organization_id_list = list({item.project.organization_id for item in item_list})
         # if no groups, then we can't proceed but this seems to be a valid use case
         if not item_list:
             return {}
+
+        organization_id_list = list({item.project.organization_id for item in item_list})
         if len(organization_id_list) > 1:
             # this should never happen but if it does we should know about it
             logger.warning(
@@ -262,18 +246,14 @@ class GroupSerializerBase(Serializer, ABC):
         # should only have 1 org at this point
         organization_id = organization_id_list[0]
 
-        authorized = self._is_authorized(user, organization_id)
-
-        annotations_by_group_id: MutableMapping[int, list[Any]] = defaultdict(list)
-        for annotations_by_group in itertools.chain.from_iterable(
-            [
-                self._resolve_integration_annotations(organization_id, item_list),
-                [self._resolve_external_issue_annotations(item_list)],
-            ]
-        ):
-            merge_list_dictionaries(annotations_by_group_id, annotations_by_group)
-
-        snuba_stats = self._get_group_snuba_stats(item_list, seen_stats)
+        loaded = run_attr_loaders(
+            self._get_attr_loaders(item_list, user, organization_id),
+            op="serializer.group.get_attrs",
+        )
+        release_resolutions, commit_resolutions = loaded["resolutions"]
+        actors = loaded["actors"]
+        seen_stats = loaded["seen_stats"]
+        snuba_stats = loaded["snuba_stats"]
 
         result = {}
         for item in item_list:
@@ -290,24 +270,24 @@ class GroupSerializerBase(Serializer, ABC):
                 if resolution:
                     resolution_type = "commit"
 
-            ignore_item = ignore_items.get(item.id)
+            ignore_item = loaded["ignore_items"].get(item.id)
 
             result[item] = {
                 "id": item.id,
-                "assigned_to": resolved_assignees.get(item.id),
-                "is_bookmarked": item.id in bookmarks,
-                "subscription": subscriptions[item.id],
-                "has_seen": seen_groups.get(item.id, active_date) > active_date,
+                "assigned_to": loaded["assignees"].get(item.id),
+                "is_bookmarked": item.id in loaded["bookmarks"],
+                "subscription": loaded["subscriptions"][item.id],
+                "has_seen": loaded["seen_groups"].get(item.id, active_date) > active_date,
                 "annotations": self._resolve_and_extend_plugin_annotation(
-                    item, annotations_by_group_id[item.id]
+                    item, loaded["annotations"][item.id]
                 ),
                 "ignore_until": ignore_item,
                 "ignore_actor": actors.get(ignore_item.actor_id) if ignore_item else None,
                 "resolution": resolution,
                 "resolution_type": resolution_type,
                 "resolution_actor": resolution_actor,
-                "share_id": share_ids.get(item.id),
-                "authorized": authorized,
+                "share_id": loaded["share_ids"].get(item.id),
+                "authorized": loaded["authorized"],
             }
             if snuba_stats is not None:
                 result[item]["is_unhandled"] = bool(snuba_stats.get(item.id, {}).get("unhandled"))
@@ -316,6 +296,159 @@ class GroupSerializerBase(Serializer, ABC):
                 result[item].update(seen_stats.get(item, {}))
         return result
 
+    def _get_attr_loaders(
+        self, item_list: Sequence[Group], user: Any, organization_id: int
+    ) -> list[AttrLoader]:
+        """
+        Declares the lookups of `get_attrs`. Snuba loaders come first so that
+        they start before the Postgres loaders when running concurrently.
+        """
+        if options.get("api.group-serializer.concurrent-attrs"):
+            snuba_loaders = self._get_concurrent_snuba_attr_loaders(item_list, user)
+        else:
+            snuba_loaders = [
+                AttrLoader("seen_stats", lambda: self._get_seen_stats(item_list, user)),
+                AttrLoader(
+                    "snuba_stats",
+                    lambda seen_stats: self._get_group_snuba_stats(item_list, seen_stats),
+                    depends_on=("seen_stats",),
+                ),
+            ]
+
+        if user.is_authenticated:
+            user_loaders = [
+                AttrLoader("bookmarks", lambda: self._get_bookmarks(item_list, user)),
+                AttrLoader("seen_groups", lambda: self._get_seen_groups(item_list, user)),
+                AttrLoader("subscriptions", lambda: self._get_subscriptions(item_list, user)),
+            ]
+        else:
+            user_loaders = [
+                AttrLoader("bookmarks", set),
+                AttrLoader("seen_groups", dict),
+                AttrLoader("subscriptions", lambda: defaultdict(lambda: (False, False, None))),
+            ]
+
+        return [
+            *snuba_loaders,
+            *user_loaders,
+            AttrLoader("assignees", lambda: self._serialize_assignees(item_list)),
+            AttrLoader(
+                "ignore_items",
+                lambda: {g.group_id: g for g in GroupSnooze.objects.filter(group__in=item_list)},
+            ),
+            AttrLoader("resolutions", lambda: self._resolve_resolutions(item_list, user)),
+            AttrLoader(
+                "actors",
+                lambda resolutions, ignore_items: self._get_actors(
+                    resolutions[0], ignore_items, user
+                ),
+                depends_on=("resolutions", "ignore_items"),
+            ),
+            AttrLoader(
+                "share_ids",
+                lambda: dict(
+                    GroupShare.objects.filter(group__in=item_list).values_list("group_id", "uuid")
+                ),
+            ),
+            AttrLoader("authorized", lambda: self._is_authorized(user, organization_id)),
+            AttrLoader("annotations", lambda: self._get_annotations(item_list, organization_id)),
+        ]
+
+    def _get_concurrent_snuba_attr_loaders(
+        self, item_list: Sequence[Group], user: Any
+    ) -> list[AttrLoader]:
+        """
+        Splits the Snuba lookups into preparing the queries, which may hit the
+        database, running them on a worker thread, and parsing their results.
+        The seen stats queries share a time range and run as one batch.
+        """
+        return [
+            AttrLoader("seen_stats_requests", lambda: self._prepare_seen_stats_requests(item_list)),
+            AttrLoader(
+                "seen_stats_results",
+                _execute_snuba_requests,
+                depends_on=("seen_stats_requests",),
+                concurrent=True,
+            ),
+            AttrLoader(
+                "seen_stats",
+                lambda seen_stats_results: (
+                    self._get_seen_stats(item_list, user)
+                    if seen_stats_results is None
+                    else self._get_seen_stats_from_results(item_list, seen_stats_results)
+                ),
+                depends_on=("seen_stats_results",),
+            ),
+            AttrLoader(
+                "snuba_stats_requests",
+                lambda seen_stats: self._prepare_group_snuba_stats(item_list, seen_stats),
+                depends_on=("seen_stats",),
+            ),
+            AttrLoader(
+                "snuba_stats_results",
+                _execute_snuba_requests,
+                depends_on=("snuba_stats_requests",),
+                concurrent=True,
+            ),
+            AttrLoader(
+                "snuba_stats",
+                self._get_group_snuba_stats_from_results,
+                depends_on=("snuba_stats_results",),
+            ),
+        ]
+
+    @staticmethod
+    def _get_bookmarks(item_list: Sequence[Group], user: Any) -> set[int]:
+        return set(
+            GroupBookmark.objects.filter(user_id=user.id, group__in=item_list).values_list(
+                "group_id", flat=True
+            )
+        )
+
+    @staticmethod
+    def _get_seen_groups(item_list: Sequence[Group], user: Any) -> dict[int, datetime]:
+        return dict(
+            GroupSeen.objects.filter(user_id=user.id, group__in=item_list).values_list(
+                "group_id", "last_seen"
+            )
+        )
+
+    @staticmethod
+    def _get_actors(
+        release_resolutions: Mapping[int, tuple[Any, ...]],
+        ignore_items: Mapping[int, GroupSnooze],
+        user: Any,
+    ) -> Mapping[int, Any]:
+        user_ids = {
+            user_id
+            for user_id in itertools.chain(
+                (r[-1] for r in release_resolutions.values()),
+                (r.actor_id for r in ignore_items.values()),
+            )
+            if user_id is not None
+        }
+        if not user_ids:
+            return {}
+
+        serialized_users = user_service.serialize_many(
+            filter={"user_ids": user_ids, "is_active": True},
+            as_user=serialize_generic_user(user),
+        )
+        return {id: u for id, u in zip(user_ids, serialized_users)}
+
+    def _get_annotations(
+        self, item_list: Sequence[Group], organization_id: int
+    ) -> Mapping[int, list[Any]]:
+        annotations_by_group_id: MutableMapping[int, list[Any]] = defaultdict(list)
+        for annotations_by_group in itertools.chain.from_iterable(
+            [
+                self._resolve_integration_annotations(organization_id, item_list),
+                [self._resolve_external_issue_annotations(item_list)],
+            ]
+        ):
+            merge_list_dictionaries(annotations_by_group_id, annotations_by_group)
+        return annotations_by_group_id
+
     def serialize(
         self, obj: Group, attrs: MutableMapping[str, Any], user: Any, **kwargs: Any
     ) -> BaseGroupSerializerResponse:
@@ -464,10 +597,7 @@ class GroupSerializerBase(Serializer, ABC):
             return None
 
         # partition the item_list by type
-        error_issues = [group for group in item_list if GroupCategory.ERROR == group.issue_category]
-        generic_issues = [
-            group for group in item_list if group.issue_category != GroupCategory.ERROR
-        ]
+        error_issues, generic_issues = _partition_by_category(item_list)
 
         # bulk query for the seen_stats by type
         error_stats = (self._seen_stats_error(error_issues, user) if error_issues else {}) or {}
@@ -478,9 +608,34 @@ class GroupSerializerBase(Serializer, ABC):
         # combine results back
         return {group: agg_stats.get(group, {}) for group in item_list}
 
+    def _prepare_seen_stats_requests(
+        self, item_list: Sequence[Group]
+    ) -> Mapping[Any, SnubaRequest] | None:
+        """
+        Returns the prepared Snuba queries of `_get_seen_stats`, to be passed to
+        `_get_seen_stats_from_results` once executed, or `None` if the
+        serializer does not split its seen stats.
+        """
+        return None
+
+    def _get_seen_stats_from_results(
+        self, item_list: Sequence[Group], results: Mapping[Any, Mapping[str, Any]]
+    ) -> Mapping[Group, SeenStats] | None:
+        raise NotImplementedError
+
     def _get_group_snuba_stats(
         self, item_list: Sequence[Group], seen_stats: Mapping[Group, SeenStats] | None
     ):
+        requests = self._prepare_group_snuba_stats(item_list, seen_stats)
+        return self._get_group_snuba_stats_from_results(_execute_snuba_requests(requests))
+
+    def _prepare_group_snuba_stats(
+        self, item_list: Sequence[Group], seen_stats: Mapping[Group, SeenStats] | None
+    ) -> Mapping[str, Any] | None:
+        """
+        Returns the handled flags that are cached, and the prepared Snuba query
+        for the rest, or `None` if the flag is collapsed.
+        """
         if (
             self._collapse("unhandled")
             and len(item_list) > 0
@@ -507,8 +662,9 @@ class GroupSerializerBase(Serializer, ABC):
             filter_keys.setdefault("project_id", []).append(item.project_id)
             filter_keys.setdefault("group_id", []).append(item.id)
 
+        requests = {"cached": unhandled}
         if filter_keys:
-            rv = raw_query(
+            requests["unhandled"] = prepare_raw_query(
                 dataset=Dataset.Events,
                 selected_columns=[
                     "group_id",
@@ -527,7 +683,16 @@ class GroupSerializerBase(Serializer, ABC):
                     {"organization_id": item_list[0].project.organization_id} if item_list else None
                 ),
             )
-            for x in rv["data"]:
+        return requests
+
+    @staticmethod
+    def _get_group_snuba_stats_from_results(results: Mapping[str, Any] | None):
+        if results is None:
+            return None
+
+        unhandled = dict(results["cached"])
+        if "unhandled" in results:
+            for x in results["unhandled"]["data"]:
                 unhandled[x["group_id"]] = x["unhandled"]
 
                 # cache the handled flag for 60 seconds.  This is broadly in line with
@@ -987,39 +1152,91 @@ class GroupSerializerSnuba(GroupSerializerBase):
     def _seen_stats_error(
         self, error_issue_list: Sequence[Group], user
     ) -> Mapping[Group, SeenStats]:
-        return self._parse_seen_stats_results(
-            self._execute_error_seen_stats_query(
-                item_list=error_issue_list,
-                start=self.start,
-                end=self.end,
-                conditions=self.conditions,
-                environment_ids=self.environment_ids,
-            ),
-            error_issue_list,
-            bool(self.start or self.end or self.conditions),
-            self.environment_ids,
+        return self._run_seen_stats_queries(
+            error_issue_list, self._get_error_seen_stats_query_params
         )
 
     def _seen_stats_generic(
         self, generic_issue_list: Sequence[Group], user
     ) -> Mapping[Group, SeenStats]:
-        return self._parse_seen_stats_results(
-            self._execute_generic_seen_stats_query(
-                item_list=generic_issue_list,
+        return self._run_seen_stats_queries(
+            generic_issue_list, self._get_generic_seen_stats_query_params
+        )
+
+    def _run_seen_stats_queries(
+        self, issue_list: Sequence[Group], get_query_params: Callable[..., dict[str, Any]]
+    ) -> Mapping[Group, SeenStats]:
+        queries = self._get_seen_stats_queries(issue_list, get_query_params)
+        return self._parse_seen_stats_queries(
+            issue_list, {name: aliased_query(**params) for name, params in queries.items()}
+        )
+
+    def _get_seen_stats_queries(
+        self, issue_list: Sequence[Group], get_query_params: Callable[..., dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Returns the arguments of the `aliased_query` calls of the seen stats of
+        `issue_list`, by name.
+        """
+        return {
+            "time_range": get_query_params(
+                item_list=issue_list,
                 start=self.start,
                 end=self.end,
                 conditions=self.conditions,
                 environment_ids=self.environment_ids,
-            ),
-            generic_issue_list,
+            )
+        }
+
+    def _parse_seen_stats_queries(
+        self, issue_list: Sequence[Group], results: Mapping[str, Mapping[str, Any]]
+    ) -> Mapping[Group, SeenStats]:
+        return self._parse_seen_stats_results(
+            results["time_range"],
+            issue_list,
             bool(self.start or self.end or self.conditions),
             self.environment_ids,
         )
 
+    def _prepare_seen_stats_requests(
+        self, item_list: Sequence[Group]
+    ) -> Mapping[Any, SnubaRequest] | None:
+        if self._collapse("stats") or not item_list:
+            return {}
+
+        error_issues, generic_issues = _partition_by_category(item_list)
+        requests = {}
+        for category, issue_list, get_query_params in (
+            ("error", error_issues, self._get_error_seen_stats_query_params),
+            ("generic", generic_issues, self._get_generic_seen_stats_query_params),
+        ):
+            if not issue_list:
+                continue
+            queries = self._get_seen_stats_queries(issue_list, get_query_params)
+            for name, params in queries.items():
+                requests[(category, name)] = prepare_raw_query(**aliased_query_params(**params))
+        return requests
+
+    def _get_seen_stats_from_results(
+        self, item_list: Sequence[Group], results: Mapping[Any, Mapping[str, Any]]
+    ) -> Mapping[Group, SeenStats] | None:
+        if self._collapse("stats") or not item_list:
+            return None
+
+        error_issues, generic_issues = _partition_by_category(item_list)
+        agg_stats: dict[Group, SeenStats] = {}
+        for category, issue_list in (("error", error_issues), ("generic", generic_issues)):
+            if issue_list:
+                category_results = {
+                    name: result for (c, name), result in results.items() if c == category
+                }
+                agg_stats.update(self._parse_seen_stats_queries(issue_list, category_results))
+        return {group: agg_stats.get(group, {}) for group in item_list}
+
     @staticmethod
-    def _execute_error_seen_stats_query(
+    def _get_error_seen_stats_query_params(
         item_list, start=None, end=None, conditions=None, environment_ids=None
-    ):
+    ) -> dict[str, Any]:
         project_ids = list({item.project_id for item in item_list})
         group_ids = [item.id for item in item_list]
         aggregations = [
@@ -1032,7 +1249,7 @@ class GroupSerializerSnuba(GroupSerializerBase):
         if environment_ids:
             filters["environment"] = environment_ids
 
-        return aliased_query(
+        return dict(
             dataset=Dataset.Events,
             start=start,
             end=end,
@@ -1080,9 +1297,9 @@ class GroupSerializerSnuba(GroupSerializerBase):
         )
 
     @staticmethod
-    def _execute_generic_seen_stats_query(
+    def _get_generic_seen_stats_query_params(
         item_list, start=None, end=None, conditions=None, environment_ids=None
-    ):
+    ) -> dict[str, Any]:
         project_ids = list({item.project_id for item in item_list})
         group_ids = [item.id for item in item_list]
         aggregations = [
@@ -1094,7 +1311,7 @@ class GroupSerializerSnuba(GroupSerializerBase):
         filters = {"project_id": project_ids, "group_id": group_ids}
         if environment_ids:
             filters["environment"] = environment_ids
-        return aliased_query(
+        return dict(
             dataset=Dataset.IssuePlatform,
             start=start,
             end=end,
@@ -519,60 +519,55 @@ class StreamGroupSerializerSnuba(GroupSerializerSnuba, GroupStatsMixin):
             )
         return results
 
-    def _seen_stats_error(
-        self, error_issue_list: Sequence[Group], user
-    ) -> Mapping[Group, SeenStats]:
-        return self.__seen_stats_impl(error_issue_list, self._execute_error_seen_stats_query)
-
-    def _seen_stats_generic(
-        self, generic_issue_list: Sequence[Group], user
-    ) -> Mapping[Group, SeenStats]:
-        return self.__seen_stats_impl(generic_issue_list, self._execute_generic_seen_stats_query)
-
-    def __seen_stats_impl(
-        self,
-        error_issue_list: Sequence[Group],
-        seen_stats_func: Callable[[Any, Any, Any, Any, Any], Mapping[str, Any]],
-    ) -> Mapping[Any, SeenStats]:
-        partial_execute_seen_stats_query = functools.partial(
-            seen_stats_func,
-            item_list=error_issue_list,
+    def _get_seen_stats_queries(
+        self, issue_list: Sequence[Group], get_query_params: Callable[..., dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        get_query_params = functools.partial(
+            get_query_params,
+            item_list=issue_list,
             environment_ids=self.environment_ids,
             start=self.start,
             end=self.end,
         )
+        queries = {"time_range": get_query_params()}
+        if self.conditions and not self._collapse("filtered"):
+            queries["filtered"] = get_query_params(conditions=self.conditions)
+        if (self.start or self.end) and not self._collapse("lifetime"):
+            queries["lifetime"] = get_query_params(start=None, end=None)
+        return queries
+
+    def _parse_seen_stats_queries(
+        self, issue_list: Sequence[Group], results: Mapping[str, Mapping[str, Any]]
+    ) -> Mapping[Group, SeenStats]:
         time_range_result = self._parse_seen_stats_results(
-            partial_execute_seen_stats_query(),
-            error_issue_list,
+            results["time_range"],
+            issue_list,
             self.start or self.end or self.conditions,
             self.environment_ids,
         )
         filtered_result = (
             self._parse_seen_stats_results(
-                partial_execute_seen_stats_query(conditions=self.conditions),
-                error_issue_list,
+                results["filtered"],
+                issue_list,
                 self.start or self.end or self.conditions,
                 self.environment_ids,
             )
-            if self.conditions and not self._collapse("filtered")
+            if "filtered" in results
             else None
         )
         lifetime_result = (
             (
                 self._parse_seen_stats_results(
-                    partial_execute_seen_stats_query(start=None, end=None),
-                    error_issue_list,
-                    False,
-                    self.environment_ids,
+                    results["lifetime"], issue_list, False, self.environment_ids
                 )
-                if self.start or self.end
+                if "lifetime" in results
                 else time_range_result
             )
             if not self._collapse("lifetime")
             else None
         )
 
-        for item in error_issue_list:
+        for item in issue_list:
             time_range_result[item].update(
                 {
                     "filtered": filtered_result.get(item) if filtered_result else None,
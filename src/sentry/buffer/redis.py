@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import logging
 import pickle
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from enum import Enum
@@ -13,6 +15,7 @@ import rb
 from django.utils.encoding import force_bytes, force_str
 from rediscluster import RedisCluster
 
+from sentry import options
 from sentry.buffer.base import Buffer
 from sentry.db import models
 from sentry.tasks.process_buffer import process_incr
@@ -24,6 +27,7 @@ from sentry.utils.redis import (
     get_dynamic_cluster_from_options,
     is_instance_rb_cluster,
     is_instance_redis_cluster,
+    load_redis_script,
     validate_dynamic_cluster,
 )
 
@@ -36,6 +40,8 @@ _last_validation_log: float | None = None
 Pipeline = Any
 # TODO type Pipeline instead of using Any here
 
+incr_script = load_redis_script("buffer/incr.lua")
+
 
 def _get_model_key(model: type[models.Model]) -> str:
     return str(model._meta)
@@ -221,9 +227,37 @@ class PendingBuffer:
         return rv
 
 
+@dataclass
+class CoalescedIncr:
+    """
+    Increments of the same model and filters that have not been sent to Redis yet.
+    """
+
+    model: type[models.Model]
+    filters: dict[str, models.Model | str | int]
+    columns: dict[str, int]
+    extra: dict[str, Any]
+    signal_only: bool | None
+
+    def add(
+        self, columns: dict[str, int], extra: dict[str, Any] | None, signal_only: bool | None
+    ) -> None:
+        # Same semantics as subsequent increments of the buffered hash: counters
+        # are summed up, the last write of an extra value wins and the signal
+        # flag sticks once it was set.
+        for column, amount in columns.items():
+            self.columns[column] = self.columns.get(column, 0) + amount
+        if extra:
+            self.extra.update(extra)
+        if signal_only is True:
+            self.signal_only = True
+
+
 class RedisBuffer(Buffer):
     key_expire = 60 * 60  # 1 hour
     pending_key = "b:p"
+    # Coalesced increments are sent early once there are this many of them.
+    coalesce_max_keys = 1000
 
     def __init__(self, incr_batch_size: int = 2, **options: object):
         self.is_redis_cluster, self.cluster, options = get_dynamic_cluster_from_options(
@@ -232,6 +266,11 @@ class RedisBuffer(Buffer):
         self.incr_batch_size = incr_batch_size
         assert self.incr_batch_size > 0
 
+        self._coalesced: dict[str, CoalescedIncr] = {}
+        self._coalesce_lock = threading.Lock()
+        self._coalesce_timer: threading.Timer | None = None
+        atexit.register(self.flush_coalesced)
+
     def validate(self) -> None:
         validate_dynamic_cluster(self.is_redis_cluster, self.cluster)
 
@@ -467,32 +506,67 @@ class RedisBuffer(Buffer):
             - Perform a set (last write wins) on extra
             - Perform a set on signal_only (only if True)
         - Add hashmap key to pending flushes
+
+        If `buffer.redis.coalesce-window` is set, increments of the same model and
+        filters are summed up in-process and only sent once the window has passed.
         """
         key = self._make_key(model, filters)
-        # We can't use conn.map() due to wanting to support multiple pending
-        # keys (one per Redis partition)
-        pipe = self.get_redis_connection(key)
-        pipe.hsetnx(key, "m", f"{model.__module__}.{model.__name__}")
         _validate_json_roundtrip(filters, model)
+        if extra:
+            # Group tries to serialize 'score', so we'd need some kind of processing
+            # hook here
+            # e.g. "update score if last_seen or times_seen is changed"
+            _validate_json_roundtrip(extra, model)
+
+        window = options.get("buffer.redis.coalesce-window")
+        if window > 0:
+            self._coalesce(key, model, columns, filters, extra, signal_only, window)
+        else:
+            self._send_incr(key, model, columns, filters, extra, signal_only)
+
+        metrics.incr(
+            "buffer.incr",
+            skip_internal=True,
+            tags={"module": model.__module__, "model": model.__name__},
+        )
 
+    def _encode_filters(self, filters: dict[str, models.Model | str | int]) -> str | bytes:
         if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
-            pipe.hsetnx(key, "f", json.dumps(self._dump_values(filters)))
+            return json.dumps(self._dump_values(filters))
         else:
-            pipe.hsetnx(key, "f", pickle.dumps(filters))
+            return pickle.dumps(filters)
+
+    def _encode_extra(self, value: Any) -> str | bytes:
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            return json.dumps(self._dump_value(value))
+        else:
+            return pickle.dumps(value)
+
+    def _send_incr(
+        self,
+        key: str,
+        model: type[models.Model],
+        columns: dict[str, int],
+        filters: dict[str, models.Model | str | int],
+        extra: dict[str, Any] | None,
+        signal_only: bool | None,
+    ) -> None:
+        if options.get("buffer.redis.lua-incr"):
+            self._send_incr_script(key, model, columns, filters, extra, signal_only)
+            return
+
+        # We can't use conn.map() due to wanting to support multiple pending
+        # keys (one per Redis partition)
+        pipe = self.get_redis_connection(key)
+        pipe.hsetnx(key, "m", f"{model.__module__}.{model.__name__}")
+        pipe.hsetnx(key, "f", self._encode_filters(filters))
 
         for column, amount in columns.items():
             pipe.hincrby(key, "i+" + column, amount)
 
         if extra:
-            # Group tries to serialize 'score', so we'd need some kind of processing
-            # hook here
-            # e.g. "update score if last_seen or times_seen is changed"
-            _validate_json_roundtrip(extra, model)
             for column, value in extra.items():
-                if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
-                    pipe.hset(key, "e+" + column, json.dumps(self._dump_value(value)))
-                else:
-                    pipe.hset(key, "e+" + column, pickle.dumps(value))
+                pipe.hset(key, "e+" + column, self._encode_extra(value))
 
         if signal_only is True:
             pipe.hset(key, "s", "1")
@@ -501,11 +575,100 @@ class RedisBuffer(Buffer):
         pipe.zadd(self.pending_key, {key: time()})
         pipe.execute()
 
-        metrics.incr(
-            "buffer.incr",
-            skip_internal=True,
-            tags={"module": model.__module__, "model": model.__name__},
-        )
+    def _send_incr_script(
+        self,
+        key: str,
+        model: type[models.Model],
+        columns: dict[str, int],
+        filters: dict[str, models.Model | str | int],
+        extra: dict[str, Any] | None,
+        signal_only: bool | None,
+    ) -> None:
+        """
+        Sends an increment with a single call of `incr.lua`, which writes the
+        same values as the pipeline in `_send_incr`.
+        """
+        score = time()
+        args: list[Any] = [
+            f"{model.__module__}.{model.__name__}",
+            self._encode_filters(filters),
+            self.key_expire,
+            score,
+            "1" if signal_only is True else "0",
+            len(columns),
+        ]
+        for column, amount in columns.items():
+            args.extend(("i+" + column, amount))
+        for column, value in (extra or {}).items():
+            args.extend(("e+" + column, self._encode_extra(value)))
+
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            # The pending set lives in a different slot than the hash, so it
+            # can't be touched by the same script.
+            incr_script([key], args, client=self.cluster)
+            self.cluster.zadd(self.pending_key, {key: score})
+        elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+            # Every host has its own pending set, so both keys are local.
+            client = self.cluster.get_local_client_for_key(key)
+            incr_script([key, self.pending_key], args, client=client)
+        else:
+            raise AssertionError("unreachable")
+
+    def _coalesce(
+        self,
+        key: str,
+        model: type[models.Model],
+        columns: dict[str, int],
+        filters: dict[str, models.Model | str | int],
+        extra: dict[str, Any] | None,
+        signal_only: bool | None,
+        window: float,
+    ) -> None:
+        with self._coalesce_lock:
+            coalesced = self._coalesced.get(key)
+            if coalesced is None:
+                self._coalesced[key] = CoalescedIncr(
+                    model=model,
+                    filters=filters,
+                    columns=dict(columns),
+                    extra=dict(extra or {}),
+                    signal_only=signal_only,
+                )
+            else:
+                coalesced.add(columns, extra, signal_only)
+                metrics.incr("buffer.incr.coalesced", skip_internal=True)
+
+            flush_now = len(self._coalesced) >= self.coalesce_max_keys
+            if not flush_now and self._coalesce_timer is None:
+                self._coalesce_timer = threading.Timer(window, self.flush_coalesced)
+                self._coalesce_timer.daemon = True
+                self._coalesce_timer.start()
+
+        if flush_now:
+            self.flush_coalesced()
+
+    def flush_coalesced(self) -> None:
+        """
+        Sends all coalesced increments to Redis.
+        """
+        with self._coalesce_lock:
+            coalesced, self._coalesced = self._coalesced, {}
+            timer, self._coalesce_timer = self._coalesce_timer, None
+
+        if timer is not None:
+            timer.cancel()
+
+        if not coalesced:
+            return
+
+        metrics.distribution("buffer.incr.coalesced-flush", len(coalesced))
+        for key, incr in coalesced.items():
+            try:
+                self._send_incr(
+                    key, incr.model, incr.columns, incr.filters, incr.extra, incr.signal_only
+                )
+            except Exception:
+                logger.exception("buffer.incr.coalesced-flush-failed", extra={"redis_key": key})
 
     def process_pending(self) -> None:
         client = get_cluster_routing_client(self.cluster, self.is_redis_cluster)
@@ -612,6 +775,10 @@ class RedisBuffer(Buffer):
             batch_keys = [key]
 
         if batch_keys is not None:
+            if len(batch_keys) > 1 and options.get("buffer.redis.batch-process"):
+                self._process_batch_incr(batch_keys)
+                return
+
             for key in batch_keys:
                 self._process_single_incr(key)
 
@@ -639,40 +806,102 @@ class RedisBuffer(Buffer):
             pipe.zrem(self.pending_key, key)
             pipe.delete(key)
             values = pipe.execute()[0]
+            self._process_values(key, values)
+        finally:
+            client.delete(lock_key)
 
-            # XXX(python3): In python2 this isn't as important since redis will
-            # return string tyes (be it, byte strings), but in py3 we get bytes
-            # back, and really we just want to deal with keys as strings.
-            values = {force_str(k): v for k, v in values.items()}
-
-            if not values:
-                metrics.incr("buffer.revoked", tags={"reason": "empty"}, skip_internal=False)
-                logger.debug("buffer.revoked.empty", extra={"redis_key": key})
-                return
+    def _process_batch_incr(self, keys: Sequence[str]) -> None:
+        """
+        Processes a batch of buffered keys like `_process_single_incr`, but
+        locks, reads and deletes all of them with one pipeline each.
+        """
+        lock_keys = [self._make_lock_key(key) for key in keys]
+        locked = self._pipeline_map(
+            [(lock_key, "set", (lock_key, "1"), {"nx": True, "ex": 10}) for lock_key in lock_keys]
+        )
+        acquired = [(key, lock_key) for key, lock_key, ok in zip(keys, lock_keys, locked) if ok]
+        for key in (key for key, ok in zip(keys, locked) if not ok):
+            metrics.incr("buffer.revoked", tags={"reason": "locked"}, skip_internal=False)
+            logger.debug("buffer.revoked.locked", extra={"redis_key": key})
 
-            model = import_string(force_str(values.pop("m")))
+        if not acquired:
+            return
 
-            if values["f"].startswith(b"{" if not self.is_redis_cluster else "{"):
-                filters = self._load_values(json.loads(force_str(values.pop("f"))))
-            else:
-                # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
-                filters = pickle.loads(force_bytes(values.pop("f")))
-
-            incr_values = {}
-            extra_values = {}
-            signal_only = None
-            for k, v in values.items():
-                if k.startswith("i+"):
-                    incr_values[k[2:]] = int(v)
-                elif k.startswith("e+"):
-                    if v.startswith(b"[" if not self.is_redis_cluster else "["):
-                        extra_values[k[2:]] = self._load_value(json.loads(force_str(v)))
-                    else:
-                        # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
-                        extra_values[k[2:]] = pickle.loads(force_bytes(v))
-                elif k == "s":
-                    signal_only = bool(int(v))  # Should be 1 if set
-
-            self._process(model, incr_values, filters, extra_values, signal_only)
+        try:
+            commands = []
+            for key, _ in acquired:
+                commands.append((key, "hgetall", (key,), {}))
+                # Stored on the host of the key, see `incr`.
+                commands.append((key, "zrem", (self.pending_key, key), {}))
+                commands.append((key, "delete", (key,), {}))
+            results = self._pipeline_map(commands)[::3]
+            metrics.distribution("buffer.process-batch-size", len(acquired))
+
+            for (key, _), values in zip(acquired, results):
+                try:
+                    self._process_values(key, values)
+                except Exception:
+                    # The values are gone from Redis already, the same as for a
+                    # failed `_process_single_incr`.
+                    logger.exception("buffer.process-failed", extra={"redis_key": key})
         finally:
-            client.delete(lock_key)
+            self._pipeline_map([(lock_key, "delete", (lock_key,), {}) for _, lock_key in acquired])
+
+    def _pipeline_map(
+        self, commands: Sequence[tuple[str, str, tuple[Any, ...], dict[str, Any]]]
+    ) -> list[Any]:
+        """
+        Runs `(routing key, command, args, kwargs)` commands in a single
+        non-transactional pipeline per node and returns their results in order.
+        Each command runs on the node of its routing key.
+        """
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            pipe = self.cluster.pipeline(transaction=False)
+            for _, command, args, kwargs in commands:
+                getattr(pipe, command)(*args, **kwargs)
+            return pipe.execute()
+        elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+            with self.cluster.fanout() as client:
+                promises = [
+                    getattr(client.target_key(routing_key), command)(*args, **kwargs)
+                    for routing_key, command, args, kwargs in commands
+                ]
+            return [promise.value for promise in promises]
+        else:
+            raise AssertionError("unreachable")
+
+    def _process_values(self, key: str, values: dict[Any, Any]) -> None:
+        # XXX(python3): In python2 this isn't as important since redis will
+        # return string tyes (be it, byte strings), but in py3 we get bytes
+        # back, and really we just want to deal with keys as strings.
+        values = {force_str(k): v for k, v in values.items()}
+
+        if not values:
+            metrics.incr("buffer.revoked", tags={"reason": "empty"}, skip_internal=False)
+            logger.debug("buffer.revoked.empty", extra={"redis_key": key})
+            return
+
+        model = import_string(force_str(values.pop("m")))
+
+        if values["f"].startswith(b"{" if not self.is_redis_cluster else "{"):
+            filters = self._load_values(json.loads(force_str(values.pop("f"))))
+        else:
+            # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
+            filters = pickle.loads(force_bytes(values.pop("f")))
+
+        incr_values = {}
+        extra_values = {}
+        signal_only = None
+        for k, v in values.items():
+            if k.startswith("i+"):
+                incr_values[k[2:]] = int(v)
+            elif k.startswith("e+"):
+                if v.startswith(b"[" if not self.is_redis_cluster else "["):
+                    extra_values[k[2:]] = self._load_value(json.loads(force_str(v)))
+                else:
+                    # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
+                    extra_values[k[2:]] = pickle.loads(force_bytes(v))
+            elif k == "s":
+                signal_only = bool(int(v))  # Should be 1 if set
+
+        self._process(model, incr_values, filters, extra_values, signal_only)
@@ -159,6 +159,14 @@ def ingest_events_options() -> list[click.Option]:
             help="Unix timestamp after which to stop processing messages",
         )
     )
+    options.append(
+        click.Option(
+            ["--mode", "mode"],
+            type=click.Choice(["single", "batched"]),
+            default="single",
+            help="The mode to process events in. Batched processes batches of --max-batch-size events in the consumer process, with batched cache, processing store and task broker round trips. Attachments are always processed one by one.",
+        )
+    )
     return options
 
 
@@ -208,8 +216,8 @@ _POST_PROCESS_FORWARDER_OPTIONS = multiprocessing_options(
     click.Option(
         ["--mode"],
         default="multithreaded",
-        type=click.Choice(["multithreaded", "multiprocess"]),
-        help="Mode to run post process forwarder in.",
+        type=click.Choice(["multithreaded", "multiprocess", "batched"]),
+        help="Mode to run post process forwarder in. Batched dispatches batches of --max-batch-size messages, grouped by project, with up to --concurrency threads, and warms the caches of post processing for every batch.",
     ),
 ]
 
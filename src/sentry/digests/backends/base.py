@@ -66,7 +66,16 @@ class Backend(Service):
     be transitioned to "waiting" instead.)
     """
 
-    __all__ = ("add", "delete", "digest", "enabled", "maintenance", "schedule", "validate")
+    __all__ = (
+        "add",
+        "delete",
+        "digest",
+        "digest_many",
+        "enabled",
+        "maintenance",
+        "schedule",
+        "validate",
+    )
 
     def __init__(self, **options: Any) -> None:
         # The ``minimum_delay`` option defines the default minimum amount of
@@ -176,6 +185,34 @@ class Backend(Service):
         """
         raise NotImplementedError
 
+    def digest_many(self, minimum_delays: Mapping[str, int | None]) -> Any:
+        """
+        Extract records from many timelines for processing.
+
+        This method acts as a context manager like ``digest``, for all
+        timelines that are keys of ``minimum_delays``. The target of the
+        ``as`` clause is a dictionary of records by timeline key, which only
+        contains the timelines that could be digested -- timelines that are
+        locked by another digest, or that are not in the "ready" state, are
+        skipped.
+
+        If the context manager successfully exits, the digests of all
+        timelines that are still in the dictionary are closed, as if each of
+        them had been digested with ``digest``. Timelines removed from the
+        dictionary by the caller remain in the "ready" state with all of their
+        records, as do all timelines if an exception is raised.
+
+        For example::
+
+            with timelines.digest_many({'project:1': None}) as digests:
+                messages = [build_digest_email(records) for records in digests.values()]
+
+            for message in messages:
+                message.send_async()
+
+        """
+        raise NotImplementedError
+
     def schedule(self, deadline: float, timestamp: float | None = None) -> Iterable[ScheduleEntry]:
         """
         Identify timelines that are ready for processing.
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import time
-from collections.abc import Generator, Iterable
+from collections import defaultdict
+from collections.abc import Generator, Iterable, Mapping, Sequence
 from contextlib import contextmanager
 from typing import Any
 
@@ -11,6 +12,7 @@ from redis.exceptions import ResponseError
 
 from sentry.digests.backends.base import Backend, InvalidState, ScheduleEntry
 from sentry.digests.types import Record
+from sentry.utils import metrics
 from sentry.utils.locking.backends.redis import RedisLockBackend
 from sentry.utils.locking.lock import Lock
 from sentry.utils.locking.manager import LockManager
@@ -70,6 +72,10 @@ class RedisBackend(Backend):
         1) "mail:p:1"
         2) "1444847638"
 
+    Timelines that are ready can be digested in batches with ``digest_many``,
+    which opens (and later closes) all timelines of a partition with a single
+    script call, rather than acquiring a lock and calling the script for every
+    timeline separately.
     """
 
     def __init__(self, **options: Any) -> None:
@@ -152,27 +158,64 @@ class RedisBackend(Backend):
             self.cluster.get_local_client(host),
         )
 
+    def __record_partition_backlog(self, host: int, timestamp: float) -> None:
+        with self.cluster.get_local_client(host).pipeline(transaction=False) as pipeline:
+            pipeline.zcard(f"{self.namespace}:s:r")
+            pipeline.zcard(f"{self.namespace}:s:w")
+            pipeline.zrange(f"{self.namespace}:s:r", 0, 0, withscores=True)
+            ready, waiting, oldest = pipeline.execute()
+
+        tags = {"partition": str(host)}
+        metrics.gauge("digests.schedule.backlog", ready, tags={**tags, "state": "ready"})
+        metrics.gauge("digests.schedule.backlog", waiting, tags={**tags, "state": "waiting"})
+        # Timelines that are ready for longer than the maintenance deadline
+        # are stuck, and will be moved back to the waiting state.
+        metrics.gauge(
+            "digests.schedule.oldest_ready",
+            timestamp - oldest[0][1] if oldest else 0,
+            tags=tags,
+            unit="second",
+        )
+
     def schedule(self, deadline: float, timestamp: float | None = None) -> Iterable[ScheduleEntry]:
         if timestamp is None:
             timestamp = time.time()
 
         for host in self.cluster.hosts:
             try:
-                for key, timestamp in self.__schedule_partition(host, deadline, timestamp):
-                    yield ScheduleEntry(key.decode("utf-8"), float(timestamp))
+                entries = self.__schedule_partition(host, deadline, timestamp)
             except Exception as error:
                 logger.exception(
                     "Failed to perform scheduling for partition %s due to error: %s",
                     host,
                     error,
                 )
+                continue
+
+            for key, scheduled in entries:
+                # How long the timeline has been due when it is scheduled.
+                metrics.distribution(
+                    "digests.schedule.lateness",
+                    timestamp - float(scheduled),
+                    tags={"partition": str(host)},
+                    unit="second",
+                )
+                yield ScheduleEntry(key.decode("utf-8"), float(scheduled))
+
+            try:
+                self.__record_partition_backlog(host, timestamp)
+            except Exception:
+                logger.exception("Failed to record backlog of digest partition %s", host)
 
     def __maintenance_partition(self, host: int, deadline: float, timestamp: float) -> None:
-        script(
+        requeued = script(
             ["-"],
             ["MAINTENANCE", self.namespace, self.ttl, timestamp, deadline],
             self.cluster.get_local_client(host),
         )
+        metrics.incr(
+            "digests.maintenance.requeued", amount=requeued or 0, tags={"partition": str(host)}
+        )
 
     def maintenance(self, deadline: float, timestamp: float | None = None) -> None:
         if timestamp is None:
@@ -188,6 +231,34 @@ class RedisBackend(Backend):
                     error,
                 )
 
+    def __decode_records(
+        self, response: Iterable[tuple[bytes, bytes | None, bytes]]
+    ) -> list[Record]:
+        return [
+            Record(
+                key.decode(),
+                self.codec.decode(value) if value is not None else None,
+                float(timestamp),
+            )
+            for key, value, timestamp in response
+        ]
+
+    def __filter_records(self, key: str, records: Sequence[Record]) -> list[Record]:
+        # If the record value is `None`, this means the record data was
+        # missing (it was presumably evicted by Redis) so we don't need to
+        # return it here.
+        filtered_records = [record for record in records if record.value is not None]
+        if len(records) != len(filtered_records):
+            logger.warning(
+                "Filtered out missing records when fetching digest",
+                extra={
+                    "key": key,
+                    "record_count": len(records),
+                    "filtered_record_count": len(filtered_records),
+                },
+            )
+        return filtered_records
+
     @contextmanager
     def digest(
         self, key: str, minimum_delay: int | None = None, timestamp: float | None = None
@@ -219,29 +290,8 @@ class RedisBackend(Backend):
                 else:
                     raise
 
-            records = [
-                Record(
-                    key.decode(),
-                    self.codec.decode(value) if value is not None else None,
-                    float(timestamp),
-                )
-                for key, value, timestamp in response
-            ]
-
-            # If the record value is `None`, this means the record data was
-            # missing (it was presumably evicted by Redis) so we don't need to
-            # return it here.
-            filtered_records = [record for record in records if record.value is not None]
-            if len(records) != len(filtered_records):
-                logger.warning(
-                    "Filtered out missing records when fetching digest",
-                    extra={
-                        "key": key,
-                        "record_count": len(records),
-                        "filtered_record_count": len(filtered_records),
-                    },
-                )
-            yield filtered_records
+            records = self.__decode_records(response)
+            yield self.__filter_records(key, records)
 
             script(
                 [key],
@@ -257,3 +307,103 @@ class RedisBackend(Backend):
         connection = self._get_connection(key)
         with self._get_timeline_lock(key, duration=30).acquire():
             script([key], ["DELETE", self.namespace, self.ttl, timestamp, key], connection)
+
+    def __open_digests_partition(
+        self, host: int, keys: Sequence[str], timestamp: float
+    ) -> dict[str, list[Record]]:
+        lock_backend = self.locks.backend
+        response = script(
+            ["-"],
+            [
+                "DIGEST_OPEN_MANY",
+                self.namespace,
+                self.ttl,
+                timestamp,
+                self.capacity if self.capacity else -1,
+                lock_backend.prefix,
+                lock_backend.uuid,
+                30,
+                *keys,
+            ],
+            self.cluster.get_local_client(host),
+        )
+
+        opened = {}
+        for key, state, records in response:
+            state = state.decode()
+            metrics.incr("digests.digest_many.open", tags={"state": state})
+            if state == "ready":
+                opened[key.decode()] = self.__decode_records(records)
+        return opened
+
+    def __close_digests_partition(
+        self,
+        host: int,
+        opened: Mapping[str, Sequence[Record]],
+        close: Iterable[str],
+        minimum_delays: Mapping[str, int | None],
+        timestamp: float,
+    ) -> None:
+        lock_backend = self.locks.backend
+        arguments: list[Any] = [
+            "DIGEST_CLOSE_MANY",
+            self.namespace,
+            self.ttl,
+            timestamp,
+            lock_backend.prefix,
+            lock_backend.uuid,
+        ]
+        for key, records in opened.items():
+            minimum_delay = minimum_delays[key]
+            arguments.extend(
+                [
+                    key,
+                    1 if key in close else 0,
+                    minimum_delay if minimum_delay is not None else self.minimum_delay,
+                    len(records),
+                    *(record.key for record in records),
+                ]
+            )
+        script(["-"], arguments, self.cluster.get_local_client(host))
+
+    @contextmanager
+    def digest_many(
+        self, minimum_delays: Mapping[str, int | None], timestamp: float | None = None
+    ) -> Generator[dict[str, list[Record]]]:
+        if timestamp is None:
+            timestamp = time.time()
+
+        router = self.cluster.get_router()
+        keys_by_host: dict[int, list[str]] = defaultdict(list)
+        for key in minimum_delays:
+            keys_by_host[router.get_host_for_key(f"{self.namespace}:t:{key}")].append(key)
+
+        opened: dict[int, dict[str, list[Record]]] = {}
+        for host, keys in keys_by_host.items():
+            try:
+                opened[host] = self.__open_digests_partition(host, keys, timestamp)
+            except Exception as error:
+                logger.exception(
+                    "Failed to open digests for partition %s due to error: %s", host, error
+                )
+
+        digests = {
+            key: self.__filter_records(key, records)
+            for partition in opened.values()
+            for key, records in partition.items()
+        }
+
+        # Digests are only closed if the block exits successfully, and only
+        # for the keys that the block did not remove. Every other timeline is
+        # just unlocked, and stays in the ready state.
+        succeeded = False
+        try:
+            yield digests
+            succeeded = True
+        finally:
+            close = digests.keys() if succeeded else ()
+            for host, partition in opened.items():
+                if partition:
+                    self.__close_digests_partition(
+                        host, partition, close, minimum_delays, timestamp
+                    )
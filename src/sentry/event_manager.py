@@ -43,7 +43,7 @@ from sentry.constants import (
 from sentry.culprit import generate_culprit
 from sentry.dynamic_sampling import LatestReleaseBias, LatestReleaseParams
 from sentry.eventstore.processing import event_processing_store
-from sentry.eventstream.base import GroupState
+from sentry.eventstream.base import EventStreamInsert, GroupState
 from sentry.eventtypes import EventType
 from sentry.eventtypes.transaction import TransactionEvent
 from sentry.exceptions import HashDiscarded
@@ -1121,6 +1121,7 @@ def _nodestore_save_many(jobs: Sequence[Job], app_feature: str) -> None:
 
 
 def _eventstream_insert_many(jobs: Sequence[Job]) -> None:
+    inserts: list[EventStreamInsert] = []
     for job in jobs:
 
         if job["event"].project_id == settings.SENTRY_PROJECT:
@@ -1160,22 +1161,30 @@ def _eventstream_insert_many(jobs: Sequence[Job]) -> None:
             None if job["data"].get("type") == "transaction" else job["event"].get_primary_hash()
         )
 
-        eventstream.backend.insert(
-            event=job["event"],
-            is_new=is_new,
-            is_regression=is_regression,
-            is_new_group_environment=is_new_group_environment,
-            primary_hash=primary_hash,
-            received_timestamp=job["received_timestamp"],
-            # We are choosing to skip consuming the event back
-            # in the eventstream if it's flagged as raw.
-            # This means that we want to publish the event
-            # through the event stream, but we don't care
-            # about post processing and handling the commit.
-            skip_consume=job.get("raw", False),
-            group_states=group_states,
+        inserts.append(
+            EventStreamInsert(
+                event=job["event"],
+                is_new=is_new,
+                is_regression=is_regression,
+                is_new_group_environment=is_new_group_environment,
+                primary_hash=primary_hash,
+                received_timestamp=job["received_timestamp"],
+                # We are choosing to skip consuming the event back
+                # in the eventstream if it's flagged as raw.
+                # This means that we want to publish the event
+                # through the event stream, but we don't care
+                # about post processing and handling the commit.
+                skip_consume=job.get("raw", False),
+                group_states=group_states,
+            )
         )
 
+    if options.get("eventstream:insert-many"):
+        eventstream.backend.insert_many(inserts)
+    else:
+        for insert in inserts:
+            eventstream.backend.insert(**insert)
+
 
 def _track_outcome_accepted_many(jobs: Sequence[Job]) -> None:
     for job in jobs:
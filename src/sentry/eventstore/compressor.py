@@ -3,17 +3,23 @@ Eventstore compressor is responsible for pulling out repeating data across
 events such that they can be stored only once. For example SDK modules list, or
 debug_meta.
 
-This is not used in production yet, we are still collecting metrics there.
+Nodestore uses this when `nodestore.deduplicate-interfaces.rate` is set, see
+`NodeStorage._deduplicate`. Neither `deduplicate` nor `assemble` mutate the
+nested interface data of the payload that is passed in.
 """
+
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Callable, Mapping
 from typing import Any
 
 import orjson
 
 _INTERFACES = {}
 
+PATCHSETS_KEY = "__nodestore_patchsets"
+
 
 def _deduplicate_interface(*keys):
     def inner(f):
@@ -34,10 +40,16 @@ class DebugMeta:
         dedup: dict[str, list[str | Any]] = {}
 
         if data:
+            data = dict(data)
+            images = []
             for image in data.get("images") or []:
-                image = image or {}
+                image = dict(image or {})
                 for name in DebugMeta._DEDUP_FIELDS:
                     dedup.setdefault(name, []).append(image.pop(name, None))
+                images.append(image)
+
+            if data.get("images"):
+                data["images"] = images
 
         return dedup, data
 
@@ -45,7 +57,7 @@ class DebugMeta:
     def decode(dedup, data):
         if data:
             for i, image in enumerate(data.get("images") or []):
-                for name, arr in dedup.items():
+                for name, arr in (dedup or {}).items():
                     value = arr[i]
                     if value is not None:
                         image[name] = value
@@ -53,7 +65,52 @@ class DebugMeta:
         return data
 
 
+@_deduplicate_interface("modules", "sdk")
+class Verbatim:
+    """
+    Interfaces that are identical for every event sent by the same build of
+    an application, and are therefore moved out of the event in full.
+    """
+
+    @staticmethod
+    def encode(data):
+        return data, None
+
+    @staticmethod
+    def decode(dedup, data):
+        return dedup
+
+
+@_deduplicate_interface("contexts")
+class Contexts:
+    # Only contexts that do not change between events of the same
+    # installation are moved out. Device contexts for example carry free
+    # memory and battery level.
+    _DEDUP_CONTEXTS = ("os", "runtime", "browser")
+
+    @staticmethod
+    def encode(data):
+        dedup: dict[str, Any] = {}
+
+        if data:
+            data = dict(data)
+            for name in Contexts._DEDUP_CONTEXTS:
+                if name in data:
+                    dedup[name] = data.pop(name)
+
+        return dedup, data
+
+    @staticmethod
+    def decode(dedup, data):
+        if dedup:
+            data = dict(data or {})
+            data.update(dedup)
+
+        return data
+
+
 def deduplicate(data):
+    data = dict(data)
     patchsets = []
     extra_keys = {}
 
@@ -68,24 +125,30 @@ def deduplicate(data):
         patchsets.append([key, checksum, to_inline])
 
     if patchsets:
-        data["__nodestore_patchsets"] = patchsets
+        data[PATCHSETS_KEY] = patchsets
 
     return data, extra_keys
 
 
-def assemble(data, get_extra_keys):
-    if not data.get("__nodestore_patchsets"):
-        return data
+def get_checksums(data: Mapping[str, Any]) -> list[str]:
+    """
+    Returns the checksums of all deduplicated interfaces a payload produced by
+    `deduplicate` refers to.
+    """
+    return [checksum for _, checksum, _ in data.get(PATCHSETS_KEY) or ()]
+
 
-    checksums = []
-    for key, checksum, inlined in data["__nodestore_patchsets"]:
-        checksums.append(checksum)
+def assemble(data, get_extra_keys: Callable[[list[str]], Mapping[str, Any]]):
+    if not data.get(PATCHSETS_KEY):
+        return data
 
-    deduplicated_interfaces = get_extra_keys(checksums)
+    deduplicated_interfaces = get_extra_keys(get_checksums(data))
 
-    for key, checksum, inlined in data["__nodestore_patchsets"]:
-        deduplicated = deduplicated_interfaces[checksum]
+    for key, checksum, inlined in data[PATCHSETS_KEY]:
+        # A missing blob (e.g. expired before the event that references it)
+        # degrades to the inlined part of the interface.
+        deduplicated = deduplicated_interfaces.get(checksum)
         data[key] = _INTERFACES[key].decode(deduplicated, inlined)
 
-    del data["__nodestore_patchsets"]
+    del data[PATCHSETS_KEY]
     return data
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 from datetime import timedelta
 from typing import Any
 
@@ -8,6 +8,8 @@ from sentry.utils.cache import cache_key_for_event
 from sentry.utils.kvstore.abstract import KVStorage
 from sentry.utils.services import Service
 
+from .codec import RawEventPayload
+
 DEFAULT_TIMEOUT = 60 * 60 * 24
 
 
@@ -25,6 +27,11 @@ class EventProcessingStore(Service):
 
     Separating processing store from the cache allows use of different
     implementations.
+
+    Events can be stored with their raw payload, the JSON they were parsed
+    from, if they were not changed since. The payload is then stored as is
+    rather than serializing the event again, which requires the inner storage
+    to encode values with ``EventPayloadCodec``.
     """
 
     def __init__(self, inner: KVStorage[str, Event]):
@@ -38,13 +45,33 @@ class EventProcessingStore(Service):
         key = cache_key_for_event(event)
         return self.get(key) is not None
 
-    def store(self, event: Event, unprocessed: bool = False) -> str:
+    def store(
+        self, event: Event, unprocessed: bool = False, raw_payload: bytes | str | None = None
+    ) -> str:
         key = cache_key_for_event(event)
         if unprocessed:
             key = self.__get_unprocessed_key(key)
-        self.inner.set(key, event, self.timeout)
+        value = RawEventPayload(raw_payload) if raw_payload is not None else event
+        self.inner.set(key, value, self.timeout)
         return key
 
+    def store_many(
+        self, events: Sequence[Event], raw_payloads: Sequence[bytes | str | None] | None = None
+    ) -> list[str]:
+        """
+        Stores many events with a single batched write, returning their keys
+        in the same order.
+        """
+        if raw_payloads is None:
+            raw_payloads = [None] * len(events)
+        keys = [cache_key_for_event(event) for event in events]
+        values = [
+            RawEventPayload(raw_payload) if raw_payload is not None else event
+            for event, raw_payload in zip(events, raw_payloads)
+        ]
+        self.inner.set_many(list(zip(keys, values)), self.timeout)
+        return keys
+
     def get(self, key: str, unprocessed: bool = False) -> MutableMapping[str, Any] | None:
         if unprocessed:
             key = self.__get_unprocessed_key(key)
@@ -1,8 +1,8 @@
-from sentry.utils.codecs import BytesCodec, JSONCodec
 from sentry.utils.kvstore.bigtable import BigtableKVStorage
 from sentry.utils.kvstore.encoding import KVStorageCodecWrapper
 
 from .base import EventProcessingStore
+from .codec import EventPayloadCodec
 
 
 class BigtableEventProcessingStore(EventProcessingStore):
@@ -10,13 +10,20 @@ class BigtableEventProcessingStore(EventProcessingStore):
     Creates an instance of the processing store which uses Bigtable as its
     backend.
 
-    Keyword argument are forwarded to the ``BigtableKVStorage`` constructor.
+    The ``compression_dictionary`` option is the path of a zstd dictionary
+    that is used to compress event payloads, see ``EventPayloadCodec``. All
+    other keyword arguments are forwarded to the ``BigtableKVStorage``
+    constructor, whose own ``compression`` should not be used together with
+    payload compression.
     """
 
     def __init__(self, **options):
+        dictionary_path = options.pop("compression_dictionary", None)
         super().__init__(
             KVStorageCodecWrapper(
                 BigtableKVStorage(**options),
-                JSONCodec() | BytesCodec(),  # maintains functional parity with cache backend
+                # Uncompressed payloads are plain JSON, which maintains
+                # functional parity with the cache backend.
+                EventPayloadCodec(dictionary_path=dictionary_path),
             )
         )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+import zstandard
+
+from sentry import options
+from sentry.utils import json, metrics
+from sentry.utils.codecs import Codec
+
+# Every zstd frame starts with these bytes, which can never start a JSON document.
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class RawEventPayload(NamedTuple):
+    """
+    The JSON payload of an event exactly as it was received from Kafka. Events
+    that are stored before they were changed are stored as is, rather than
+    serializing the parsed event again.
+    """
+
+    data: bytes | str
+
+
+class EventPayloadCodec(Codec[Any, bytes]):
+    """
+    Encodes events as JSON, compressed with zstd if the
+    `eventstore.processing.compress` option is enabled.
+
+    A dictionary trained on event payloads (`zstd --train`) improves the ratio
+    of small events considerably. As frames compressed with a dictionary can
+    only be decoded with the same dictionary, it has to be deployed to every
+    reader of the store before compression is enabled. Decoding accepts both
+    compressed and uncompressed payloads, so compression can be turned on and
+    off at any time.
+    """
+
+    def __init__(self, dictionary_path: str | None = None, level: int = 3) -> None:
+        self.level = level
+        self.dictionary: zstandard.ZstdCompressionDict | None = None
+        if dictionary_path is not None:
+            with open(dictionary_path, "rb") as f:
+                self.dictionary = zstandard.ZstdCompressionDict(f.read())
+            self.dictionary.precompute_compress(level=level)
+
+    def encode(self, value: Any) -> bytes:
+        compress = options.get("eventstore.processing.compress")
+        tags = {"raw": str(isinstance(value, RawEventPayload)).lower()}
+        with metrics.timer("eventstore.processing.encode", tags=tags):
+            if isinstance(value, RawEventPayload):
+                data = value.data
+                encoded = data.encode("utf8") if isinstance(data, str) else data
+            else:
+                encoded = json.dumps(value).encode("utf8")
+
+            metrics.distribution("eventstore.processing.size", len(encoded), tags=tags, unit="byte")
+            if not compress:
+                return encoded
+
+            if self.dictionary is not None:
+                compressor = zstandard.ZstdCompressor(dict_data=self.dictionary)
+            else:
+                compressor = zstandard.ZstdCompressor(level=self.level)
+            compressed = compressor.compress(encoded)
+
+        metrics.distribution(
+            "eventstore.processing.compressed_size", len(compressed), tags=tags, unit="byte"
+        )
+        return compressed
+
+    def decode(self, value: bytes) -> Any:
+        compressed = value[:4] == ZSTD_MAGIC
+        with metrics.timer(
+            "eventstore.processing.decode", tags={"compressed": str(compressed).lower()}
+        ):
+            if compressed:
+                value = zstandard.ZstdDecompressor(dict_data=self.dictionary).decompress(value)
+            return json.loads(value)
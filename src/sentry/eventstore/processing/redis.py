@@ -1,20 +1,25 @@
-from sentry.utils.codecs import JSONCodec
 from sentry.utils.kvstore.encoding import KVStorageCodecWrapper
 from sentry.utils.kvstore.redis import RedisKVStorage
 from sentry.utils.redis import redis_clusters
 
 from .base import EventProcessingStore
+from .codec import EventPayloadCodec
 
 
 class RedisClusterEventProcessingStore(EventProcessingStore):
     """
     Creates an instance of the processing store which uses a Redis Cluster
     client as its backend.
+
+    The ``compression_dictionary`` option is the path of a zstd dictionary
+    that is used to compress event payloads, see ``EventPayloadCodec``.
     """
 
     def __init__(self, **options):
         super().__init__(
             KVStorageCodecWrapper(
-                RedisKVStorage(redis_clusters.get(options.pop("cluster", "default"))), JSONCodec()
+                # Compressed payloads are binary, so the responses must not be decoded.
+                RedisKVStorage(redis_clusters.get_binary(options.pop("cluster", "default"))),
+                EventPayloadCodec(dictionary_path=options.pop("compression_dictionary", None)),
             )
         )
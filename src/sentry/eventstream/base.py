@@ -36,6 +36,21 @@ class GroupState(TypedDict):
 GroupStates = Sequence[GroupState]
 
 
+class EventStreamInsert(TypedDict):
+    """
+    The arguments of `EventStream.insert` for a single event of a batch.
+    """
+
+    event: Event | GroupEvent
+    is_new: bool
+    is_regression: bool
+    is_new_group_environment: bool
+    primary_hash: str | None
+    received_timestamp: float | datetime
+    skip_consume: bool
+    group_states: GroupStates | None
+
+
 class EventStreamEventType(Enum):
     """
     We have 3 broad categories of event types that we care about in eventstream.
@@ -49,6 +64,7 @@ class EventStreamEventType(Enum):
 class EventStream(Service):
     __all__ = (
         "insert",
+        "insert_many",
         "start_delete_groups",
         "end_delete_groups",
         "start_merge",
@@ -146,6 +162,14 @@ class EventStream(Service):
             occurrence_id=event.occurrence_id if isinstance(event, GroupEvent) else None,
         )
 
+    def insert_many(self, inserts: Sequence[EventStreamInsert]) -> None:
+        """
+        Inserts a batch of events. Backends that can publish events in bulk
+        override this; by default the events are inserted one by one.
+        """
+        for insert in inserts:
+            self.insert(**insert)
+
     def start_delete_groups(self, project_id: int, group_ids: Sequence[int]) -> Mapping[str, Any]:
         raise NotImplementedError
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Mapping, MutableMapping, Sequence
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from confluent_kafka import KafkaError
@@ -11,10 +12,10 @@ from confluent_kafka import Producer
 
 from sentry import options
 from sentry.conf.types.kafka_definition import Topic
-from sentry.eventstream.base import EventStreamEventType, GroupStates
+from sentry.eventstream.base import EventStreamEventType, EventStreamInsert, GroupStates
 from sentry.eventstream.snuba import KW_SKIP_SEMANTIC_PARTITIONING, SnubaProtocolEventStream
 from sentry.killswitches import killswitch_matches_context
-from sentry.utils import json
+from sentry.utils import json, metrics
 from sentry.utils.kafka_config import get_kafka_producer_cluster_options, get_topic_definition
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,33 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from sentry.eventstore.models import Event, GroupEvent
 
+# Headers that only ever take a few distinct values. Their encoded values are
+# shared between all messages instead of being encoded for every message.
+SHARED_HEADERS = frozenset(
+    [
+        "operation",
+        "version",
+        "project_id",
+        "is_new",
+        "is_new_group_environment",
+        "is_regression",
+        "skip_consume",
+        "queue",
+    ]
+)
+
+
+@lru_cache(maxsize=1024)
+def _encode_shared_header(value: str) -> bytes:
+    return value.encode("utf-8")
+
+
+def _encode_headers(headers: Mapping[str, str]) -> list[tuple[str, bytes]]:
+    return [
+        (key, _encode_shared_header(value) if key in SHARED_HEADERS else value.encode("utf-8"))
+        for key, value in headers.items()
+    ]
+
 
 class KafkaEventStream(SnubaProtocolEventStream):
     def __init__(self, **options: Any) -> None:
@@ -107,7 +135,7 @@ class KafkaEventStream(SnubaProtocolEventStream):
                 ),
             }
 
-    def insert(
+    def _prepare_insert(
         self,
         event: Event | GroupEvent,
         is_new: bool,
@@ -118,8 +146,7 @@ class KafkaEventStream(SnubaProtocolEventStream):
         skip_consume: bool = False,
         group_states: GroupStates | None = None,
         **kwargs: Any,
-    ) -> None:
-
+    ) -> dict[str, Any] | None:
         event_type = self._get_event_type(event)
         if event.get_tag("sample_event"):
             logger.info(
@@ -155,7 +182,7 @@ class KafkaEventStream(SnubaProtocolEventStream):
             )
             kwargs["asynchronous"] = False
 
-        super().insert(
+        return super()._prepare_insert(
             event,
             is_new,
             is_regression,
@@ -167,6 +194,90 @@ class KafkaEventStream(SnubaProtocolEventStream):
             **kwargs,
         )
 
+    def insert_many(self, inserts: Sequence[EventStreamInsert]) -> None:
+        """
+        Inserts a batch of events. All messages are produced before the
+        producers are polled once for the whole batch, and flushed once if any
+        of the events has to be delivered synchronously.
+        """
+        messages = []
+        for insert in inserts:
+            send_kwargs = self._prepare_insert(**insert)
+            if send_kwargs is not None:
+                messages.append(send_kwargs)
+
+        if not messages:
+            return
+
+        asynchronous = all(message["asynchronous"] for message in messages)
+        with metrics.timer(
+            "eventstream.insert_many.produce", tags={"asynchronous": str(asynchronous).lower()}
+        ):
+            producers: dict[Topic, Producer] = {}
+            for message in messages:
+                topic = self._get_topic(message["project_id"], message["event_type"])
+                if topic not in producers:
+                    producers[topic] = self.get_producer(topic)
+                    # See `_send` for why polling is required.
+                    producers[topic].poll(0.0)
+
+                self._produce(
+                    producers[topic],
+                    topic,
+                    message["project_id"],
+                    message["_type"],
+                    message["extra_data"],
+                    message["headers"],
+                    message["skip_semantic_partitioning"],
+                )
+
+            for producer in producers.values():
+                if asynchronous:
+                    producer.poll(0.0)
+                else:
+                    producer.flush()
+
+        metrics.distribution("eventstream.insert_many.size", len(messages))
+
+    def _get_topic(self, project_id: int, event_type: EventStreamEventType) -> Topic:
+        if event_type == EventStreamEventType.Transaction:
+            return self.get_transactions_topic(project_id)
+        elif event_type == EventStreamEventType.Generic:
+            return self.issue_platform_topic
+        else:
+            return self.topic
+
+    def _produce(
+        self,
+        producer: Producer,
+        topic: Topic,
+        project_id: int,
+        _type: str,
+        extra_data: tuple[Any, ...],
+        headers: MutableMapping[str, str],
+        skip_semantic_partitioning: bool,
+    ) -> bool:
+        headers["operation"] = _type
+        headers["version"] = str(self.EVENT_PROTOCOL_VERSION)
+
+        assert isinstance(extra_data, tuple)
+
+        real_topic = get_topic_definition(topic)["real_topic_name"]
+
+        try:
+            producer.produce(
+                topic=real_topic,
+                key=str(project_id).encode("utf-8") if not skip_semantic_partitioning else None,
+                value=json.dumps((self.EVENT_PROTOCOL_VERSION, _type) + extra_data),
+                on_delivery=self.delivery_callback,
+                headers=_encode_headers(headers),
+            )
+        except Exception as error:
+            logger.exception("Could not publish message: %s", error)
+            return False
+
+        return True
+
     def _send(
         self,
         project_id: int,
@@ -179,16 +290,8 @@ class KafkaEventStream(SnubaProtocolEventStream):
     ) -> None:
         if headers is None:
             headers = {}
-        headers["operation"] = _type
-        headers["version"] = str(self.EVENT_PROTOCOL_VERSION)
-
-        if event_type == EventStreamEventType.Transaction:
-            topic = self.get_transactions_topic(project_id)
-        elif event_type == EventStreamEventType.Generic:
-            topic = self.issue_platform_topic
-        else:
-            topic = self.topic
 
+        topic = self._get_topic(project_id, event_type)
         producer = self.get_producer(topic)
 
         # Polling the producer is required to ensure callbacks are fired. This
@@ -203,20 +306,9 @@ class KafkaEventStream(SnubaProtocolEventStream):
         # asynchronous produce() calls from the same process.
         producer.poll(0.0)
 
-        assert isinstance(extra_data, tuple)
-
-        real_topic = get_topic_definition(topic)["real_topic_name"]
-
-        try:
-            producer.produce(
-                topic=real_topic,
-                key=str(project_id).encode("utf-8") if not skip_semantic_partitioning else None,
-                value=json.dumps((self.EVENT_PROTOCOL_VERSION, _type) + extra_data),
-                on_delivery=self.delivery_callback,
-                headers=[(k, v.encode("utf-8")) for k, v in headers.items()],
-            )
-        except Exception as error:
-            logger.exception("Could not publish message: %s", error)
+        if not self._produce(
+            producer, topic, project_id, _type, extra_data, headers, skip_semantic_partitioning
+        ):
             return
 
         if not asynchronous:
@@ -1,13 +1,18 @@
 import logging
 import random
-from collections.abc import Generator, Mapping
+from collections import defaultdict
+from collections.abc import Generator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any
 
 from arroyo.backends.kafka.consumer import KafkaPayload
+from arroyo.processing.strategies.batching import ValuesBatch
 from arroyo.types import Message
+from django.core.cache import cache
 
 from sentry import options
+from sentry.celery import app as celery_app
 from sentry.eventstream.base import GroupStates
 from sentry.eventstream.kafka.protocol import (
     get_task_kwargs_for_message,
@@ -45,26 +50,28 @@ def dispatch_post_process_group_task(
     skip_consume: bool = False,
     group_states: GroupStates | None = None,
     occurrence_id: str | None = None,
+    producer: Any = None,
 ) -> None:
     if skip_consume:
         logger.info("post_process.skip.raw_event", extra={"event_id": event_id})
     else:
         cache_key = cache_key_for_event({"project": project_id, "event_id": event_id})
 
-        post_process_group.apply_async(
-            kwargs={
-                "is_new": is_new,
-                "is_regression": is_regression,
-                "is_new_group_environment": is_new_group_environment,
-                "primary_hash": primary_hash,
-                "cache_key": cache_key,
-                "group_id": group_id,
-                "group_states": group_states,
-                "occurrence_id": occurrence_id,
-                "project_id": project_id,
-            },
-            queue=queue,
-        )
+        task_kwargs = {
+            "is_new": is_new,
+            "is_regression": is_regression,
+            "is_new_group_environment": is_new_group_environment,
+            "primary_hash": primary_hash,
+            "cache_key": cache_key,
+            "group_id": group_id,
+            "group_states": group_states,
+            "occurrence_id": occurrence_id,
+            "project_id": project_id,
+        }
+        if producer is None:
+            post_process_group.apply_async(kwargs=task_kwargs, queue=queue)
+        else:
+            post_process_group.apply_async(kwargs=task_kwargs, queue=queue, producer=producer)
 
 
 def _get_task_kwargs(message: Message[KafkaPayload]) -> Mapping[str, Any] | None:
@@ -91,7 +98,90 @@ def _get_task_kwargs_and_dispatch(message: Message[KafkaPayload]) -> None:
     dispatch_post_process_group_task(**task_kwargs)
 
 
+def _warm_post_process_caches(batch: Sequence[Mapping[str, Any]]) -> None:
+    """
+    Loads the state that post processing of every event reads from the cache,
+    once per batch. Without this, every post processing task of a project
+    whose state has expired from the cache fetches it from the database again.
+    """
+    from sentry.models.group import Group
+    from sentry.models.organization import Organization
+    from sentry.models.project import Project
+    from sentry.models.projectownership import ProjectOwnership
+    from sentry.models.rule import Rule
+
+    project_ids = {task_kwargs["project_id"] for task_kwargs in batch}
+    group_ids = {task_kwargs["group_id"] for task_kwargs in batch if task_kwargs["group_id"]}
+
+    projects = Project.objects.get_many_from_cache(project_ids)
+    Organization.objects.get_many_from_cache({project.organization_id for project in projects})
+    Group.objects.get_many_from_cache(group_ids)
+
+    # Rules and ownership are cached per project, with a negative cache entry
+    # for projects without any. Only projects whose entries are missing need
+    # to be loaded.
+    rules_keys = {f"project:{project_id}:rules": project_id for project_id in project_ids}
+    ownership_keys = {
+        ProjectOwnership.get_cache_key(project_id): project_id for project_id in project_ids
+    }
+    cached = cache.get_many([*rules_keys, *ownership_keys])
+    for key, project_id in rules_keys.items():
+        if key not in cached:
+            Rule.get_for_project(project_id)
+    for key, project_id in ownership_keys.items():
+        if key not in cached:
+            ProjectOwnership.get_ownership_cached(project_id)
+
+    metrics.distribution("eventstream.dispatch_batch.projects", len(project_ids))
+
+
+def _dispatch_project_batch(batch: Sequence[Mapping[str, Any]]) -> None:
+    with celery_app.producer_or_acquire() as producer:
+        for task_kwargs in batch:
+            dispatch_post_process_group_task(**task_kwargs, producer=producer)
+
+
+def _get_task_kwargs_and_dispatch_batch(
+    message: Message[ValuesBatch[KafkaPayload]], executor: ThreadPoolExecutor
+) -> None:
+    """
+    Decodes a batch of messages and dispatches their post processing tasks,
+    one thread per project at a time, after warming the caches of post
+    processing. Raises if any task could not be dispatched, so that the
+    batch is not committed.
+    """
+    batches: dict[int, list[Mapping[str, Any]]] = defaultdict(list)
+    for value in message.payload:
+        task_kwargs = _get_task_kwargs(Message(value))
+        if task_kwargs:
+            batches[task_kwargs["project_id"]].append(task_kwargs)
+
+    if not batches:
+        return
+
+    try:
+        with metrics.timer("eventstream.dispatch_batch.warm_caches"):
+            _warm_post_process_caches([kwargs for batch in batches.values() for kwargs in batch])
+    except Exception:
+        # Warming the caches is an optimization, post processing loads the
+        # state itself anyway.
+        logger.exception("Could not warm post process caches")
+
+    with metrics.timer("eventstream.dispatch_batch.dispatch"):
+        futures = [executor.submit(_dispatch_project_batch, batch) for batch in batches.values()]
+        for future in futures:
+            future.result()
+
+    metrics.distribution("eventstream.dispatch_batch.size", len(message.payload))
+
+
 class EventPostProcessForwarderStrategyFactory(PostProcessForwarderStrategyFactory):
     @staticmethod
     def _dispatch_function(message: Message[KafkaPayload]) -> None:
         return _get_task_kwargs_and_dispatch(message)
+
+    @staticmethod
+    def _dispatch_batch_function(
+        message: Message[ValuesBatch[KafkaPayload]], executor: ThreadPoolExecutor
+    ) -> None:
+        return _get_task_kwargs_and_dispatch_batch(message, executor)
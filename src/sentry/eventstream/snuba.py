@@ -110,6 +110,36 @@ class SnubaProtocolEventStream(EventStream):
         group_states: GroupStates | None = None,
         **kwargs: Any,
     ) -> None:
+        send_kwargs = self._prepare_insert(
+            event,
+            is_new,
+            is_regression,
+            is_new_group_environment,
+            primary_hash,
+            received_timestamp,
+            skip_consume,
+            group_states,
+            **kwargs,
+        )
+        if send_kwargs is not None:
+            self._send(**send_kwargs)
+
+    def _prepare_insert(
+        self,
+        event: Event | GroupEvent,
+        is_new: bool,
+        is_regression: bool,
+        is_new_group_environment: bool,
+        primary_hash: str | None,
+        received_timestamp: float | datetime,
+        skip_consume: bool = False,
+        group_states: GroupStates | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any] | None:
+        """
+        Returns the arguments to `_send` the insert of an event with, or
+        `None` if the event cannot be inserted.
+        """
         if event.get_tag("sample_event") == "true":
             logger.info(
                 "insert: attempting to insert event in SnubaProtocolEventStream",
@@ -124,7 +154,7 @@ class SnubaProtocolEventStream(EventStream):
                 "`GroupEvent` passed to `EventStream.insert`. `GroupEvent` may only be passed when "
                 "associated with an `IssueOccurrence`",
             )
-            return
+            return None
         project = event.project
         set_current_event_project(project.id)
         retention_days = quotas.backend.get_event_retention(organization=project.organization)
@@ -174,9 +204,9 @@ class SnubaProtocolEventStream(EventStream):
             # transactions processing has a configurable 'skipped contexts' to skip writing specific contexts maps
             # to the row. for now, we're ignoring that until we have a need for it
 
-        self._send(
-            project.id,
-            "insert",
+        return dict(
+            project_id=project.id,
+            _type="insert",
             extra_data=(
                 {
                     "group_id": event.group_id,
@@ -1,26 +1,31 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import logging
 import os
+import threading
 import zlib
-from collections.abc import Sequence
+from collections.abc import Hashable, Sequence
+from functools import cached_property
 from typing import Any, Literal
 
 import msgpack
 import sentry_sdk
 import zstandard
+from cachetools import LRUCache
 from sentry_ophio.enhancers import Cache as RustCache
 from sentry_ophio.enhancers import Component as RustComponent
 from sentry_ophio.enhancers import Enhancements as RustEnhancements
 
-from sentry import projectoptions
+from sentry import options, projectoptions
 from sentry.grouping.component import GroupingComponent
 from sentry.stacktraces.functions import set_in_app
+from sentry.utils import metrics
 from sentry.utils.safe import get_path, set_path
 
 from .exceptions import InvalidEnhancerConfig
-from .matchers import create_match_frame
+from .matchers import CalleeMatch, CallerMatch, create_match_frame
 from .parser import parse_enhancements
 from .rules import Rule
 
@@ -33,6 +38,12 @@ RUST_CACHE = RustCache(1_000)
 VERSIONS = [2]
 LATEST_VERSION = VERSIONS[-1]
 
+# Maps (enhancements config key, exception data, match frame) to the `(category, in_app)`
+# modification of that frame. This is shared across events, as the same frames of popular SDKs
+# show up in almost every event.
+MODIFICATIONS_CACHE = LRUCache(maxsize=20_000)
+MODIFICATIONS_CACHE_LOCK = threading.Lock()
+
 
 def merge_rust_enhancements(
     bases: list[str], rust_enhancements: RustEnhancements
@@ -118,10 +129,16 @@ class Enhancements:
         This applies the frame modifications to the frames itself. This does not affect grouping.
         """
         match_frames = [create_match_frame(frame, platform) for frame in frames]
+        rust_exception_data = make_rust_exception_data(exception_data)
 
-        rust_enhanced_frames = self.rust_enhancements.apply_modifications_to_frames(
-            match_frames, make_rust_exception_data(exception_data)
-        )
+        if self.has_frame_local_modifications and options.get(
+            "grouping.enhancer.modifications-cache.enabled"
+        ):
+            rust_enhanced_frames = self._get_cached_modifications(match_frames, rust_exception_data)
+        else:
+            rust_enhanced_frames = self.rust_enhancements.apply_modifications_to_frames(
+                match_frames, rust_exception_data
+            )
 
         for frame, (category, in_app) in zip(frames, rust_enhanced_frames):
             if in_app is not None:
@@ -129,6 +146,78 @@ class Enhancements:
             if category is not None:
                 set_path(frame, "data", "category", value=category)
 
+    def _get_cached_modifications(
+        self, match_frames: list[dict[str, Any]], rust_exception_data: RustExceptionData
+    ) -> list[tuple[Any, Any]]:
+        """
+        Returns the frame modifications of `apply_modifications_to_frames`, resolving every
+        distinct frame only once per process. Only valid if `has_frame_local_modifications`.
+        """
+        exception_key = (
+            tuple(rust_exception_data.values()) if self._modifications_use_exception_data else None
+        )
+        # `create_match_frame` always creates the same keys in the same order.
+        keys: list[Hashable] = [
+            (self._config_key, exception_key, tuple(match_frame.values()))
+            for match_frame in match_frames
+        ]
+
+        with MODIFICATIONS_CACHE_LOCK:
+            results = [MODIFICATIONS_CACHE.get(key) for key in keys]
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        metrics.incr(
+            "grouping.enhancer.modifications_cache",
+            amount=len(results) - len(missing),
+            tags={"result": "hit"},
+        )
+        metrics.incr(
+            "grouping.enhancer.modifications_cache", amount=len(missing), tags={"result": "miss"}
+        )
+
+        if missing:
+            rust_enhanced_frames = self.rust_enhancements.apply_modifications_to_frames(
+                [match_frames[i] for i in missing], rust_exception_data
+            )
+            with MODIFICATIONS_CACHE_LOCK:
+                for i, (category, in_app) in zip(missing, rust_enhanced_frames):
+                    results[i] = MODIFICATIONS_CACHE[keys[i]] = (category, in_app)
+
+        return results
+
+    @cached_property
+    def _config_key(self) -> str:
+        # Bases are only referenced by id, so this is cheap to compute.
+        return hashlib.md5(msgpack.dumps(self._to_config_structure())).hexdigest()
+
+    @cached_property
+    def _modifier_rules(self) -> list[Rule]:
+        rules = []
+        for base_id in self.bases:
+            base = ENHANCEMENT_BASES.get(base_id)
+            if base:
+                rules.extend(base.rules)
+        rules.extend(self.rules)
+        return [rule for rule in rules if rule._is_modifier]
+
+    @cached_property
+    def has_frame_local_modifications(self) -> bool:
+        """
+        Whether the modifications to each frame only depend on the frame itself (and the exception
+        data), which allows them to be cached per frame. This is not the case for rules that
+        match on callers/callees or apply to a range of frames.
+        """
+        for rule in self._modifier_rules:
+            if any(isinstance(m, (CallerMatch, CalleeMatch)) for m in rule.matchers):
+                return False
+            if any(action.is_modifier and action.range is not None for action in rule.actions):
+                return False
+        return True
+
+    @cached_property
+    def _modifications_use_exception_data(self) -> bool:
+        return any(rule._exception_matchers for rule in self._modifier_rules)
+
     def assemble_stacktrace_component(self, components, frames, platform, exception_data=None):
         """
         This assembles a `stacktrace` grouping component out of the given
@@ -1,10 +1,14 @@
 import dataclasses
 import re
+import threading
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Hashable, Sequence
 from functools import lru_cache
 
 import tiktoken
+from cachetools import LRUCache
+
+from sentry.utils import metrics
 
 __all__ = [
     "ParameterizationCallable",
@@ -182,6 +186,26 @@ DEFAULT_PARAMETERIZATION_REGEXES = [
 DEFAULT_PARAMETERIZATION_REGEXES_MAP = {r.name: r.pattern for r in DEFAULT_PARAMETERIZATION_REGEXES}
 
 
+@lru_cache(maxsize=32)
+def _compile_parameterization_regex(pattern_keys: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile(
+        rf"(?x){'|'.join(DEFAULT_PARAMETERIZATION_REGEXES_MAP[k] for k in pattern_keys)}"
+    )
+
+
+# Results of `Parameterizer.parameterize_all` for parameterizers created with
+# `cache_results=True`, shared across events. The cache is bounded by the total
+# length of the cached messages and their parameterized versions. Values hold
+# the message of their key, so that it is counted.
+_RESULT_CACHE_MAX_CHARS = 10_000_000
+_RESULT_CACHE_MAX_MESSAGE_LENGTH = 10_000
+
+_result_cache: LRUCache[Hashable, tuple[str, str, tuple[tuple[str, int], ...]]] = LRUCache(
+    maxsize=_RESULT_CACHE_MAX_CHARS, getsizeof=lambda value: len(value[0]) + len(value[1])
+)
+_result_cache_lock = threading.Lock()
+
+
 @dataclasses.dataclass
 class ParameterizationCallable:
     """
@@ -223,6 +247,7 @@ class _UniqueId:
         return tiktoken.get_encoding("cl100k_base")
 
     @staticmethod
+    @lru_cache(maxsize=10_000)
     def num_tokens_from_string(token_str: str) -> int:
         """Returns the number of tokens in a text string."""
         num_tokens = len(_UniqueId.tiktoken_encoding().encode(token_str))
@@ -280,12 +305,33 @@ class Parameterizer:
         self,
         regex_pattern_keys: Sequence[str],
         experiments: Sequence[ParameterizationExperiment] = (),
+        cache_results: bool = False,
     ):
+        """
+        @param cache_results: Whether to share results of `parameterize_all` with all other
+            parameterizers of the same configuration that cache results.
+        """
         self._parameterization_regex = self._make_regex_from_patterns(regex_pattern_keys)
         self._experiments = experiments
+        self._cache_results = cache_results
+        self._config_key = (
+            tuple(regex_pattern_keys),
+            tuple(self._get_experiment_key(e) for e in experiments),
+        )
 
         self.matches_counter: defaultdict[str, int] = defaultdict(int)
 
+    @staticmethod
+    def _get_experiment_key(experiment: ParameterizationExperiment) -> Hashable:
+        if isinstance(experiment, ParameterizationCallableExperiment):
+            return (experiment.name, experiment.apply)
+        return (
+            experiment.name,
+            experiment.raw_pattern,
+            experiment.lookbehind,
+            experiment.lookahead,
+        )
+
     @staticmethod
     def _make_regex_from_patterns(pattern_keys: Sequence[str]) -> re.Pattern[str]:
         """
@@ -297,11 +343,11 @@ class Parameterizer:
 
         The `(?x)` tells the regex compiler to ignore comments and unescaped whitespace,
         so we can use newlines and indentation for better legibility in patterns above.
+
+        Compiled patterns are cached per combination of keys.
         """
 
-        return re.compile(
-            rf"(?x){'|'.join(DEFAULT_PARAMETERIZATION_REGEXES_MAP[k] for k in pattern_keys)}"
-        )
+        return _compile_parameterization_regex(tuple(pattern_keys))
 
     def parametrize_w_regex(self, content: str) -> str:
         """
@@ -365,4 +411,38 @@ class Parameterizer:
     def parameterize_all(
         self, content: str, should_run: Callable[[str], bool] = lambda _: True
     ) -> str:
+        if not self._cache_results or len(content) > _RESULT_CACHE_MAX_MESSAGE_LENGTH:
+            return self._parameterize_all(content, should_run)
+
+        # Evaluate `should_run` once per experiment, its result is part of the cache key.
+        experiments_to_run = tuple(should_run(e.name) for e in self._experiments)
+        cache_key = (self._config_key, experiments_to_run, content)
+
+        with _result_cache_lock:
+            cached = _result_cache.get(cache_key)
+
+        if cached is not None:
+            metrics.incr("grouping.parameterization.cache", tags={"result": "hit"})
+            _, normalized, matches = cached
+            for key, count in matches:
+                self.matches_counter[key] += count
+            return normalized
+
+        metrics.incr("grouping.parameterization.cache", tags={"result": "miss"})
+        matches_before = dict(self.matches_counter)
+        normalized = self._parameterize_all(
+            content, dict(zip((e.name for e in self._experiments), experiments_to_run)).__getitem__
+        )
+        matches = tuple(
+            (key, count - matches_before.get(key, 0))
+            for key, count in self.matches_counter.items()
+            if count != matches_before.get(key, 0)
+        )
+
+        with _result_cache_lock:
+            _result_cache[cache_key] = (content, normalized, matches)
+
+        return normalized
+
+    def _parameterize_all(self, content: str, should_run: Callable[[str], bool]) -> str:
         return self.parametrize_w_experiments(self.parametrize_w_regex(content), should_run)
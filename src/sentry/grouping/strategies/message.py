@@ -1,7 +1,7 @@
 from itertools import islice
 from typing import Any
 
-from sentry import analytics
+from sentry import analytics, options
 from sentry.eventstore.models import Event
 from sentry.features.rollout import in_rollout_group
 from sentry.grouping.component import GroupingComponent
@@ -49,6 +49,7 @@ def normalize_message_for_grouping(message: str, event: Event, share_analytics:
             "bool",
         ),
         experiments=(UniqueIdExperiment,),
+        cache_results=options.get("grouping.parameterization.result-cache.enabled"),
     )
 
     def _shoudl_run_experiment(experiment_name: str) -> bool:
@@ -10,7 +10,7 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from sentry import features
+from sentry import features, options
 from sentry.api.api_owners import ApiOwner
 from sentry.api.api_publish_status import ApiPublishStatus
 from sentry.api.base import Endpoint, region_silo_endpoint
@@ -21,6 +21,7 @@ from sentry.api.helpers.constants import ALERT_RULES_COUNT_HEADER, MAX_QUERY_SUB
 from sentry.api.paginator import (
     CombinedQuerysetIntermediary,
     CombinedQuerysetPaginator,
+    KeysetCombinedQuerysetPaginator,
     OffsetPaginator,
 )
 from sentry.api.serializers import serialize
@@ -314,14 +315,20 @@ class OrganizationCombinedRuleIndexEndpoint(OrganizationEndpoint):
         alert_rule_intermediary = CombinedQuerysetIntermediary(alert_rules, sort_key)
         rule_intermediary = CombinedQuerysetIntermediary(issue_rules, rule_sort_key)
         uptime_intermediary = CombinedQuerysetIntermediary(uptime_rules, sort_key)
+        if options.get("api.alert-rule-index.keyset-pagination"):
+            paginator_cls = KeysetCombinedQuerysetPaginator
+            cursor_cls = StringCursor
+        else:
+            paginator_cls = CombinedQuerysetPaginator
+            cursor_cls = StringCursor if case_insensitive else Cursor
         response = self.paginate(
             request,
-            paginator_cls=CombinedQuerysetPaginator,
+            paginator_cls=paginator_cls,
             on_results=lambda x: serialize(x, request.user, CombinedRuleSerializer(expand=expand)),
             default_per_page=25,
             intermediaries=[alert_rule_intermediary, rule_intermediary, uptime_intermediary],
             desc=not is_asc,
-            cursor_cls=StringCursor if case_insensitive else Cursor,
+            cursor_cls=cursor_cls,
             case_insensitive=case_insensitive,
         )
         response[MAX_QUERY_SUBSCRIPTIONS_HEADER] = settings.MAX_QUERY_SUBSCRIPTIONS_PER_ORG
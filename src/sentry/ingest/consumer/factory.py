@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
 from functools import partial
-from typing import NamedTuple, TypeVar
+from typing import Any, Literal, NamedTuple, TypeVar
 
 from arroyo.backends.kafka.consumer import KafkaPayload
+from arroyo.dlq import InvalidMessage
 from arroyo.processing.strategies import (
     CommitOffsets,
     FilterStep,
@@ -12,6 +14,7 @@ from arroyo.processing.strategies import (
     ProcessingStrategyFactory,
     RunTask,
 )
+from arroyo.processing.strategies.batching import BatchStep
 from arroyo.types import Commit, FilteredPayload, Message, Partition
 
 from sentry.ingest.types import ConsumerType
@@ -19,7 +22,7 @@ from sentry.processing.backpressure.arroyo import HealthChecker, create_backpres
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
 
 from .attachment_event import decode_and_process_chunks, process_attachments_and_events
-from .simple_event import process_simple_event_message
+from .simple_event import process_simple_event_batch, process_simple_event_message
 
 
 class MultiProcessConfig(NamedTuple):
@@ -58,6 +61,48 @@ def maybe_multiprocess_step(
         )
 
 
+class Unbatcher(ProcessingStrategy[FilteredPayload | Sequence[Message[Any]]]):
+    """
+    Submits the messages of a processed batch one by one, so that every
+    message is committed on its own and invalid messages are put into the DLQ
+    individually, by raising their `InvalidMessage` payload.
+
+    Messages are only forwarded in `poll`, as the stream processor can only
+    tell apart the invalid message from the submitted one there.
+    """
+
+    def __init__(self, next_step: ProcessingStrategy[Any]) -> None:
+        self.__next_step = next_step
+        self.__messages: deque[Message[Any]] = deque()
+
+    def __forward(self) -> None:
+        while self.__messages:
+            message = self.__messages.popleft()
+            if isinstance(message.payload, InvalidMessage):
+                raise message.payload
+            self.__next_step.submit(message)
+
+    def submit(self, message: Message[FilteredPayload | Sequence[Message[Any]]]) -> None:
+        if isinstance(message.payload, FilteredPayload):
+            self.__messages.append(message)
+        else:
+            self.__messages.extend(message.payload)
+
+    def poll(self) -> None:
+        self.__forward()
+        self.__next_step.poll()
+
+    def close(self) -> None:
+        self.__next_step.close()
+
+    def terminate(self) -> None:
+        self.__next_step.terminate()
+
+    def join(self, timeout: float | None = None) -> None:
+        self.__forward()
+        self.__next_step.join(timeout)
+
+
 class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
     def __init__(
         self,
@@ -69,6 +114,7 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         max_batch_time: int,
         input_block_size: int | None,
         output_block_size: int | None,
+        mode: Literal["single", "batched"] = "single",
     ):
         self.consumer_type = consumer_type
         self.is_attachment_topic = consumer_type == ConsumerType.Attachments
@@ -89,6 +135,13 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
                 num_processes, max_batch_size, max_batch_time, input_block_size, output_block_size
             )
 
+        # In batched mode, events are processed in batches of `max_batch_size`
+        # within the consumer process, rather than one by one. Attachments are
+        # always processed one by one.
+        self.batched = mode == "batched"
+        self.max_batch_size = max_batch_size
+        self.max_batch_time = max_batch_time
+
         self.health_checker = HealthChecker("ingest")
 
     def create_with_partitions(
@@ -100,6 +153,19 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
 
         final_step = CommitOffsets(commit)
 
+        if not self.is_attachment_topic and self.batched:
+            batch_function = partial(
+                process_simple_event_batch,
+                consumer_type=self.consumer_type,
+                reprocess_only_stuck_events=self.reprocess_only_stuck_events,
+            )
+            next_step = BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=RunTask(function=batch_function, next_step=Unbatcher(final_step)),
+            )
+            return create_backpressure_step(health_checker=self.health_checker, next_step=next_step)
+
         if not self.is_attachment_topic:
             event_function = partial(
                 process_simple_event_message,
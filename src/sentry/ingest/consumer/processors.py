@@ -1,6 +1,6 @@
 import functools
 import logging
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from typing import Any
 
 import orjson
@@ -11,6 +11,7 @@ from usageaccountant import UsageUnit
 
 from sentry import eventstore, features
 from sentry.attachments import CachedAttachment, attachment_cache
+from sentry.celery import app as celery_app
 from sentry.event_manager import save_attachment
 from sentry.eventstore.processing import event_processing_store
 from sentry.feedback.usecases.create_feedback import FeedbackCreationSource, is_in_feedback_denylist
@@ -53,27 +54,7 @@ def trace_func(**span_kwargs):
     return wrapper
 
 
-@trace_func(name="ingest_consumer.process_event")
-@metrics.wraps("ingest_consumer.process_event")
-def process_event(
-    message: IngestMessage, project: Project, reprocess_only_stuck_events: bool = False
-) -> None:
-    """
-    Perform some initial filtering and deserialize the message payload.
-    """
-    payload = message["payload"]
-    start_time = float(message["start_time"])
-    event_id = message["event_id"]
-    project_id = int(message["project_id"])
-    remote_addr = message.get("remote_addr")
-    attachments = message.get("attachments") or ()
-
-    sentry_sdk.set_extra("event_id", event_id)
-    sentry_sdk.set_extra("len_attachments", len(attachments))
-
-    if project_id == settings.SENTRY_PROJECT:
-        metrics.incr("internal.captured.ingest_consumer.unparsed")
-
+def _get_deduplication_key(message: IngestMessage) -> str:
     # check that we haven't already processed this event (a previous instance of the forwarder
     # died before it could commit the event queue offset)
     #
@@ -88,20 +69,25 @@ def process_event(
     # This code has been ripped from the old python store endpoint. We're
     # keeping it around because it does provide some protection against
     # reprocessing good events if a single consumer is in a restart loop.
-    deduplication_key = f"ev:{project_id}:{event_id}"
+    return f"ev:{int(message['project_id'])}:{message['event_id']}"
 
-    try:
-        cached_value = cache.get(deduplication_key)
-    except Exception as exc:
-        raise Retriable(exc)
 
-    if cached_value is not None:
-        logger.warning(
-            "pre-process-forwarder detected a duplicated event" " with id:%s for project:%s.",
-            event_id,
-            project_id,
-        )
-        return  # message already processed do not reprocess
+def _log_duplicate(message: IngestMessage) -> None:
+    logger.warning(
+        "pre-process-forwarder detected a duplicated event" " with id:%s for project:%s.",
+        message["event_id"],
+        message["project_id"],
+    )
+
+
+def _parse_event(message: IngestMessage, project: Project) -> MutableMapping[str, Any] | None:
+    """
+    Applies the load shedding killswitches and parses the event payload.
+    Returns `None` if the event is dropped.
+    """
+    event_id = message["event_id"]
+    project_id = int(message["project_id"])
+    attachments = message.get("attachments") or ()
 
     if killswitch_matches_context(
         "store.load-shed-pipeline-projects",
@@ -113,12 +99,12 @@ def process_event(
     ):
         # This killswitch is for the worst of scenarios and should probably not
         # cause additional load on our logging infrastructure
-        return
+        return None
 
     # Parse the JSON payload. This is required to compute the cache key and
     # call process_event. The payload will be put into Kafka raw, to avoid
     # serializing it again.
-    data = orjson.loads(payload)
+    data = orjson.loads(message["payload"])
 
     if project_id == settings.SENTRY_PROJECT:
         metrics.incr(
@@ -136,6 +122,137 @@ def process_event(
             "event_id": event_id,
         },
     ):
+        return None
+
+    return data
+
+
+def _dispatch_event(
+    message: IngestMessage,
+    project: Project,
+    data: MutableMapping[str, Any],
+    cache_key: str,
+    producer: Any = None,
+) -> None:
+    """
+    Spawns the follow up tasks of an event that is in the processing store.
+    If a Celery `producer` is passed, tasks are published with it rather than
+    acquiring a producer for every task.
+    """
+    payload = message["payload"]
+    start_time = float(message["start_time"])
+    event_id = message["event_id"]
+    project_id = int(message["project_id"])
+    attachments = message.get("attachments") or ()
+
+    try:
+        # Records rc-processing usage broken down by
+        # event type.
+        event_type = data.get("type")
+        if event_type == "error":
+            app_feature = "errors"
+        elif event_type == "transaction":
+            app_feature = "transactions"
+        else:
+            app_feature = None
+
+        if app_feature is not None:
+            record(settings.EVENT_PROCESSING_STORE, app_feature, len(payload), UsageUnit.BYTES)
+    except Exception:
+        pass
+
+    if attachments:
+        with sentry_sdk.start_span(op="ingest_consumer.set_attachment_cache"):
+            attachment_objects = [
+                CachedAttachment(type=attachment.pop("attachment_type"), **attachment)
+                for attachment in attachments
+            ]
+
+            attachment_cache.set(cache_key, attachments=attachment_objects, timeout=CACHE_TIMEOUT)
+
+    if data.get("type") == "transaction":
+        # No need for preprocess/process for transactions thus submit
+        # directly transaction specific save_event task.
+        _enqueue(
+            save_event_transaction,
+            producer,
+            cache_key=cache_key,
+            data=None,
+            start_time=start_time,
+            event_id=event_id,
+            project_id=project_id,
+        )
+
+        try:
+            collect_span_metrics(project, data)
+        except Exception:
+            pass
+    elif data.get("type") == "feedback":
+        if not is_in_feedback_denylist(project.organization):
+            _enqueue(
+                save_event_feedback,
+                producer,
+                cache_key=None,  # no need to cache as volume is low
+                data=data,
+                start_time=start_time,
+                event_id=event_id,
+                project_id=project_id,
+            )
+        else:
+            metrics.incr("feedback.ingest.filtered", tags={"reason": "org.denylist"})
+    else:
+        # Preprocess this event, which spawns either process_event or
+        # save_event. Pass data explicitly to avoid fetching it again from the
+        # cache.
+        with sentry_sdk.start_span(op="ingest_consumer.process_event.preprocess_event"):
+            preprocess_event(
+                cache_key=cache_key,
+                data=data,
+                start_time=start_time,
+                event_id=event_id,
+                project=project,
+                has_attachments=bool(attachments),
+            )
+
+
+def _enqueue(task: Any, producer: Any, **kwargs: Any) -> None:
+    if producer is None:
+        task.delay(**kwargs)
+    else:
+        task.apply_async(kwargs=kwargs, producer=producer)
+
+
+@trace_func(name="ingest_consumer.process_event")
+@metrics.wraps("ingest_consumer.process_event")
+def process_event(
+    message: IngestMessage, project: Project, reprocess_only_stuck_events: bool = False
+) -> None:
+    """
+    Perform some initial filtering and deserialize the message payload.
+    """
+    event_id = message["event_id"]
+    project_id = int(message["project_id"])
+    attachments = message.get("attachments") or ()
+
+    sentry_sdk.set_extra("event_id", event_id)
+    sentry_sdk.set_extra("len_attachments", len(attachments))
+
+    if project_id == settings.SENTRY_PROJECT:
+        metrics.incr("internal.captured.ingest_consumer.unparsed")
+
+    deduplication_key = _get_deduplication_key(message)
+
+    try:
+        cached_value = cache.get(deduplication_key)
+    except Exception as exc:
+        raise Retriable(exc)
+
+    if cached_value is not None:
+        _log_duplicate(message)
+        return  # message already processed do not reprocess
+
+    data = _parse_event(message, project)
+    if data is None:
         return
 
     # Raise the retriable exception and skip DLQ if anything below this point fails as it may be caused by
@@ -148,84 +265,122 @@ def process_event(
             return
 
         with metrics.timer("ingest_consumer._store_event"):
-            cache_key = event_processing_store.store(data)
+            # The event was not changed since it was parsed, so its payload
+            # does not need to be serialized again.
+            cache_key = event_processing_store.store(data, raw_payload=message["payload"])
+
+        _dispatch_event(message, project, data, cache_key)
+
+        # remember for an 1 hour that we saved this event (deduplication protection)
+        cache.set(deduplication_key, "", CACHE_TIMEOUT)
 
+        # emit event_accepted once everything is done
+        event_accepted.send_robust(
+            ip=message.get("remote_addr"), data=data, project=project, sender=process_event
+        )
+    except Exception as exc:
+        if isinstance(exc, KeyError):  # ex: missing event_id in message["payload"]
+            raise
+        raise Retriable(exc)
+
+
+@trace_func(name="ingest_consumer.process_event_batch")
+@metrics.wraps("ingest_consumer.process_event_batch")
+def process_event_batch(
+    messages: Sequence[tuple[IngestMessage, Project]], reprocess_only_stuck_events: bool = False
+) -> list[Exception | None]:
+    """
+    Processes a batch of events like `process_event`, with a single round trip
+    for deduplication, for the processing store and for publishing tasks.
+
+    Returns the error of every message that should be dead lettered, in the
+    order of the messages. Errors that are retriable for one event (the cache,
+    the processing store or the broker being unavailable) raise `Retriable`
+    for the whole batch, after marking all events that were already
+    dispatched as processed.
+    """
+    errors: list[Exception | None] = [None] * len(messages)
+
+    deduplication_keys: dict[int, str] = {}
+    for index, (message, _) in enumerate(messages):
         try:
-            # Records rc-processing usage broken down by
-            # event type.
-            event_type = data.get("type")
-            if event_type == "error":
-                app_feature = "errors"
-            elif event_type == "transaction":
-                app_feature = "transactions"
-            else:
-                app_feature = None
-
-            if app_feature is not None:
-                record(settings.EVENT_PROCESSING_STORE, app_feature, len(payload), UsageUnit.BYTES)
-        except Exception:
-            pass
+            deduplication_keys[index] = _get_deduplication_key(message)
+        except Exception as exc:
+            errors[index] = exc
 
-        if attachments:
-            with sentry_sdk.start_span(op="ingest_consumer.set_attachment_cache"):
-                attachment_objects = [
-                    CachedAttachment(type=attachment.pop("attachment_type"), **attachment)
-                    for attachment in attachments
-                ]
+    try:
+        cached = cache.get_many(list(deduplication_keys.values()))
+    except Exception as exc:
+        raise Retriable(exc)
 
-                attachment_cache.set(
-                    cache_key, attachments=attachment_objects, timeout=CACHE_TIMEOUT
-                )
+    events: list[tuple[int, MutableMapping[str, Any]]] = []
+    seen: set[str] = set()
+    for index, deduplication_key in deduplication_keys.items():
+        message, project = messages[index]
+        if int(message["project_id"]) == settings.SENTRY_PROJECT:
+            metrics.incr("internal.captured.ingest_consumer.unparsed")
 
-        if data.get("type") == "transaction":
-            # No need for preprocess/process for transactions thus submit
-            # directly transaction specific save_event task.
-            save_event_transaction.delay(
-                cache_key=cache_key,
-                data=None,
-                start_time=start_time,
-                event_id=event_id,
-                project_id=project_id,
+        # The same event can be contained in a batch more than once, if it was
+        # sent to Kafka twice.
+        if deduplication_key in cached or deduplication_key in seen:
+            _log_duplicate(message)
+            continue
+
+        try:
+            data = _parse_event(message, project)
+            if data is not None:
+                # ex: missing event_id in message["payload"], which would fail
+                # the whole batch when storing it.
+                cache_key_for_event(data)
+        except Exception as exc:
+            errors[index] = exc
+            continue
+
+        if data is not None:
+            seen.add(deduplication_key)
+            events.append((index, data))
+
+    metrics.distribution("ingest_consumer.process_event_batch.size", len(messages))
+    metrics.distribution("ingest_consumer.process_event_batch.events", len(events))
+
+    processed: dict[str, str] = {}
+    try:
+        if reprocess_only_stuck_events:
+            events = [
+                (index, data) for index, data in events if event_processing_store.exists(data)
+            ]
+
+        with metrics.timer("ingest_consumer._store_event_batch"):
+            cache_keys = event_processing_store.store_many(
+                [data for _, data in events],
+                raw_payloads=[messages[index][0]["payload"] for index, _ in events],
             )
 
-            try:
-                collect_span_metrics(project, data)
-            except Exception:
-                pass
-        elif data.get("type") == "feedback":
-            if not is_in_feedback_denylist(project.organization):
-                save_event_feedback.delay(
-                    cache_key=None,  # no need to cache as volume is low
-                    data=data,
-                    start_time=start_time,
-                    event_id=event_id,
-                    project_id=project_id,
-                )
-            else:
-                metrics.incr("feedback.ingest.filtered", tags={"reason": "org.denylist"})
-        else:
-            # Preprocess this event, which spawns either process_event or
-            # save_event. Pass data explicitly to avoid fetching it again from the
-            # cache.
-            with sentry_sdk.start_span(op="ingest_consumer.process_event.preprocess_event"):
-                preprocess_event(
-                    cache_key=cache_key,
+        with celery_app.producer_or_acquire() as producer:
+            for (index, data), cache_key in zip(events, cache_keys):
+                message, project = messages[index]
+                try:
+                    _dispatch_event(message, project, data, cache_key, producer=producer)
+                except KeyError as exc:  # ex: missing event_id in message["payload"]
+                    errors[index] = exc
+                    continue
+
+                processed[deduplication_keys[index]] = ""
+                event_accepted.send_robust(
+                    ip=message.get("remote_addr"),
                     data=data,
-                    start_time=start_time,
-                    event_id=event_id,
                     project=project,
-                    has_attachments=bool(attachments),
+                    sender=process_event,
                 )
-
-        # remember for an 1 hour that we saved this event (deduplication protection)
-        cache.set(deduplication_key, "", CACHE_TIMEOUT)
-
-        # emit event_accepted once everything is done
-        event_accepted.send_robust(ip=remote_addr, data=data, project=project, sender=process_event)
     except Exception as exc:
-        if isinstance(exc, KeyError):  # ex: missing event_id in message["payload"]
-            raise
         raise Retriable(exc)
+    finally:
+        # remember for an 1 hour that we saved these events (deduplication protection),
+        # also if the batch is retried.
+        if processed:
+            cache.set_many(processed, CACHE_TIMEOUT)
+
+    return errors
 
 
 @trace_func(name="ingest_consumer.process_attachment_chunk")
@@ -3,16 +3,45 @@ import logging
 import msgpack
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.dlq import InvalidMessage
+from arroyo.processing.strategies.batching import ValuesBatch
 from arroyo.types import BrokerValue, Message
 
 from sentry.models.project import Project
 from sentry.utils import metrics
 
-from .processors import IngestMessage, Retriable, process_event
+from .processors import IngestMessage, Retriable, process_event, process_event_batch
 
 logger = logging.getLogger(__name__)
 
 
+def _decode_simple_event_message(
+    raw_payload: bytes, consumer_type: str
+) -> tuple[IngestMessage, Project] | None:
+    metrics.distribution(
+        "ingest_consumer.payload_size",
+        len(raw_payload),
+        tags={"consumer": consumer_type},
+        unit="byte",
+    )
+
+    message: IngestMessage = msgpack.unpackb(raw_payload, use_list=False)
+
+    message_type = message["type"]
+    project_id = message["project_id"]
+
+    if message_type != "event":
+        raise ValueError(f"Unsupported message type: {message_type}")
+
+    try:
+        with metrics.timer("ingest_consumer.fetch_project"):
+            project = Project.objects.get_from_cache(id=project_id)
+    except Project.DoesNotExist:
+        logger.exception("Project for ingested event does not exist: %s", project_id)
+        return None
+
+    return message, project
+
+
 def process_simple_event_message(
     raw_message: Message[KafkaPayload], consumer_type: str, reprocess_only_stuck_events: bool
 ) -> None:
@@ -30,30 +59,12 @@ def process_simple_event_message(
       `symbolicate_event` or `process_event`.
     """
 
-    raw_payload = raw_message.payload.value
-    metrics.distribution(
-        "ingest_consumer.payload_size",
-        len(raw_payload),
-        tags={"consumer": consumer_type},
-        unit="byte",
-    )
-
     try:
-        message: IngestMessage = msgpack.unpackb(raw_payload, use_list=False)
-
-        message_type = message["type"]
-        project_id = message["project_id"]
-
-        if message_type != "event":
-            raise ValueError(f"Unsupported message type: {message_type}")
-
-        try:
-            with metrics.timer("ingest_consumer.fetch_project"):
-                project = Project.objects.get_from_cache(id=project_id)
-        except Project.DoesNotExist:
-            logger.exception("Project for ingested event does not exist: %s", project_id)
+        decoded = _decode_simple_event_message(raw_message.payload.value, consumer_type)
+        if decoded is None:
             return
 
+        message, project = decoded
         return process_event(message, project, reprocess_only_stuck_events)
 
     except Exception as exc:
@@ -64,3 +75,49 @@ def process_simple_event_message(
         raw_value = raw_message.value
         assert isinstance(raw_value, BrokerValue)
         raise InvalidMessage(raw_value.partition, raw_value.offset) from exc
+
+
+def process_simple_event_batch(
+    raw_messages: Message[ValuesBatch[KafkaPayload]],
+    consumer_type: str,
+    reprocess_only_stuck_events: bool,
+) -> list[Message[None | InvalidMessage]]:
+    """
+    Processes a batch of Kafka Messages containing "simple" Event payloads,
+    like `process_simple_event_message` but with `process_event_batch`.
+
+    Returns one message per input message, which carries an `InvalidMessage`
+    if the message should be put into the DLQ. `Retriable` errors are raised
+    for the whole batch.
+    """
+    values: list[BrokerValue[KafkaPayload]] = []
+    errors: list[Exception | None] = []
+    decoded: list[tuple[int, tuple[IngestMessage, Project]]] = []
+
+    for value in raw_messages.payload:
+        assert isinstance(value, BrokerValue)
+        values.append(value)
+        errors.append(None)
+        try:
+            result = _decode_simple_event_message(value.payload.value, consumer_type)
+        except Exception as exc:
+            errors[-1] = exc
+            continue
+        if result is not None:
+            decoded.append((len(values) - 1, result))
+
+    batch_errors = process_event_batch(
+        [result for _, result in decoded], reprocess_only_stuck_events
+    )
+    for (index, _), error in zip(decoded, batch_errors):
+        errors[index] = error
+
+    results: list[Message[None | InvalidMessage]] = []
+    for value, error in zip(values, errors):
+        if error is None:
+            results.append(Message(value.replace(None)))
+        else:
+            invalid = InvalidMessage(value.partition, value.offset)
+            invalid.__cause__ = error
+            results.append(Message(value.replace(invalid)))
+    return results
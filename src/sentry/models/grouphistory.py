@@ -284,9 +284,12 @@ def record_group_history(
     release: Optional["Release"] = None,
 ):
     from sentry.models.team import Team
+    from sentry.search.snuba.result_cache import invalidate_group_search_results
     from sentry.users.models.user import User
     from sentry.users.services.user import RpcUser
 
+    invalidate_group_search_results([group])
+
     prev_history = get_prev_history(group, status)
     user_id = None
     team_id = None
@@ -318,9 +321,12 @@ def bulk_record_group_history(
     release: Optional["Release"] = None,
 ):
     from sentry.models.team import Team
+    from sentry.search.snuba.result_cache import invalidate_group_search_results
     from sentry.users.models.user import User
     from sentry.users.services.user import RpcUser
 
+    invalidate_group_search_results(groups)
+
     def get_prev_history_date(group, status):
         prev_history = get_prev_history(group, status)
         return prev_history.date_added if prev_history else None
@@ -12,6 +12,7 @@ from sentry import analytics
 from sentry.backup.scopes import RelocationScope
 from sentry.db.models import FlexibleForeignKey, JSONField, Model, region_silo_model, sane_repr
 from sentry.models.organization import Organization
+from sentry.ownership.compiled import memoize_schema_digest
 from sentry.ownership.grammar import convert_codeowners_syntax, create_schema_from_issue_owners
 from sentry.utils.cache import cache
 
@@ -60,6 +61,8 @@ class ProjectCodeOwners(Model):
         if code_owners is None:
             query = self.objects.filter(project_id=project_id).order_by("-date_added") or ()
             code_owners = self.merge_code_owners_list(code_owners_list=query) if query else query
+            if code_owners:
+                memoize_schema_digest(code_owners)
             cache.set(cache_key, code_owners, READ_CACHE_DURATION)
 
         return code_owners or None
@@ -17,6 +17,7 @@ from sentry.eventstore.models import Event, GroupEvent
 from sentry.models.activity import Activity
 from sentry.models.group import Group
 from sentry.models.groupowner import OwnerRuleType
+from sentry.ownership.compiled import get_compiled_rules, get_schema_digest, memoize_schema_digest
 from sentry.ownership.grammar import Matcher, Rule, load_schema, resolve_actors
 from sentry.types.activity import ActivityType
 from sentry.types.actor import Actor
@@ -99,6 +100,7 @@ class ProjectOwnership(Model):
         if ownership is None:
             try:
                 ownership = cls.objects.get(project_id=project_id)
+                memoize_schema_digest(ownership)
             except cls.DoesNotExist:
                 ownership = False
             cache.set(cache_key, ownership, READ_CACHE_DURATION)
@@ -125,7 +127,17 @@ class ProjectOwnership(Model):
             ownership = cls(project_id=project_id)
 
         codeowners = ProjectCodeOwners.get_codeowners_cached(project_id)
+        combined_digest = None
+        if codeowners and codeowners.schema:
+            # The combined schema is rebuilt on every call, so derive its
+            # digest from the memoized digests of both parts.
+            combined_digest = get_schema_digest(
+                [memoize_schema_digest(codeowners), memoize_schema_digest(ownership)]
+            )
+
         ownership.schema = cls.get_combined_schema(ownership, codeowners)
+        if combined_digest is not None:
+            memoize_schema_digest(ownership, combined_digest)
 
         rules = cls._matching_ownership_rules(ownership, data)
 
@@ -361,6 +373,10 @@ class ProjectOwnership(Model):
     ) -> Sequence[Rule]:
         rules = []
         if ownership.schema is not None:
+            if options.get("ownership.compiled_rules"):
+                digest = memoize_schema_digest(ownership)
+                return get_compiled_rules(ownership.schema, digest).match(data)
+
             munged_data = None
             if options.get("ownership.munge_data_for_performance"):
                 munged_data = Matcher.munge_if_needed(data)
@@ -375,6 +391,9 @@ def process_resource_change(instance, change, **kwargs):
     from sentry.models.groupowner import GroupOwner
     from sentry.models.projectownership import ProjectOwnership
 
+    if change == "updated" and instance.schema is not None:
+        # The schema may have been changed in place, don't reuse a memoized digest.
+        memoize_schema_digest(instance, get_schema_digest(instance.schema))
     cache.set(
         ProjectOwnership.get_cache_key(instance.project_id),
         instance if change == "updated" else None,
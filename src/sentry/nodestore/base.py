@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import atexit
+import random
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from threading import local
-from typing import Any
+from typing import Any, TypeVar
 
 import sentry_sdk
 from django.core.cache import BaseCache, InvalidCacheBackendError, caches
 from django.utils.functional import cached_property
 
 from sentry import options
+from sentry.eventstore import compressor
 from sentry.utils import json, metrics
 from sentry.utils.services import Service
 
@@ -28,6 +32,33 @@ json_dumps = json.JSONEncoder(
 
 json_loads = json.loads
 
+# Prefix of the node ids under which deduplicated interfaces are stored. md5
+# checksums are 32 characters long, which keeps blob ids within the 40
+# characters the django backend allows.
+DEDUPLICATED_BLOB_PREFIX = "dedup-"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Bounds the number of threads that decompress and decode nodes in
+# `get_multi`. Shared by all (thread-local) nodestore instances.
+_multi_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="nodestore-multi")
+
+atexit.register(_multi_pool.shutdown, False)
+
+
+def map_multi(fn: Callable[[T], R], items: Mapping[str, T]) -> dict[str, R]:
+    """
+    Apply `fn` to every value of `items`. Batches of at least
+    `nodestore.get-multi.parallel-threshold` items are processed on a bounded
+    thread pool, smaller batches (or a threshold of 0) run serially.
+    """
+    threshold = options.get("nodestore.get-multi.parallel-threshold")
+    if not threshold or len(items) < threshold:
+        return {id: fn(value) for id, value in items.items()}
+
+    return dict(zip(items.keys(), _multi_pool.map(fn, items.values())))
+
 
 class NodeStorage(local, Service):
     """
@@ -62,6 +93,15 @@ class NodeStorage(local, Service):
 
     This is used in reprocessing to store a snapshot of the event from multiple
     stages of the pipeline.
+
+    Additionally, interfaces that repeat across many events (`debug_meta`
+    images, SDK modules, stable contexts) can be moved out of the main payload
+    and stored once under a content-addressed id, see
+    `sentry.eventstore.compressor`. This is controlled by the
+    `nodestore.deduplicate-interfaces.rate` option and is transparent to
+    callers of `get`, `get_multi` and `set_subkeys`. Shared blobs are never
+    deleted together with the nodes that reference them, they expire through
+    the backend's TTL or `cleanup` instead.
     """
 
     __all__ = (
@@ -150,6 +190,7 @@ class NodeStorage(local, Service):
             bytes_data = self._get_bytes(id)
             rv = self._decode(bytes_data, subkey=subkey)
             if subkey is None:
+                rv = self._assemble({id: rv})[id]
                 # set cache item only after we know decoding did not fail
                 self._set_cache_item(id, rv)
 
@@ -193,13 +234,19 @@ class NodeStorage(local, Service):
             else:
                 uncached_ids = id_list
 
-            with sentry_sdk.start_span(op="nodestore._get_bytes_multi_and_decode") as span:
-                items = {
-                    id: self._decode(value, subkey=subkey)
-                    for id, value in self._get_bytes_multi(uncached_ids).items()
-                }
+            backend = type(self).__name__
+            with sentry_sdk.start_span(op="nodestore._get_bytes_multi_and_decode"):
+                with metrics.timer("nodestore.get_multi.get_bytes", tags={"backend": backend}):
+                    bytes_items = self._get_bytes_multi(uncached_ids)
+                with metrics.timer("nodestore.get_multi.decode", tags={"backend": backend}):
+                    items = map_multi(lambda value: self._decode(value, subkey=subkey), bytes_items)
+            metrics.distribution(
+                "nodestore.get_multi.num_ids", len(uncached_ids), tags={"backend": backend}
+            )
             if subkey is None:
-                self._set_cache_items(items)
+                items = self._assemble(items)
+                # Only fill the cache with nodes that exist, same as `_set_cache_item`.
+                self._set_cache_items({id: value for id, value in items.items() if value})
                 items.update(cache_items)
 
             span.set_tag("result", "from_service")
@@ -261,12 +308,123 @@ class NodeStorage(local, Service):
         {'foo': 'bam'}
         """
         cache_item = data.get(None)
+        if random.random() < options.get("nodestore.deduplicate-interfaces.rate"):
+            data = self._deduplicate(data, ttl=ttl)
         bytes_data = self._encode(data)
         self.set_bytes(item_id, bytes_data, ttl=ttl)
         # set cache only after encoding and write to nodestore has succeeded
         if options.get("nodestore.set-subkeys.enable-set-cache-item"):
             self._set_cache_item(item_id, cache_item)
 
+    def _deduplicate(
+        self, data: dict[str | None, Mapping[str, Any]], ttl: timedelta | None = None
+    ) -> dict[str | None, Mapping[str, Any]]:
+        """
+        Move repeating interfaces out of the default subkey and store them as
+        shared blobs. Returns the data that should be written for the node
+        itself.
+        """
+        payload = data.get(None)
+        if not isinstance(payload, dict):
+            return data
+
+        payload, blobs = compressor.deduplicate(payload)
+        if not blobs:
+            return data
+
+        self._set_blobs(blobs, ttl=ttl)
+        return {**data, None: payload}
+
+    @sentry_sdk.tracing.trace
+    def _set_blobs(self, blobs: Mapping[str, Any], ttl: timedelta | None = None) -> None:
+        blob_ids = {
+            f"{DEDUPLICATED_BLOB_PREFIX}{checksum}": blob for checksum, blob in blobs.items()
+        }
+
+        # Writes of blobs that were written recently are skipped. This is
+        # tracked with separate markers that only writes set: the blob cache
+        # itself is also filled by reads, which would otherwise skip the
+        # write (and with it the refresh of the blob's TTL) indefinitely.
+        # Every blob that is still referenced is rewritten at least once per
+        # `blob_cache_ttl`, so it is kept that much longer than its nodes.
+        blob_cache_ttl = options.get("nodestore.deduplicate-interfaces.blob-cache-ttl")
+        if ttl is not None:
+            ttl += timedelta(seconds=blob_cache_ttl)
+
+        markers = {f"{id}:written": id for id in blob_ids}
+        recently_written = {markers[key] for key in self._get_cache_items(list(markers))}
+        metrics.incr(
+            "nodestore.deduplication.set_blob", amount=len(recently_written), tags={"cache": "hit"}
+        )
+
+        to_write = {id: blob for id, blob in blob_ids.items() if id not in recently_written}
+        metrics.incr(
+            "nodestore.deduplication.set_blob", amount=len(to_write), tags={"cache": "miss"}
+        )
+        for id, blob in to_write.items():
+            self.set_bytes(id, self._encode({None: blob}), ttl=ttl)
+
+        self._set_blob_cache_items(to_write)
+        if self.cache and to_write:
+            self.cache.set_many(
+                {key: True for key, id in markers.items() if id in to_write},
+                timeout=blob_cache_ttl,
+            )
+
+    @sentry_sdk.tracing.trace
+    def _get_blobs(self, checksums: set[str]) -> dict[str, Any]:
+        """
+        Read-through fetch of shared blobs, keyed by checksum.
+        """
+        blob_ids = [f"{DEDUPLICATED_BLOB_PREFIX}{checksum}" for checksum in checksums]
+        items = self._get_cache_items(blob_ids)
+        metrics.incr("nodestore.deduplication.get_blob", amount=len(items), tags={"cache": "hit"})
+
+        uncached_ids = [id for id in blob_ids if id not in items]
+        if uncached_ids:
+            metrics.incr(
+                "nodestore.deduplication.get_blob", amount=len(uncached_ids), tags={"cache": "miss"}
+            )
+            fetched = {
+                id: NodeStorage._decode(self, value, subkey=None)
+                for id, value in self._get_bytes_multi(uncached_ids).items()
+                if value is not None
+            }
+            self._set_blob_cache_items(fetched)
+            items.update(fetched)
+
+        return {id[len(DEDUPLICATED_BLOB_PREFIX) :]: blob for id, blob in items.items()}
+
+    def _assemble(self, items: dict[str, Any]) -> dict[str, Any]:
+        """
+        Reinsert shared blobs into payloads that were written by
+        `_deduplicate`. All blobs are fetched at once.
+        """
+        checksums = {
+            checksum
+            for value in items.values()
+            if isinstance(value, dict)
+            for checksum in compressor.get_checksums(value)
+        }
+        if not checksums:
+            return items
+
+        blobs = self._get_blobs(checksums)
+        missing = checksums - blobs.keys()
+        if missing:
+            metrics.incr("nodestore.deduplication.missing_blob", amount=len(missing))
+
+        def assemble(value: Any) -> Any:
+            if not isinstance(value, dict):
+                return value
+            # A node whose blobs are gone can't be restored, treat it as
+            # missing rather than returning it without those interfaces.
+            if missing.intersection(compressor.get_checksums(value)):
+                return None
+            return compressor.assemble(value, lambda _: blobs)
+
+        return {id: assemble(value) for id, value in items.items()}
+
     def cleanup(self, cutoff_timestamp: datetime) -> None:
         raise NotImplementedError
 
@@ -293,6 +451,12 @@ class NodeStorage(local, Service):
         if self.cache:
             self.cache.set_many(items)
 
+    def _set_blob_cache_items(self, items: dict[str, Any]) -> None:
+        if self.cache and items:
+            self.cache.set_many(
+                items, timeout=options.get("nodestore.deduplicate-interfaces.blob-cache-ttl")
+            )
+
     def _delete_cache_item(self, item_id: str) -> None:
         if self.cache:
             self.cache.delete(item_id)
@@ -9,7 +9,7 @@ from typing import Any
 from django.utils import timezone
 
 from sentry.db.models.query import create_or_update
-from sentry.nodestore.base import NodeStorage
+from sentry.nodestore.base import NodeStorage, map_multi
 from sentry.utils.strings import compress, decompress
 
 from .models import Node
@@ -46,7 +46,12 @@ class DjangoNodeStorage(NodeStorage):
             return None
 
     def _get_bytes_multi(self, id_list: list[str]) -> dict[str, bytes | None]:
-        return {n.id: decompress(n.data) for n in Node.objects.filter(id__in=id_list)}
+        # A single `IN` query, without instantiating models. Decompression
+        # happens outside of the query so that it can be parallelized.
+        rows = dict(Node.objects.filter(id__in=id_list).values_list("id", "data"))
+        rv: dict[str, bytes | None] = {id: None for id in id_list}
+        rv.update(map_multi(decompress, rows))
+        return rv
 
     def delete_multi(self, id_list: list[str]) -> None:
         Node.objects.filter(id__in=id_list).delete()
@@ -3,7 +3,7 @@ from datetime import datetime, timedelta, timezone
 
 from django.conf import settings
 
-from sentry.nodestore.base import NodeStorage
+from sentry.nodestore.base import NodeStorage, map_multi
 
 
 class FileSystemNodeStorage(NodeStorage):
@@ -26,6 +26,15 @@ class FileSystemNodeStorage(NodeStorage):
         with open(self.node_path(id), "rb") as file:
             return file.read()
 
+    def _get_bytes_multi(self, id_list: list[str]) -> dict[str, bytes | None]:
+        def _read(id: str) -> bytes | None:
+            try:
+                return self._get_bytes(id)
+            except FileNotFoundError:
+                return None
+
+        return map_multi(_read, {id: id for id in id_list})
+
     def _set_bytes(self, id: str, data: bytes, ttl: timedelta | None = None) -> None:
         with open(self.node_path(id), "wb") as file:
             file.write(data)
@@ -194,6 +194,11 @@ register(
     flags=FLAG_ALLOW_EMPTY | FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Digests
+# Number of scheduled digests that are delivered by a single task. Zero delivers
+# every digest with its own task.
+register("digests.delivery-batch-size", default=0, type=Int, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 # TOTP (Auth app)
 register(
     "totp.disallow-new-enrollment",
@@ -646,8 +651,17 @@ register("snuba.search.chunk-growth-rate", default=1.5, flags=FLAG_AUTOMATOR_MOD
 register("snuba.search.max-chunk-size", default=2000, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.search.max-total-chunk-time-seconds", default=30.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.search.hits-sample-size", default=100, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# How long issue search results are cached for, in seconds. `0` disables the cache.
+register("snuba.search.result-cache.ttl", default=0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.track-outcomes-sample-rate", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Number of consecutive past intervals of a TSDB rollup that distinct count
+# totals read from a single pre-merged HyperLogLog, `0` disables merging.
+register("tsdb.redis.distinct-counts.merge-span", default=0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Seconds a pre-merged HyperLogLog is kept, which bounds how long late writes
+# to past intervals are missing from distinct count totals.
+register("tsdb.redis.distinct-counts.merge-ttl", default=3600, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 # The percentage of tagkeys that we want to cache. Set to 1.0 in order to cache everything, <=0.0 to stop caching
 register(
     "snuba.tagstore.cache-tagkeys-rate",
@@ -719,6 +733,10 @@ register(
 # Killswitch to stop storing any reprocessing payloads.
 register("store.reprocessing-force-disable", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Compress event payloads in the processing store with zstd. All readers of the
+# store must have the configured compression dictionary before this is enabled.
+register("eventstore.processing.compress", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 register(
     "store.race-free-group-creation-force-disable", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE
 )
@@ -1024,6 +1042,13 @@ register(
     "store.symbolicate-event-lpq-rate", type=Float, default=1.0, flags=FLAG_AUTOMATOR_MODIFIABLE
 )
 
+# Rate at which events that need no symbolication are processed and saved by
+# the ingest consumer directly, instead of going through the `process_event`
+# and `save_event` queues.
+register(
+    "store.inline-pipeline-sample-rate", type=Float, default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE
+)
+
 register(
     "post_process.get-autoassign-owners", type=Sequence, default=[], flags=FLAG_AUTOMATOR_MODIFIABLE
 )
@@ -1033,6 +1058,21 @@ register(
     default=[],
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Paginate the combined alert rule index with keysets instead of offsets.
+register(
+    "api.alert-rule-index.keyset-pagination",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Run the Snuba queries of the group serializers on a worker pool, concurrently
+# with their Postgres lookups.
+register(
+    "api.group-serializer.concurrent-attrs",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "issues.severity.skip-seer-requests",
     type=Sequence,
@@ -1120,9 +1160,35 @@ register(
 # Controls whether generic inbound filters are sent to Relay.
 register("relay.emit-generic-inbound-filters", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Recompute only the affected sections of cached project configs for invalidation triggers
+# with known inputs, see `sentry.relay.config.TRIGGER_INPUTS`.
+register(
+    "relay.project-config.incremental-invalidation",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Store large project config sections as content-addressed blobs shared between configs.
+register(
+    "relay.projectconfig-cache.shared-blobs",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Fetch all cached project configs of a Relay request at once, skipping configs whose
+# revision Relay already has.
+register(
+    "relay.project-configs.bulk-fetch",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Write new kafka headers in eventstream
 register("eventstream:kafka-headers", default=True, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Publish the events saved together with a single bulk insert
+register("eventstream:insert-many", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 # Post process forwarder options
 # Gets data from Kafka headers
 register("post-process-forwarder:kafka-headers", default=True, flags=FLAG_AUTOMATOR_MODIFIABLE)
@@ -1297,6 +1363,27 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Enables the in-process cache tier in front of the shared cache of the caching indexer
+register(
+    "sentry-metrics.indexer.local-cache.enabled",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Enables caching of indexer resolve misses in the in-process cache tier
+register(
+    "sentry-metrics.indexer.local-cache.negative-resolve",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Enables caching of indexer reverse resolves in the shared cache
+register(
+    "sentry-metrics.indexer.reverse-resolve-cache",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Option to control sampling percentage of schema validation on the generic metrics pipeline
 # based on namespace.
 register(
@@ -1328,6 +1415,20 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Fraction of a limit that every process leases from the Redis rate limiter at
+# once and admits locally, `0.0` disables leasing.
+register("ratelimits.redis.lease-fraction", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Upper bound of the tokens in a single lease of the Redis rate limiter.
+register("ratelimits.redis.lease-max-size", default=100, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Check and use sliding window quotas in a single pipeline, giving back what was
+# not granted afterwards, instead of a check followed by a separate use.
+register(
+    "ratelimits.sliding-windows.combined-check-and-use",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Global and per-organization limits on the writes to the string indexer's DB.
 #
 # Format is a list of dictionaries of format {
@@ -1496,6 +1597,14 @@ register(
 
 # Performance issue option for *all* performance issues detection
 register("performance.issues.all.problem-detection", default=1.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Index the spans of an event by op once, so that detectors only visit the spans
+# of the ops they look at.
+register(
+    "performance.issues.span-op-index.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Individual system-wide options in case we need to turn off specific detectors for load concerns, ignoring the set project options.
 register(
@@ -1933,6 +2042,30 @@ register("txnames.bump-lifetime-sample-rate", default=0.1, flags=FLAG_AUTOMATOR_
 register(
     "nodestore.set-subkeys.enable-set-cache-item", default=True, flags=FLAG_AUTOMATOR_MODIFIABLE
 )
+# Rate of writes that store repeating interfaces (debug_meta, modules, ...)
+# once as shared blobs instead of inline with every event.
+register("nodestore.deduplicate-interfaces.rate", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Minimum number of nodes fetched by `get_multi` at which decompression and
+# decoding run on a thread pool. 0 disables parallel decoding.
+register("nodestore.get-multi.parallel-threshold", default=0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# How long (in seconds) shared blobs stay in the nodedata cache. Repeated
+# writes of a blob within this window are skipped, and blobs are stored this
+# much longer than the nodes that reference them. Must stay well below the
+# nodestore retention.
+register(
+    "nodestore.deduplicate-interfaces.blob-cache-ttl",
+    default=60 * 60,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Buffer an increment of `RedisBuffer` with a single Lua script call instead of
+# a pipeline.
+register("buffer.redis.lua-incr", type=Bool, default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Window (in seconds) in which increments of the same model and filters are
+# summed up in-process before they are sent to Redis. 0 disables coalescing.
+register("buffer.redis.coalesce-window", type=Float, default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Read and delete all keys of a `process_incr` batch in one pipeline.
+register("buffer.redis.batch-process", type=Bool, default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
 # === Backpressure related runtime options ===
 
@@ -2377,6 +2510,18 @@ register(
     default=0.0,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Cache frame modifications of `Enhancements.apply_modifications_to_frame` across events
+register(
+    "grouping.enhancer.modifications-cache.enabled",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Cache message parameterization results across events
+register(
+    "grouping.parameterization.result-cache.enabled",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "metrics.sample-list.sample-rate",
     type=Float,
@@ -2484,6 +2629,30 @@ register(
     default=300,  # 5 minutes
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Store the spans of a segment length-prefixed in one list element per write
+# and stream segments out of the buffer page by page.
+register(
+    "standalone-spans.buffer-segment-assembly.enable",
+    type=Bool,
+    default=False,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Segments in assembly mode that are larger than this are evicted without
+# being read. 0 disables the limit.
+register(
+    "standalone-spans.buffer-max-segment-bytes",
+    type=Int,
+    default=10 * 1000 * 1000,  # 10 MB
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Segments that are older than this when they are flushed are evicted instead.
+# 0 disables the limit.
+register(
+    "standalone-spans.buffer-max-segment-age.seconds",
+    type=Int,
+    default=0,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "standalone-spans.detect-performance-issues-consumer.enable",
     default=True,
@@ -2702,6 +2871,21 @@ register(
     default=10000,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Process the due projects of an organization together and share identical
+# condition queries between them.
+register(
+    "delayed_processing.share_organization_queries",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# How long (in seconds) to reuse the counts of a condition query for a group
+# within the same minute. 0 disables the cache.
+register(
+    "delayed_processing.window_count_cache_ttl",
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 register(
     "grouping.grouphash_metadata.ingestion_writes_enabled",
@@ -2727,6 +2911,13 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Match ownership rules through `sentry.ownership.compiled` instead of testing every rule.
+register(
+    "ownership.compiled_rules",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Restrict uptime issue creation for specific host provider identifiers. Items
 # in this list map to the `host_provider_id` column in the UptimeSubscription
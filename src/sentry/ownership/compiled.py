@@ -0,0 +1,235 @@
+"""
+Compiled form of an ownership schema that finds all matching rules of an event
+without testing every rule against every frame.
+
+Every path, codeowners and module rule is indexed by the longest literal part of
+its pattern, a string that any matching frame value has to contain. A trie of
+those literals is scanned once per frame value, and only the rules whose
+literal was found (plus rules that cannot be indexed) are then tested with the
+regular `Rule.test`. Results are therefore exactly those of testing every rule
+in order.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from cachetools import LRUCache
+
+from sentry.ownership.grammar import CODEOWNERS, MODULE, PATH, Matcher, Rule, load_schema
+from sentry.utils import json, metrics
+from sentry.utils.event_frames import find_stack_frames
+from sentry.utils.safe import PathSearchable
+
+__all__ = ("CompiledRules", "get_compiled_rules", "get_schema_digest", "memoize_schema_digest")
+
+INDEXED_TYPES = (PATH, CODEOWNERS, MODULE)
+
+# Characters that separate the literal parts of a pattern. Path separators are
+# included because they are normalized before matching.
+_SEPARATORS = frozenset("*?/")
+
+# Key of the rule indices in a trie node. Not a valid character, so it cannot
+# clash with the children of the node.
+_RULES = ""
+
+_Trie = dict[str, Any]
+
+_cache: LRUCache[str, CompiledRules] = LRUCache(maxsize=256)
+_cache_lock = threading.Lock()
+
+
+def get_required_literal(pattern: str) -> str | None:
+    """
+    Returns the longest lowercased literal part of `pattern` that every value
+    matched by the pattern contains, or `None` if there is no such part that
+    can be used safely.
+
+    >>> get_required_literal("src/sentry/*.py")
+    'sentry'
+    """
+    if "\\" in pattern:
+        # Escapes have surprising semantics in codeowners, don't index them.
+        return None
+
+    literals = []
+    current: list[str] = []
+    closing_bracket = None
+    for char in pattern:
+        if closing_bracket is not None:
+            if char == closing_bracket:
+                closing_bracket = None
+            continue
+
+        if char in "[{":
+            closing_bracket = "]" if char == "[" else "}"
+        elif char not in _SEPARATORS:
+            current.append(char)
+            continue
+
+        literals.append("".join(current))
+        current = []
+    literals.append("".join(current))
+
+    if closing_bracket is not None:
+        return None
+
+    # Case-insensitive matching is only well-defined for ASCII here.
+    literals = [literal for literal in literals if literal.isascii() and literal.strip(".")]
+    if not literals:
+        return None
+
+    return max(literals, key=len).lower()
+
+
+class CompiledRules:
+    """
+    All rules of an ownership schema, indexed by the literal parts of their
+    patterns. Use `get_compiled_rules` to share compiled rules between events.
+    """
+
+    def __init__(self, rules: Sequence[Rule]):
+        self.rules = list(rules)
+        self._unindexed: list[int] = []
+        self._indexed: dict[str, list[int]] = {}
+        self._tries: dict[str, _Trie] = {}
+
+        for idx, rule in enumerate(self.rules):
+            literal = None
+            if rule.matcher.type in INDEXED_TYPES:
+                literal = get_required_literal(rule.matcher.pattern)
+
+            if literal is None:
+                self._unindexed.append(idx)
+                continue
+
+            self._indexed.setdefault(rule.matcher.type, []).append(idx)
+            node = self._tries.setdefault(rule.matcher.type, {})
+            for char in literal:
+                node = node.setdefault(char, {})
+            node.setdefault(_RULES, []).append(idx)
+
+    def match(self, data: Mapping[str, Any]) -> list[Rule]:
+        """
+        Returns all rules matching the event `data`, in rule order.
+        """
+        munged_data = Matcher.munge_if_needed(data)
+
+        candidates = set(self._unindexed)
+        for type, trie in self._tries.items():
+            values = _get_frame_values(type, data, munged_data)
+            if values is None:
+                candidates.update(self._indexed[type])
+            else:
+                candidates.update(_scan(trie, values))
+
+        metrics.distribution("ownership.compiled_rules.candidates", len(candidates))
+
+        return [
+            self.rules[idx] for idx in sorted(candidates) if self.rules[idx].test(data, munged_data)
+        ]
+
+
+def _get_frame_values(
+    type: str,
+    data: PathSearchable,
+    munged_data: tuple[Sequence[Mapping[str, Any]], Sequence[str]],
+) -> set[str] | None:
+    """
+    Returns the lowercased values `Matcher.test_frames` would test for rules of
+    the given type, or `None` if some value is not a string.
+    """
+    if type == MODULE:
+        frames, keys = find_stack_frames(data), ["module"]
+    else:
+        frames, keys = munged_data
+
+    values = set()
+    for frame in frames:
+        if not isinstance(frame, Mapping):
+            continue
+        if type == CODEOWNERS and frame.get("in_app") is False:
+            continue
+
+        for key in keys:
+            value = frame.get(key)
+            if not value:
+                continue
+            if not isinstance(value, str):
+                return None
+            values.add(value.lower())
+
+    return values
+
+
+def _scan(trie: _Trie, values: Iterable[str]) -> set[int]:
+    """
+    Returns the rule indices of all literals in `trie` that occur in any of
+    `values`.
+    """
+    found = set()
+    for value in values:
+        length = len(value)
+        for start in range(length):
+            node = trie
+            for end in range(start, length):
+                node = node.get(value[end])
+                if node is None:
+                    break
+                if _RULES in node:
+                    found.update(node[_RULES])
+    return found
+
+
+def get_schema_digest(schema: Any) -> str:
+    return hashlib.md5(json.dumps(schema).encode("utf-8")).hexdigest()
+
+
+def memoize_schema_digest(instance: Any, digest: str | None = None) -> str | None:
+    """
+    Returns the digest of the `schema` of an ownership or codeowners instance,
+    memoized on the instance, or `None` if it has no schema. Pass `digest` to
+    memoize a digest computed some other way.
+
+    The digest is memoized together with the schema it belongs to, so assigning
+    a new schema invalidates it. Both are pickled with the instance, so
+    instances read back from the cache don't serialize their schema again.
+    """
+    schema = instance.schema
+    if schema is None:
+        return None
+
+    memoized = getattr(instance, "_schema_digest", None)
+    if digest is None and memoized is not None and memoized[0] is schema:
+        return memoized[1]
+
+    if digest is None:
+        digest = get_schema_digest(schema)
+    instance._schema_digest = (schema, digest)
+    return digest
+
+
+def get_compiled_rules(schema: Mapping[str, Any], digest: str | None = None) -> CompiledRules:
+    """
+    Returns the compiled rules of an ownership schema. Compiled rules are cached
+    per process by the digest of the schema, see `memoize_schema_digest`.
+    """
+    cache_key = digest if digest is not None else get_schema_digest(schema)
+
+    with _cache_lock:
+        compiled = _cache.get(cache_key)
+
+    if compiled is not None:
+        metrics.incr("ownership.compiled_rules.cache", tags={"result": "hit"})
+        return compiled
+
+    metrics.incr("ownership.compiled_rules.cache", tags={"result": "miss"})
+    compiled = CompiledRules(load_schema(schema))
+
+    with _cache_lock:
+        _cache[cache_key] = compiled
+
+    return compiled
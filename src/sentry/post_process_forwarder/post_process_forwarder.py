@@ -1,14 +1,18 @@
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from arroyo.backends.kafka import KafkaPayload
 from arroyo.processing.strategies import (
     CommitOffsets,
     ProcessingStrategy,
     ProcessingStrategyFactory,
+    RunTask,
     RunTaskInThreads,
 )
+from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.types import Commit, Message, Partition
 
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
@@ -22,6 +26,18 @@ class PostProcessForwarderStrategyFactory(ProcessingStrategyFactory[KafkaPayload
     def _dispatch_function(message: Message[KafkaPayload]) -> None:
         raise NotImplementedError()
 
+    @staticmethod
+    @abstractmethod
+    def _dispatch_batch_function(
+        message: Message[ValuesBatch[KafkaPayload]], executor: ThreadPoolExecutor
+    ) -> None:
+        """
+        Dispatches a batch of messages, using `executor` to dispatch
+        concurrently. Must only return once all messages were dispatched, as
+        the batch is committed afterwards.
+        """
+        raise NotImplementedError()
+
     def __init__(
         self,
         mode: str,
@@ -40,6 +56,11 @@ class PostProcessForwarderStrategyFactory(ProcessingStrategyFactory[KafkaPayload
         self.concurrency = concurrency
         self.max_pending_futures = concurrency + 1000
         self.pool = MultiprocessingPool(num_processes)
+        self.executor: ThreadPoolExecutor | None = None
+        if mode == "batched":
+            self.executor = ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="post-process-forwarder"
+            )
 
     def create_with_partitions(
         self,
@@ -65,8 +86,21 @@ class PostProcessForwarderStrategyFactory(ProcessingStrategyFactory[KafkaPayload
                 input_block_size=self.input_block_size,
                 output_block_size=self.output_block_size,
             )
+        elif self.mode == "batched":
+            logger.info("Starting batched post process forwarder")
+            assert self.executor is not None
+            return BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=RunTask(
+                    function=partial(self._dispatch_batch_function, executor=self.executor),
+                    next_step=CommitOffsets(commit),
+                ),
+            )
         else:
             raise ValueError(f"Invalid mode {self.mode}")
 
     def shutdown(self) -> None:
         self.pool.close()
+        if self.executor is not None:
+            self.executor.shutdown()
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import logging
+import threading
+from dataclasses import dataclass
 from time import time
 from typing import TYPE_CHECKING, Any
 
+from cachetools import LRUCache
 from django.conf import settings
 from redis.exceptions import RedisError
 
+from sentry import options
 from sentry.exceptions import InvalidConfiguration
 from sentry.ratelimits.base import RateLimiter
-from sentry.utils import redis
+from sentry.utils import metrics, redis
 from sentry.utils.hashlib import md5_text
 
 if TYPE_CHECKING:
@@ -28,10 +32,45 @@ def _bucket_start_time(bucket_number: int, window: int) -> int:
     return bucket_number * window
 
 
+# Maximum number of rate limit keys with a local lease per process.
+LEASES_MAX_SIZE = 10_000
+
+
+@dataclass
+class _Lease:
+    """
+    Tokens of one time bucket that this process leased from the shared counter.
+    """
+
+    bucket: int
+    # Value of the shared counter before this lease.
+    base: int
+    granted: int
+    # Whether the shared counter was exhausted when leasing, no further lease
+    # is taken in this bucket then.
+    exhausted: bool
+    used: int = 0
+
+
 class RedisRateLimiter(RateLimiter):
+    """
+    Fixed window rate limiter on a shared Redis counter per key and window.
+
+    With `ratelimits.redis.lease-fraction` set, every process leases tokens
+    from the shared counter in chunks of that fraction of the limit and
+    admits requests from its lease without a round trip. Leases never exceed
+    the limit, so a key is never over-admitted, but tokens leased by one
+    process are unavailable to others until the window rolls. The fraction
+    bounds the tokens each process can hold back.
+    """
+
     def __init__(self, **options: Any) -> None:
         cluster_key = settings.SENTRY_RATE_LIMIT_REDIS_CLUSTER
         self.client = redis.redis_clusters.get(cluster_key)
+        self._leases: LRUCache[tuple[str, int | None, int], _Lease] = LRUCache(
+            maxsize=LEASES_MAX_SIZE
+        )
+        self._leases_lock = threading.Lock()
 
     def _construct_redis_key(
         self,
@@ -102,11 +141,23 @@ class RedisRateLimiter(RateLimiter):
         request_time = time()
         if window is None or window == 0:
             window = self.window
-        redis_key = self._construct_redis_key(key, project=project, window=window)
+        redis_key = self._construct_redis_key(
+            key, project=project, window=window, request_time=request_time
+        )
 
         expiration = window - int(request_time % window)
         # Reset Time = next time bucket's start time
         reset_time = _bucket_start_time(_time_bucket(request_time, window) + 1, window)
+
+        lease_size = min(
+            int(limit * options.get("ratelimits.redis.lease-fraction")),
+            options.get("ratelimits.redis.lease-max-size"),
+        )
+        if lease_size > 1:
+            return self._is_limited_with_lease(
+                key, limit, project, window, request_time, redis_key, lease_size, reset_time
+            )
+
         try:
             pipe = self.client.pipeline()
             pipe.incr(redis_key)
@@ -120,3 +171,54 @@ class RedisRateLimiter(RateLimiter):
             return False, 0, reset_time
 
         return result > limit, result, reset_time
+
+    def _is_limited_with_lease(
+        self,
+        key: str,
+        limit: int,
+        project: Project | None,
+        window: int,
+        request_time: float,
+        redis_key: str,
+        lease_size: int,
+        reset_time: int,
+    ) -> tuple[bool, int, int]:
+        bucket = _time_bucket(request_time, window)
+        lease_key = (key, project.id if project is not None else None, window)
+
+        with self._leases_lock:
+            lease = self._leases.get(lease_key)
+            if lease is not None and lease.bucket != bucket:
+                # The window rolled, whatever is left of the lease is lost.
+                metrics.distribution(
+                    "ratelimits.redis.lease.unused", max(lease.granted - lease.used, 0)
+                )
+                lease = None
+            if lease is not None and (lease.used < lease.granted or lease.exhausted):
+                lease.used += 1
+                metrics.incr("ratelimits.redis.lease", tags={"result": "local"}, sample_rate=0.01)
+                return lease.used > lease.granted, lease.base + lease.used, reset_time
+
+        try:
+            pipe = self.client.pipeline()
+            pipe.incrby(redis_key, lease_size)
+            pipe.expire(redis_key, window - int(request_time % window))
+            leased = pipe.execute()[0]
+        except RedisError:
+            logger.exception("Failed to lease rate limit tokens from redis")
+            return False, 0, reset_time
+
+        base = leased - lease_size
+        granted = max(min(lease_size, limit - base), 0)
+        metrics.incr(
+            "ratelimits.redis.lease",
+            tags={"result": "leased" if granted else "exhausted"},
+        )
+        metrics.distribution("ratelimits.redis.lease.size", granted)
+
+        lease = _Lease(
+            bucket=bucket, base=base, granted=granted, exhausted=granted < lease_size, used=1
+        )
+        with self._leases_lock:
+            self._leases[lease_key] = lease
+        return lease.used > lease.granted, lease.base + lease.used, reset_time
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections import defaultdict
+from collections.abc import MutableMapping, Sequence
+from time import time
 from typing import Any
 
 from sentry_redis_tools.clients import RedisCluster, StrictRedis
@@ -10,8 +12,9 @@ from sentry_redis_tools.sliding_windows_rate_limiter import (
 )
 from sentry_redis_tools.sliding_windows_rate_limiter import RequestedQuota, Timestamp
 
+from sentry import options
 from sentry.exceptions import InvalidConfiguration
-from sentry.utils import redis
+from sentry.utils import metrics, redis
 from sentry.utils.services import Service
 
 __all__ = ["Quota", "GrantedQuota", "RequestedQuota", "Timestamp"]
@@ -158,3 +161,111 @@ class RedisSlidingWindowRateLimiter(SlidingWindowRateLimiter):
         timestamp: Timestamp,
     ) -> None:
         return self.impl.use_quotas(requests, grants, timestamp)
+
+    def check_and_use_quotas(
+        self, requests: Sequence[RequestedQuota], timestamp: Timestamp | None = None
+    ) -> Sequence[GrantedQuota]:
+        """
+        Check and consume the quota requests of a whole batch in one pipeline.
+
+        The current granule of every quota is incremented by the full
+        requested amount while the rest of the window is read, and whatever
+        could not be granted is given back afterwards. Batches that fit into
+        their quotas therefore take a single round trip instead of two. The
+        grants are the same as those of `check_within_quotas` followed by
+        `use_quotas`, but concurrent checks may briefly see the full requested
+        amount as used.
+
+        Falls back to a separate check and use unless
+        `ratelimits.sliding-windows.combined-check-and-use` is enabled.
+        """
+        if not options.get("ratelimits.sliding-windows.combined-check-and-use"):
+            return super().check_and_use_quotas(requests, timestamp)
+
+        if not requests:
+            return []
+
+        if timestamp is None:
+            timestamp = int(time())
+        else:
+            timestamp = int(timestamp)
+
+        keys_to_incr: dict[str, int] = defaultdict(int)
+        keys_ttl: dict[str, int] = {}
+        keys_to_fetch: set[str] = set()
+        window_keys: list[list[tuple[Quota, list[str]]]] = []
+
+        for request in requests:
+            assert request.quotas
+
+            request_keys = []
+            for quota in request.quotas:
+                keys = [
+                    self.impl._build_redis_key(request=request, quota=quota, granule=granule)
+                    for granule in quota.iter_window(timestamp)
+                ]
+                request_keys.append((quota, keys))
+                # The first key is the current granule, to which usage is added.
+                keys_to_incr[keys[0]] += request.requested
+                keys_ttl[keys[0]] = quota.window_seconds
+                keys_to_fetch.update(keys[1:])
+            window_keys.append(request_keys)
+
+        ordered_keys_to_fetch = list(keys_to_fetch - keys_to_incr.keys())
+        with self.client.pipeline(transaction=False) as pipeline:
+            for key, value in keys_to_incr.items():
+                pipeline.incrby(key, value)
+                pipeline.expire(key, keys_ttl[key])
+            for key in ordered_keys_to_fetch:
+                pipeline.get(key)
+            results = pipeline.execute()
+
+        # Usage of every key before this batch.
+        used_by_key = {
+            key: int(value or 0)
+            for key, value in zip(ordered_keys_to_fetch, results[2 * len(keys_to_incr) :])
+        }
+        for (key, value), incremented in zip(
+            keys_to_incr.items(), results[: 2 * len(keys_to_incr) : 2]
+        ):
+            used_by_key[key] = int(incremented) - value
+
+        grants = []
+        keys_to_decr: MutableMapping[str, int] = defaultdict(int)
+        # Global quotas (with a prefix override) may be shared across requests,
+        # what is granted to one request is not available to the next one.
+        quota_used_cache: MutableMapping[int, int] = defaultdict(int)
+
+        for request, request_keys in zip(requests, window_keys):
+            granted = request.requested
+            reached_quotas = []
+
+            for quota, keys in request_keys:
+                used = sum(used_by_key[key] for key in keys) + quota_used_cache[id(quota)]
+                remaining = max(0, quota.limit - used)
+                if remaining < granted:
+                    granted = remaining
+                    reached_quotas.append(quota)
+
+            for quota, keys in request_keys:
+                if quota.prefix_override:
+                    quota_used_cache[id(quota)] += granted
+                if granted < request.requested:
+                    keys_to_decr[keys[0]] += request.requested - granted
+
+            grants.append(
+                GrantedQuota(prefix=request.prefix, granted=granted, reached_quotas=reached_quotas)
+            )
+
+        if keys_to_decr:
+            with self.client.pipeline(transaction=False) as pipeline:
+                for key, value in keys_to_decr.items():
+                    pipeline.decrby(key, value)
+                pipeline.execute()
+
+        metrics.incr(
+            "ratelimits.sliding_windows.check_and_use",
+            tags={"round_trips": 2 if keys_to_decr else 1},
+            sample_rate=0.1,
+        )
+        return grants
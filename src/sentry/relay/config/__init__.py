@@ -77,6 +77,39 @@ MIN_CLUSTERER_RUNS = 10
 
 logger = logging.getLogger(__name__)
 
+#: Inputs of the config sections that can be recomputed on their own with
+#: :func:`get_project_config_sections`, by section name.
+SECTION_INPUTS: Mapping[str, frozenset[str]] = {
+    "sampling": frozenset({"dynamic_sampling"}),
+    "metrics": frozenset({"metrics_blocking"}),
+    "metricExtraction": frozenset({"on_demand_metrics"}),
+    "quotas": frozenset({"quotas"}),
+}
+
+#: Inputs changed by the triggers of project config invalidations. Invalidations for
+#: triggers that are not listed here recompute the whole config.
+TRIGGER_INPUTS: Mapping[str, frozenset[str]] = {
+    "dynamic_sampling:boost_release": frozenset({"dynamic_sampling"}),
+    "dynamic_sampling:custom_rule_upsert": frozenset({"dynamic_sampling"}),
+    "dynamic_sampling_boost_low_volume_projects": frozenset({"dynamic_sampling"}),
+    "dynamic_sampling_boost_low_volume_transactions": frozenset({"dynamic_sampling"}),
+    "releaseproject.post_save": frozenset({"dynamic_sampling"}),
+    "releaseproject.post_delete": frozenset({"dynamic_sampling"}),
+    "metrics_blocking": frozenset({"metrics_blocking"}),
+    "alerts:create-on-demand-metric": frozenset({"on_demand_metrics"}),
+    "dashboards:create-on-demand-metric": frozenset({"on_demand_metrics"}),
+    "monitors:monitor_created": frozenset({"quotas"}),
+}
+
+
+def get_invalidated_sections(trigger: str) -> list[str] | None:
+    """Returns the config sections affected by an invalidation with the given trigger,
+    or ``None`` if the whole config has to be recomputed."""
+    inputs = TRIGGER_INPUTS.get(trigger)
+    if inputs is None:
+        return None
+    return sorted(section for section, deps in SECTION_INPUTS.items() if deps & inputs)
+
 
 def get_exposed_features(project: Project) -> Sequence[str]:
     active_features = []
@@ -278,7 +311,9 @@ def get_metrics_config(timeout: TimeChecker, project: Project) -> Mapping[str, A
 
 
 def get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    organization_sections: Mapping[str, Any] | None = None,
 ) -> ProjectConfig:
     """Constructs the ProjectConfig information.
     :param project: The project to load configuration for. Ensure that
@@ -288,6 +323,9 @@ def get_project_config(
         no project keys are provided it is assumed that the config does not
         need to contain auth information (this is the case when used in
         python's StoreView)
+    :param organization_sections: Pre-computed sections of the project's
+        organization, see :func:`get_organization_config_sections`. Used to
+        compute them only once when building the configs of many projects.
     :return: a ProjectConfig object for the given project
     """
     with sentry_sdk.isolation_scope() as scope:
@@ -296,7 +334,92 @@ def get_project_config(
             sentry_sdk.start_transaction(name="get_project_config"),
             metrics.timer("relay.config.get_project_config.duration"),
         ):
-            return _get_project_config(project, project_keys=project_keys)
+            return _get_project_config(
+                project, project_keys=project_keys, organization_sections=organization_sections
+            )
+
+
+def get_organization_config_sections(organization: Organization) -> Mapping[str, Any]:
+    """Computes the parts of a project config that only depend on the organization.
+
+    The result can be shared by the configs of all projects of the organization.
+    """
+    with sentry_sdk.start_span(op="get_organization_config_sections"):
+        sections: dict[str, Any] = {
+            "trustedRelays": [
+                r["public_key"] for r in organization.get_option("sentry:trusted-relays", []) if r
+            ],
+        }
+
+        performance_score_profiles = [
+            *_get_desktop_browser_performance_profiles(organization),
+            *_get_mobile_browser_performance_profiles(organization),
+            *_get_mobile_performance_profiles(organization),
+            *_get_default_browser_performance_profiles(organization),
+        ]
+        if performance_score_profiles:
+            sections["performanceScore"] = {"profiles": performance_score_profiles}
+
+        with sentry_sdk.start_span(op="get_event_retention"):
+            event_retention = quotas.backend.get_event_retention(organization)
+            if event_retention is not None:
+                sections["eventRetention"] = event_retention
+
+    return sections
+
+
+def get_project_config_sections(
+    project: Project, sections: Iterable[str], project_keys: Iterable[ProjectKey] | None = None
+) -> Mapping[str, Any]:
+    """Computes only the given sections of the project config, see :data:`SECTION_INPUTS`.
+
+    Sections that would be omitted from the full config are omitted from the result.
+    """
+    config: dict[str, Any] = {}
+    for section in sections:
+        _SECTION_BUILDERS[section](config, project, project_keys)
+    return config
+
+
+def _add_sampling_section(
+    config: MutableMapping[str, Any], project: Project, project_keys: Iterable[ProjectKey] | None
+) -> None:
+    # NOTE: Omitting dynamicSampling because of a failure increases the number
+    # of events forwarded by Relay, because dynamic sampling will stop filtering
+    # anything.
+    add_experimental_config(config, "sampling", get_dynamic_sampling_config, project)
+
+
+def _add_metrics_section(
+    config: MutableMapping[str, Any], project: Project, project_keys: Iterable[ProjectKey] | None
+) -> None:
+    add_experimental_config(config, "metrics", get_metrics_config, project)
+
+
+def _add_metric_extraction_section(
+    config: MutableMapping[str, Any], project: Project, project_keys: Iterable[ProjectKey] | None
+) -> None:
+    if not _should_extract_transaction_metrics(project):
+        return
+
+    if metric_extraction := get_metric_extraction_config(project):
+        config["metricExtraction"] = metric_extraction
+
+
+def _add_quotas_section(
+    config: MutableMapping[str, Any], project: Project, project_keys: Iterable[ProjectKey] | None
+) -> None:
+    with sentry_sdk.start_span(op="get_all_quotas"):
+        if quotas_config := get_quotas(project, keys=project_keys):
+            config["quotas"] = quotas_config
+
+
+_SECTION_BUILDERS = {
+    "sampling": _add_sampling_section,
+    "metrics": _add_metrics_section,
+    "metricExtraction": _add_metric_extraction_section,
+    "quotas": _add_quotas_section,
+}
 
 
 def get_dynamic_sampling_config(timeout: TimeChecker, project: Project) -> Mapping[str, Any] | None:
@@ -998,11 +1121,16 @@ def _get_mobile_performance_profiles(organization: Organization) -> list[dict[st
 
 
 def _get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    organization_sections: Mapping[str, Any] | None = None,
 ) -> ProjectConfig:
     if project.status != ObjectStatus.ACTIVE:
         return ProjectConfig(project, disabled=True)
 
+    if organization_sections is None:
+        organization_sections = get_organization_config_sections(project.organization)
+
     public_keys = get_public_key_configs(project_keys=project_keys)
 
     with sentry_sdk.start_span(op="get_public_config"):
@@ -1016,11 +1144,7 @@ def _get_project_config(
             "publicKeys": public_keys,
             "config": {
                 "allowedDomains": list(get_origins(project)),
-                "trustedRelays": [
-                    r["public_key"]
-                    for r in project.organization.get_option("sentry:trusted-relays", [])
-                    if r
-                ],
+                "trustedRelays": organization_sections["trustedRelays"],
                 "piiConfig": get_pii_config(project),
                 "datascrubbingSettings": get_datascrubbing_settings(project),
             },
@@ -1034,10 +1158,7 @@ def _get_project_config(
         if exposed_features := get_exposed_features(project):
             config["features"] = exposed_features
 
-    # NOTE: Omitting dynamicSampling because of a failure increases the number
-    # of events forwarded by Relay, because dynamic sampling will stop filtering
-    # anything.
-    add_experimental_config(config, "sampling", get_dynamic_sampling_config, project)
+    _add_sampling_section(config, project, project_keys)
 
     # Rules to replace high cardinality transaction names
     add_experimental_config(config, "txNameRules", get_transaction_names_config, project)
@@ -1049,7 +1170,7 @@ def _get_project_config(
 
     config["breakdownsV2"] = project.get_option("sentry:breakdowns")
 
-    add_experimental_config(config, "metrics", get_metrics_config, project)
+    _add_metrics_section(config, project, project_keys)
 
     if _should_extract_transaction_metrics(project):
         add_experimental_config(
@@ -1067,8 +1188,7 @@ def _get_project_config(
             config, "metricConditionalTagging", get_metric_conditional_tagging_rules, project
         )
 
-        if metric_extraction := get_metric_extraction_config(project):
-            config["metricExtraction"] = metric_extraction
+        _add_metric_extraction_section(config, project, project_keys)
 
     config["sessionMetrics"] = {
         "version": (
@@ -1078,14 +1198,8 @@ def _get_project_config(
         ),
     }
 
-    performance_score_profiles = [
-        *_get_desktop_browser_performance_profiles(project.organization),
-        *_get_mobile_browser_performance_profiles(project.organization),
-        *_get_mobile_performance_profiles(project.organization),
-        *_get_default_browser_performance_profiles(project.organization),
-    ]
-    if performance_score_profiles:
-        config["performanceScore"] = {"profiles": performance_score_profiles}
+    if "performanceScore" in organization_sections:
+        config["performanceScore"] = organization_sections["performanceScore"]
 
     with sentry_sdk.start_span(op="get_filter_settings"):
         if filter_settings := get_filter_settings(project):
@@ -1094,13 +1208,9 @@ def _get_project_config(
         grouping_config = get_grouping_config_dict_for_project(project)
         if grouping_config is not None:
             config["groupingConfig"] = grouping_config
-    with sentry_sdk.start_span(op="get_event_retention"):
-        event_retention = quotas.backend.get_event_retention(project.organization)
-        if event_retention is not None:
-            config["eventRetention"] = event_retention
-    with sentry_sdk.start_span(op="get_all_quotas"):
-        if quotas_config := get_quotas(project, keys=project_keys):
-            config["quotas"] = quotas_config
+    if "eventRetention" in organization_sections:
+        config["eventRetention"] = organization_sections["eventRetention"]
+    _add_quotas_section(config, project, project_keys)
 
     return ProjectConfig(project, **cfg)
 
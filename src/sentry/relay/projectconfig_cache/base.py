@@ -1,8 +1,15 @@
+from collections.abc import Iterable, Mapping
+from typing import Any
+
 from sentry.utils.services import Service
 
+#: Returned by :meth:`ProjectConfigCache.get_many` for configs whose revision the caller
+#: already holds.
+UNCHANGED = "unchanged"
+
 
 class ProjectConfigCache(Service):
-    __all__ = ("set_many", "delete_many", "get")
+    __all__ = ("set_many", "delete_many", "get", "get_many")
 
     def __init__(self, **options):
         pass
@@ -15,3 +22,24 @@ class ProjectConfigCache(Service):
 
     def get(self, public_key):
         raise NotImplementedError()
+
+    def get_many(
+        self, public_keys: Iterable[str], revisions: Mapping[str, str] | None = None
+    ) -> dict[str, Mapping[str, Any] | str | None]:
+        """Fetches the configs of many public keys at once.
+
+        :param revisions: The revisions of the configs the caller already holds, by public
+            key.  Configs which still have that revision are returned as :data:`UNCHANGED`.
+        :returns: A dict mapping every public key to its config, :data:`UNCHANGED` or
+            ``None`` if the config is not cached.
+        """
+        revisions = revisions or {}
+        results: dict[str, Mapping[str, Any] | str | None] = {}
+        for public_key in public_keys:
+            config = self.get(public_key)
+            rev = revisions.get(public_key)
+            if config is not None and rev is not None and rev == config.get("rev"):
+                results[public_key] = UNCHANGED
+            else:
+                results[public_key] = config
+        return results
@@ -1,16 +1,25 @@
+import hashlib
 import logging
-from collections.abc import Mapping
+from collections import Counter
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 import zstandard
 
-from sentry.relay.projectconfig_cache.base import ProjectConfigCache
+from sentry import options
+from sentry.relay.projectconfig_cache.base import UNCHANGED, ProjectConfigCache
 from sentry.utils import json, metrics, redis
 from sentry.utils.redis import validate_dynamic_cluster
 
 REDIS_CACHE_TIMEOUT = 3600  # 1 hr
 COMPRESSION_LEVEL = 3  # 3 is the default level of compression
 
+# Config sections at least this large (serialized) are stored as content-addressed blobs,
+# shared by all configs that contain the same section.
+BLOB_MIN_SIZE = 1024
+# Key of the digest in the placeholder of a section stored as blob.
+BLOB_REF = "$blob"
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,12 +42,87 @@ class RedisProjectConfigCache(ProjectConfigCache):
     def __get_redis_rev_key(self, public_key):
         return f"{self.__get_redis_key(public_key)}.rev"
 
+    def __get_redis_blob_key(self, digest):
+        return f"relayconfig:blob:{digest}"
+
+    def _extract_blobs(
+        self, config: Mapping[str, Any], blobs: dict[str, bytes]
+    ) -> Mapping[str, Any]:
+        """Replaces large sections of ``config`` by references to blobs, which are added
+        to ``blobs`` by their digest."""
+        sections = config.get("config")
+        if not isinstance(sections, Mapping):
+            return config
+
+        stored_sections = {}
+        for section, value in sections.items():
+            serialized = json.dumps(value).encode()
+            if len(serialized) < BLOB_MIN_SIZE:
+                stored_sections[section] = value
+                continue
+
+            digest = hashlib.sha1(serialized).hexdigest()
+            blobs[digest] = serialized
+            stored_sections[section] = {BLOB_REF: digest}
+
+        return {**config, "config": stored_sections}
+
+    def _resolve_blobs(self, configs: dict[str, Any]) -> None:
+        """Replaces blob references in ``configs`` by the blobs' contents.  Configs
+        referencing blobs which no longer exist are set to ``None``."""
+        digests = {
+            value[BLOB_REF]
+            for config in configs.values()
+            if isinstance(config, Mapping) and isinstance(config.get("config"), Mapping)
+            for value in config["config"].values()
+            if isinstance(value, Mapping) and BLOB_REF in value
+        }
+        if not digests:
+            return
+
+        p = self.cluster_read.pipeline(transaction=False)
+        for digest in digests:
+            p.get(self.__get_redis_blob_key(digest))
+        blobs = {
+            digest: json.loads(zstandard.decompress(value))
+            for digest, value in zip(digests, p.execute())
+            if value is not None
+        }
+
+        for public_key, config in configs.items():
+            if not isinstance(config, Mapping) or not isinstance(config.get("config"), Mapping):
+                continue
+
+            sections = config["config"]
+            for section, value in sections.items():
+                if not isinstance(value, Mapping) or BLOB_REF not in value:
+                    continue
+                if value[BLOB_REF] not in blobs:
+                    metrics.incr("relay.projectconfig_cache.missing_blob")
+                    configs[public_key] = None
+                    break
+                sections[section] = blobs[value[BLOB_REF]]
+
+    def _decode(self, rv_b: bytes) -> Any:
+        try:
+            rv = zstandard.decompress(rv_b).decode()
+        except (TypeError, zstandard.ZstdError):
+            # assume raw json
+            rv = rv_b.decode()
+        return json.loads(rv)
+
     def set_many(self, configs: dict[str, Mapping[str, Any]]):
         metrics.incr("relay.projectconfig_cache.write", amount=len(configs), tags={"action": "set"})
 
+        use_blobs = options.get("relay.projectconfig-cache.shared-blobs")
+        blobs: dict[str, bytes] = {}
+
         # Note: Those are multiple pipelines, one per cluster node.
         p = self.cluster.pipeline(transaction=False)
         for public_key, config in configs.items():
+            if use_blobs:
+                config = self._extract_blobs(config, blobs)
+
             serialized = json.dumps(config).encode()
             compressed = zstandard.compress(serialized, level=COMPRESSION_LEVEL)
             metrics.distribution(
@@ -57,6 +141,18 @@ class RedisProjectConfigCache(ProjectConfigCache):
             # made transactional.
             if rev := config.get("rev"):
                 p.setex(self.__get_redis_rev_key(public_key), REDIS_CACHE_TIMEOUT, rev)
+            else:
+                # Don't leave the revision of a previous config behind.
+                p.delete(self.__get_redis_rev_key(public_key))
+
+        # Blobs are written with every config referencing them, so they never expire
+        # before any of these configs.
+        for digest, serialized in blobs.items():
+            compressed = zstandard.compress(serialized, level=COMPRESSION_LEVEL)
+            metrics.distribution(
+                "relay.projectconfig_cache.blob_size", len(compressed), unit="byte"
+            )
+            p.setex(self.__get_redis_blob_key(digest), REDIS_CACHE_TIMEOUT, compressed)
 
         p.execute()
 
@@ -65,7 +161,10 @@ class RedisProjectConfigCache(ProjectConfigCache):
         with self.cluster.pipeline() as p:
             for public_key in public_keys:
                 p.delete(self.__get_redis_key(public_key))
-            return_values = p.execute()
+                # Also delete the revision, so revision-aware reads don't report a deleted
+                # config as unchanged.
+                p.delete(self.__get_redis_rev_key(public_key))
+            return_values = p.execute()[::2]
 
         metrics.incr(
             "relay.projectconfig_cache.write", amount=sum(return_values), tags={"action": "delete"}
@@ -74,14 +173,51 @@ class RedisProjectConfigCache(ProjectConfigCache):
     def get(self, public_key):
         rv_b = self.cluster_read.get(self.__get_redis_key(public_key))
         if rv_b is not None:
-            try:
-                rv = zstandard.decompress(rv_b).decode()
-            except (TypeError, zstandard.ZstdError):
-                # assume raw json
-                rv = rv_b.decode()
-            return json.loads(rv)
+            configs = {public_key: self._decode(rv_b)}
+            self._resolve_blobs(configs)
+            return configs[public_key]
         return None
 
+    def get_many(
+        self, public_keys: Iterable[str], revisions: Mapping[str, str] | None = None
+    ) -> dict[str, Mapping[str, Any] | str | None]:
+        public_keys = list(public_keys)
+        revisions = revisions or {}
+        results: dict[str, Mapping[str, Any] | str | None] = {}
+
+        # The revision key is best effort and not written atomically with the config, so
+        # unchanged configs are only detected by the revision of the fetched config.
+        configs: dict[str, Any] = {}
+        if public_keys:
+            p = self.cluster_read.pipeline(transaction=False)
+            for public_key in public_keys:
+                p.get(self.__get_redis_key(public_key))
+            configs = {
+                public_key: self._decode(rv_b)
+                for public_key, rv_b in zip(public_keys, p.execute())
+                if rv_b is not None
+            }
+            self._resolve_blobs(configs)
+
+        for public_key in public_keys:
+            config = configs.get(public_key)
+            rev = revisions.get(public_key)
+            if config is not None and rev is not None and rev == config.get("rev"):
+                results[public_key] = UNCHANGED
+            else:
+                results[public_key] = config
+
+        outcomes = Counter(
+            "unchanged" if config == UNCHANGED else "miss" if config is None else "hit"
+            for config in results.values()
+        )
+        for outcome, amount in outcomes.items():
+            metrics.incr(
+                "relay.projectconfig_cache.get_many", amount=amount, tags={"result": outcome}
+            )
+
+        return results
+
     def get_rev(self, public_key) -> str | None:
         if value := self.cluster_read.get(self.__get_redis_rev_key(public_key)):
             return value.decode()
@@ -15,6 +15,10 @@ class ProjectConfigDebounceCache(Service):
 
     The constructor takes an optional ``key_prefix`` option, which can be used to create
     multiple instances of this debounce cache with different keys.
+
+    All methods take an optional ``sections`` argument. Updates of only some sections of
+    the configs are debounced separately for every set of sections, and independently of
+    updates of the whole configs.
     """
 
     __all__ = ("is_debounced", "debounce", "mark_task_done")
@@ -22,7 +26,7 @@ class ProjectConfigDebounceCache(Service):
     def __init__(self, **options):
         pass
 
-    def is_debounced(self, *, public_key, project_id, organization_id):
+    def is_debounced(self, *, public_key, project_id, organization_id, sections=None):
         """Checks if the given project/organization should be debounced.
 
         If this is called this with multiple arguments each scope is checked, so that even
@@ -31,13 +35,13 @@ class ProjectConfigDebounceCache(Service):
         """
         return False
 
-    def debounce(self, *, public_key, project_id, organization_id):
+    def debounce(self, *, public_key, project_id, organization_id, sections=None):
         """Debounces the given project/organization, without performing any checks.
 
         The highest-scoped argument passed in will be debounced.
         """
 
-    def mark_task_done(self, *, public_key, project_id, organization_id):
+    def mark_task_done(self, *, public_key, project_id, organization_id, sections=None):
         """
         Mark a task done such that `is_debounced` starts emitting False
         for the given parameters.
@@ -129,6 +129,10 @@ class _QSTypedDict(TypedDict):
 class BaseEventFrequencyCondition(EventCondition, abc.ABC):
     intervals = STANDARD_INTERVALS
     form_cls = EventFrequencyForm
+    # Whether `batch_query` may be called with groups of several projects of an
+    # organization at once, i.e. the result of a group doesn't depend on the
+    # project the condition was instantiated with.
+    supports_cross_project_batch_query = True
 
     def __init__(
         self,
@@ -582,6 +586,8 @@ class EventFrequencyPercentCondition(BaseEventFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventFrequencyPercentCondition"
     label = "The issue affects more than {value} percent of sessions in {interval}"
     logger = logging.getLogger("sentry.rules.event_frequency")
+    # Sessions are counted per project.
+    supports_cross_project_batch_query = False
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.intervals = PERCENT_INTERVALS
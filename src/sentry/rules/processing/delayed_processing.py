@@ -7,6 +7,7 @@ from datetime import datetime, timedelta, timezone
 from itertools import islice
 from typing import Any, DefaultDict, NamedTuple
 
+from django.core.cache import cache
 from django.db.models import OuterRef, Subquery
 
 from sentry import buffer, nodestore, options
@@ -39,6 +40,7 @@ from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task
 from sentry.tasks.post_process import should_retry_fetch
 from sentry.utils import json, metrics
+from sentry.utils.hashlib import md5_text
 from sentry.utils.iterators import chunked
 from sentry.utils.retries import ConditionalRetryPolicy, exponential_delay
 from sentry.utils.safe import safe_execute
@@ -75,6 +77,20 @@ class DataAndGroups(NamedTuple):
         return f"<DataAndGroups data: {self.data} group_ids: {self.group_ids}>"
 
 
+class ProjectRuleGroups(NamedTuple):
+    """
+    The buffered rule groups of a project (or of a batch of a project) and the
+    condition queries needed to evaluate them.
+    """
+
+    project: Project
+    batch_key: str | None
+    rulegroup_to_event_data: dict[str, str]
+    rules_to_groups: DefaultDict[int, set[int]]
+    alert_rules: list[Rule]
+    condition_groups: dict[UniqueConditionQuery, DataAndGroups]
+
+
 def fetch_project(project_id: int) -> Project | None:
     try:
         return Project.objects.get_from_cache(id=project_id)
@@ -329,19 +345,128 @@ def get_condition_group_results(
                 unique_condition.comparison_interval
             )
 
-        result = safe_execute(
-            condition_inst.get_rate_bulk,
-            duration=duration,
-            group_ids=group_ids,
-            environment_id=unique_condition.environment_id,
-            current_time=current_time,
-            comparison_interval=comparison_interval,
-        )
-        condition_group_results[unique_condition] = result or {}
+        cached_counts = get_cached_window_counts(unique_condition, group_ids, current_time)
+        missing_group_ids = group_ids - cached_counts.keys()
+
+        result = None
+        if missing_group_ids:
+            result = safe_execute(
+                condition_inst.get_rate_bulk,
+                duration=duration,
+                group_ids=missing_group_ids,
+                environment_id=unique_condition.environment_id,
+                current_time=current_time,
+                comparison_interval=comparison_interval,
+            )
+            if result:
+                cache_window_counts(unique_condition, result, current_time)
+
+        condition_group_results[unique_condition] = {**cached_counts, **(result or {})}
 
     return condition_group_results
 
 
+def get_window_count_cache_key(
+    unique_condition: UniqueConditionQuery, group_id: int, current_time: datetime
+) -> str:
+    query_hash = md5_text(
+        f"{unique_condition.cls_id}:{unique_condition.interval}:"
+        f"{unique_condition.environment_id}:{unique_condition.comparison_interval}"
+    ).hexdigest()
+    # Counts are only shared within the minute they were queried in, which
+    # is the cadence of delayed processing.
+    minute = int(current_time.timestamp() // 60)
+    return f"delayed_processing.window_count:{query_hash}:{minute}:{group_id}"
+
+
+def get_cached_window_counts(
+    unique_condition: UniqueConditionQuery, group_ids: set[int], current_time: datetime
+) -> dict[int, int]:
+    """
+    Returns the counts of the groups that were already queried for the same
+    condition query in the current minute, e.g. by another batch of the project.
+    """
+    if not options.get("delayed_processing.window_count_cache_ttl"):
+        return {}
+
+    cache_keys = {
+        get_window_count_cache_key(unique_condition, group_id, current_time): group_id
+        for group_id in group_ids
+    }
+    cached = cache.get_many(list(cache_keys))
+    metrics.incr("delayed_processing.window_count_cache.hit", amount=len(cached))
+    metrics.incr("delayed_processing.window_count_cache.miss", amount=len(group_ids) - len(cached))
+    return {cache_keys[cache_key]: count for cache_key, count in cached.items()}
+
+
+def cache_window_counts(
+    unique_condition: UniqueConditionQuery, counts: dict[int, int], current_time: datetime
+) -> None:
+    ttl = options.get("delayed_processing.window_count_cache_ttl")
+    if not ttl:
+        return
+
+    cache.set_many(
+        {
+            get_window_count_cache_key(unique_condition, group_id, current_time): count
+            for group_id, count in counts.items()
+        },
+        ttl,
+    )
+
+
+def get_shared_condition_group_results(
+    all_rule_groups: Sequence[ProjectRuleGroups],
+) -> dict[int, dict[UniqueConditionQuery, dict[int, int]]]:
+    """
+    Returns the condition group results of each project in `all_rule_groups`,
+    which must all belong to the same organization.
+
+    Identical condition queries of different projects are merged into a single
+    bulk query if the condition supports it, so every such query is only made
+    once per dataset for all projects.
+    """
+    shared_condition_groups: dict[UniqueConditionQuery, DataAndGroups] = {}
+    num_queries = 0
+    for rule_groups in all_rule_groups:
+        for unique_condition, (condition_data, group_ids) in rule_groups.condition_groups.items():
+            num_queries += 1
+            condition_cls = rules.get(unique_condition.cls_id)
+            if not getattr(condition_cls, "supports_cross_project_batch_query", False):
+                continue
+            if data_and_groups := shared_condition_groups.get(unique_condition):
+                data_and_groups.group_ids.update(group_ids)
+            else:
+                shared_condition_groups[unique_condition] = DataAndGroups(
+                    condition_data, set(group_ids)
+                )
+
+    metrics.incr(
+        "delayed_processing.shared_condition_queries",
+        amount=num_queries - len(shared_condition_groups),
+    )
+
+    shared_results: dict[UniqueConditionQuery, dict[int, int]] = {}
+    if shared_condition_groups:
+        shared_results = (
+            get_condition_group_results(shared_condition_groups, all_rule_groups[0].project) or {}
+        )
+
+    project_results = {}
+    for rule_groups in all_rule_groups:
+        own_condition_groups = {
+            unique_condition: data_and_groups
+            for unique_condition, data_and_groups in rule_groups.condition_groups.items()
+            if unique_condition not in shared_condition_groups
+        }
+        results = get_condition_group_results(own_condition_groups, rule_groups.project) or {}
+        for unique_condition in rule_groups.condition_groups.keys() & shared_results.keys():
+            results[unique_condition] = shared_results[unique_condition]
+        project_results[rule_groups.project.id] = results
+
+    return project_results
+
+
 def passes_comparison(
     condition_group_results: dict[UniqueConditionQuery, dict[int, int]],
     condition_data: EventFrequencyConditionData,
@@ -523,6 +648,42 @@ def process_rulegroups_in_batches(project_id: int):
             apply_delayed.delay(project_id, batch_key)
 
 
+def process_projects_by_organization(project_ids: list[int]) -> None:
+    """
+    Schedules `apply_delayed_organization` for the projects of each
+    organization, so that identical condition queries are shared between them.
+
+    Projects of an organization are combined into tasks of up to the batch size
+    in rule groups. Projects that are larger than that are still split into
+    batches of their own by `process_rulegroups_in_batches`.
+    """
+    batch_size = options.get("delayed_processing.batch_size")
+    organization_to_projects: DefaultDict[int, list[tuple[int, int]]] = defaultdict(list)
+
+    for project in Project.objects.get_many_from_cache(project_ids):
+        event_count = buffer.backend.get_hash_length(Project, {"project_id": project.id})
+        if event_count >= batch_size:
+            process_rulegroups_in_batches(project.id)
+            continue
+
+        metrics.incr(
+            "delayed_processing.num_groups", tags={"num_groups": bucket_num_groups(event_count)}
+        )
+        organization_to_projects[project.organization_id].append((project.id, event_count))
+
+    for projects in organization_to_projects.values():
+        task_project_ids: list[int] = []
+        task_event_count = 0
+        for project_id, event_count in projects:
+            if task_project_ids and task_event_count + event_count > batch_size:
+                apply_delayed_organization.delay(task_project_ids)
+                task_project_ids, task_event_count = [], 0
+            task_project_ids.append(project_id)
+            task_event_count += event_count
+
+        apply_delayed_organization.delay(task_project_ids)
+
+
 def process_delayed_alert_conditions() -> None:
     with metrics.timer("delayed_processing.process_all_conditions.duration"):
         fetch_time = datetime.now(tz=timezone.utc)
@@ -532,8 +693,11 @@ def process_delayed_alert_conditions() -> None:
         log_str = ", ".join(f"{project_id}: {timestamp}" for project_id, timestamp in project_ids)
         logger.info("delayed_processing.project_id_list", extra={"project_ids": log_str})
 
-        for project_id, _ in project_ids:
-            process_rulegroups_in_batches(project_id)
+        if options.get("delayed_processing.share_organization_queries"):
+            process_projects_by_organization([project_id for project_id, _ in project_ids])
+        else:
+            for project_id, _ in project_ids:
+                process_rulegroups_in_batches(project_id)
 
         buffer.backend.delete_key(PROJECT_ID_BUFFER_LIST_KEY, min=0, max=fetch_time.timestamp())
 
@@ -555,37 +719,93 @@ def apply_delayed(project_id: int, batch_key: str | None = None, *args: Any, **k
     if not project:
         return
 
-    rulegroup_to_event_data = fetch_rulegroup_to_event_data(project_id, batch_key)
+    rule_groups = fetch_project_rule_groups(project, batch_key)
+
+    with metrics.timer("delayed_processing.get_condition_group_results.duration"):
+        condition_group_results = get_condition_group_results(rule_groups.condition_groups, project)
+
+    fire_project_rules(rule_groups, condition_group_results)
+
+
+@instrumented_task(
+    name="sentry.rules.processing.delayed_processing.apply_delayed_organization",
+    queue="delayed_rules",
+    default_retry_delay=5,
+    max_retries=5,
+    soft_time_limit=50,
+    time_limit=60,
+    silo_mode=SiloMode.REGION,
+)
+def apply_delayed_organization(project_ids: list[int], *args: Any, **kwargs: Any) -> None:
+    """
+    Like `apply_delayed` for several projects of the same organization, but
+    shares the Snuba queries of identical conditions between the projects.
+    """
+    all_rule_groups = []
+    for project_id in project_ids:
+        project = fetch_project(project_id)
+        if project:
+            all_rule_groups.append(fetch_project_rule_groups(project, None))
+
+    if not all_rule_groups:
+        return
+
+    with metrics.timer("delayed_processing.get_shared_condition_group_results.duration"):
+        project_results = get_shared_condition_group_results(all_rule_groups)
+
+    for rule_groups in all_rule_groups:
+        fire_project_rules(rule_groups, project_results[rule_groups.project.id])
+
+
+def fetch_project_rule_groups(project: Project, batch_key: str | None) -> ProjectRuleGroups:
+    rulegroup_to_event_data = fetch_rulegroup_to_event_data(project.id, batch_key)
     rules_to_groups = get_rules_to_groups(rulegroup_to_event_data)
     alert_rules = fetch_alert_rules(list(rules_to_groups.keys()))
     condition_groups = get_condition_query_groups(alert_rules, rules_to_groups)
     logger.info(
         "delayed_processing.condition_groups",
-        extra={"condition_groups": condition_groups, "project_id": project_id},
+        extra={"condition_groups": condition_groups, "project_id": project.id},
+    )
+    return ProjectRuleGroups(
+        project=project,
+        batch_key=batch_key,
+        rulegroup_to_event_data=rulegroup_to_event_data,
+        rules_to_groups=rules_to_groups,
+        alert_rules=alert_rules,
+        condition_groups=condition_groups,
     )
 
-    with metrics.timer("delayed_processing.get_condition_group_results.duration"):
-        condition_group_results = get_condition_group_results(condition_groups, project)
+
+def fire_project_rules(
+    rule_groups: ProjectRuleGroups,
+    condition_group_results: dict[UniqueConditionQuery, dict[int, int]] | None,
+) -> None:
+    project = rule_groups.project
 
     rules_to_slow_conditions = defaultdict(list)
-    for rule in alert_rules:
+    for rule in rule_groups.alert_rules:
         rules_to_slow_conditions[rule].extend(get_slow_conditions(rule))
 
     rules_to_fire = defaultdict(set)
     if condition_group_results:
         rules_to_fire = get_rules_to_fire(
-            condition_group_results, rules_to_slow_conditions, rules_to_groups, project.id
+            condition_group_results,
+            rules_to_slow_conditions,
+            rule_groups.rules_to_groups,
+            project.id,
         )
         logger.info(
             "delayed_processing.rule_to_fire",
-            extra={"rules_to_fire": list(rules_to_fire.keys()), "project_id": project_id},
+            extra={"rules_to_fire": list(rules_to_fire.keys()), "project_id": project.id},
         )
 
-    parsed_rulegroup_to_event_data = parse_rulegroup_to_event_data(rulegroup_to_event_data)
+    parsed_rulegroup_to_event_data = parse_rulegroup_to_event_data(
+        rule_groups.rulegroup_to_event_data
+    )
     with metrics.timer("delayed_processing.fire_rules.duration"):
-        fire_rules(rules_to_fire, parsed_rulegroup_to_event_data, alert_rules, project)
+        fire_rules(rules_to_fire, parsed_rulegroup_to_event_data, rule_groups.alert_rules, project)
 
-    cleanup_redis_buffer(project_id, rules_to_groups, batch_key)
+    cleanup_redis_buffer(project.id, rule_groups.rules_to_groups, rule_groups.batch_key)
 
 
 if not redis_buffer_registry.has(BufferHookEvent.FLUSH):
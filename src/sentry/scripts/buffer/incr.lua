@@ -0,0 +1,44 @@
+-- Buffer an increment of a model's counters in a single round trip. This does
+-- the same as the pipeline in `RedisBuffer.incr` and stores identical values.
+--
+-- KEYS[1]: The hash of the buffered model and filters.
+-- KEYS[2]: (optional) The pending set the hash is added to. Only passed if it
+--          is stored on the same node as the hash.
+--
+-- ARGV[1]: The model path.
+-- ARGV[2]: The encoded filters.
+-- ARGV[3]: The TTL of the hash in seconds.
+-- ARGV[4]: The score of the hash in the pending set.
+-- ARGV[5]: "1" if the increment only signals, "0" otherwise.
+-- ARGV[6]: The number of counters.
+-- ARGV[7...]: The (field, amount) pairs of the counters, followed by the
+--             (field, encoded value) pairs of the extra values.
+assert(#KEYS == 1 or #KEYS == 2, "provide a hash key and an optional pending key")
+assert(#ARGV >= 6 and #ARGV % 2 == 0, "provide the header and field pairs")
+
+local key = KEYS[1]
+local ttl = ARGV[3]
+local score = ARGV[4]
+local signal_only = ARGV[5]
+local counters_end = 6 + 2 * tonumber(ARGV[6])
+
+redis.call("HSETNX", key, "m", ARGV[1])
+redis.call("HSETNX", key, "f", ARGV[2])
+
+for i = 7, counters_end, 2 do
+    redis.call("HINCRBY", key, ARGV[i], ARGV[i + 1])
+end
+
+for i = counters_end + 1, #ARGV, 2 do
+    redis.call("HSET", key, ARGV[i], ARGV[i + 1])
+end
+
+if signal_only == "1" then
+    redis.call("HSET", key, "s", "1")
+end
+
+redis.call("EXPIRE", key, ttl)
+
+if #KEYS == 2 then
+    redis.call("ZADD", KEYS[2], score, key)
+end
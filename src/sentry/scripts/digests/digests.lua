@@ -84,6 +84,19 @@ local function variadic_argument_parser(argument_parser)
     end
 end
 
+local function counted_argument_parser(argument_parser)
+    -- Parses a count, followed by that many arguments.
+    return function (cursor, arguments)
+        local count = tonumber(arguments[cursor])
+        cursor = cursor + 1
+        local results = {}
+        for i = 1, count do
+            cursor, results[i] = argument_parser(cursor, arguments)
+        end
+        return cursor, results
+    end
+end
+
 local function multiple_argument_parser(...)
     local parsers = {...}
     return function (cursor, arguments)
@@ -180,11 +193,16 @@ local function schedule(configuration, deadline)
 end
 
 local function maintenance(configuration, deadline)
+    local n = 0
     zrange_move_slice(
         configuration:get_schedule_ready_key(),
         configuration:get_schedule_waiting_key(),
-        deadline
+        deadline,
+        function ()
+            n = n + 1
+        end
     )
+    return n
 end
 
 local function add_timeline_to_schedule(configuration, timeline_id, timestamp, increment, maximum)
@@ -338,6 +356,41 @@ local function close_digest(configuration, timeline_id, delay_minimum, record_id
     end
 end
 
+local function open_digests(configuration, timeline_capacity, lock, timeline_ids)
+    -- Opens the digests of many timelines. Every timeline is locked with the
+    -- same lock that is used when digesting a single timeline, timelines that
+    -- are already locked or not in the ready state are skipped.
+    local results = {}
+    for i, timeline_id in ipairs(timeline_ids) do
+        local lock_key = lock.prefix .. configuration:get_timeline_key(timeline_id)
+        if not redis.call('SET', lock_key, lock.value, 'EX', lock.duration, 'NX') then
+            results[i] = {timeline_id, 'locked', {}}
+        elseif redis.call('ZSCORE', configuration:get_schedule_ready_key(), timeline_id) == false then
+            redis.call('DEL', lock_key)
+            results[i] = {timeline_id, 'invalid_state', {}}
+        else
+            results[i] = {timeline_id, 'ready', digest_timeline(configuration, timeline_id, timeline_capacity)}
+        end
+    end
+    return results
+end
+
+local function close_digests(configuration, lock, digests)
+    -- Closes the digests opened by `open_digests` and releases their locks.
+    -- Digests that are not to be closed are only released, leaving them in
+    -- the ready state.
+    for _, digest in ipairs(digests) do
+        if digest.close == 1 then
+            close_digest(configuration, digest.timeline_id, digest.delay_minimum, digest.record_ids)
+        end
+
+        local lock_key = lock.prefix .. configuration:get_timeline_key(digest.timeline_id)
+        if redis.call('GET', lock_key) == lock.value then
+            redis.call('DEL', lock_key)
+        end
+    end
+end
+
 local function delete_timeline(configuration, timeline_id)
     truncate_timeline(configuration, timeline_id, 0)
     truncate_digest(configuration, timeline_id, 0)
@@ -448,6 +501,35 @@ local commands = {
         )(cursor, arguments)
         return close_digest(configuration, timeline_id, delay_minimum, record_ids)
     end,
+    DIGEST_OPEN_MANY = function (cursor, arguments)
+        local cursor, configuration, timeline_capacity, lock, timeline_ids = multiple_argument_parser(
+            configuration_argument_parser,
+            argument_parser(tonumber),
+            object_argument_parser({
+                {"prefix", argument_parser()},
+                {"value", argument_parser()},
+                {"duration", argument_parser(tonumber)},
+            }),
+            variadic_argument_parser(argument_parser())
+        )(cursor, arguments)
+        return open_digests(configuration, timeline_capacity, lock, timeline_ids)
+    end,
+    DIGEST_CLOSE_MANY = function (cursor, arguments)
+        local cursor, configuration, lock, digests = multiple_argument_parser(
+            configuration_argument_parser,
+            object_argument_parser({
+                {"prefix", argument_parser()},
+                {"value", argument_parser()},
+            }),
+            variadic_argument_parser(object_argument_parser({
+                {"timeline_id", argument_parser()},
+                {"close", argument_parser(tonumber)},
+                {"delay_minimum", argument_parser(tonumber)},
+                {"record_ids", counted_argument_parser(argument_parser())},
+            }))
+        )(cursor, arguments)
+        return close_digests(configuration, lock, digests)
+    end,
 }
 
 local cursor, command = argument_parser(
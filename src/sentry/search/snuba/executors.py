@@ -63,6 +63,7 @@ from sentry.models.team import Team
 from sentry.search.events.builder.discover import UnresolvedQuery
 from sentry.search.events.filter import convert_search_filter_to_snuba_query, format_search_filter
 from sentry.search.events.types import SnubaParams
+from sentry.search.snuba.result_cache import cache_search_results
 from sentry.snuba.dataset import Dataset
 from sentry.users.models.user import User
 from sentry.users.services.user.model import RpcUser
@@ -771,6 +772,7 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
     def dataset(self) -> Dataset:
         return Dataset.Events
 
+    @cache_search_results
     def query(
         self,
         projects: Sequence[Project],
@@ -1668,6 +1670,7 @@ class GroupAttributesPostgresSnubaQueryExecutor(PostgresSnubaQueryExecutor):
         return start, end, retention_date
 
     @metrics.wraps("snuba.search.group_attributes.query")
+    @cache_search_results
     def query(
         self,
         projects: Sequence[Project],
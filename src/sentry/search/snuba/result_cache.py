@@ -0,0 +1,207 @@
+"""
+Short-lived cache of issue search results.
+
+Results are cached per organization for `snuba.search.result-cache.ttl` seconds,
+keyed by the normalized query parameters and the current time bucket. Every
+change to a group that is recorded in its history (status, assignment, priority)
+invalidates all cached results of the organization, by replacing the
+organization's cache generation which is part of every key.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+import uuid
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from django.core.cache import cache
+
+from sentry import options
+from sentry.utils import metrics
+from sentry.utils.cursors import Cursor, CursorResult
+from sentry.utils.hashlib import md5_text
+
+if TYPE_CHECKING:
+    from sentry.models.group import Group
+
+# The generation has to outlive every result cached with it.
+GENERATION_TTL = 60 * 60
+
+F = TypeVar("F", bound=Callable[..., CursorResult[Any]])
+
+
+def _get_generation_key(organization_id: int) -> str:
+    return f"search:results:generation:{organization_id}"
+
+
+def invalidate_search_results(organization_id: int) -> None:
+    """
+    Invalidates all cached search results of an organization.
+    """
+    if not options.get("snuba.search.result-cache.ttl"):
+        return
+
+    cache.set(_get_generation_key(organization_id), uuid.uuid4().hex, GENERATION_TTL)
+
+
+def invalidate_group_search_results(groups: Sequence[Group]) -> None:
+    """
+    Invalidates all cached search results of the organizations `groups` belong
+    to. Organizations are looked up with a single query, and only if the cache
+    is enabled.
+    """
+    if not groups or not options.get("snuba.search.result-cache.ttl"):
+        return
+
+    from sentry.models.project import Project
+
+    organization_ids = (
+        Project.objects.filter(id__in={group.project_id for group in groups})
+        .values_list("organization_id", flat=True)
+        .distinct()
+    )
+    cache.set_many(
+        {_get_generation_key(id): uuid.uuid4().hex for id in organization_ids}, GENERATION_TTL
+    )
+
+
+def _get_generation(organization_id: int) -> str:
+    key = _get_generation_key(organization_id)
+    generation = cache.get(key)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        # Another process may have set a generation in the meantime, use theirs.
+        if not cache.add(key, generation, GENERATION_TTL):
+            generation = cache.get(key) or generation
+    return generation
+
+
+def _normalize(value: Any, bucket_size: int) -> Any:
+    if isinstance(value, datetime):
+        # Relative dates are resolved at request time, round them so that repeated
+        # loads of the same search share a key.
+        return int(value.timestamp()) // bucket_size
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item, bucket_size) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(_normalize(item, bucket_size)) for item in value))
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _normalize(item, bucket_size)) for key, item in value.items()))
+    if isinstance(value, Cursor):
+        return (str(value), value.has_results)
+    return value
+
+
+def get_search_result_cache_key(
+    executor: str, organization_id: int, params: Mapping[str, Any], ttl: int
+) -> str:
+    now = int(time.time())
+    search_filters = params.get("search_filters") or ()
+    actor = params.get("actor")
+
+    normalized = (
+        executor,
+        now // ttl,
+        sorted(project.id for project in params["projects"]),
+        sorted(environment.id for environment in params.get("environments") or ()),
+        params.get("sort_by"),
+        params.get("limit"),
+        _normalize(params.get("cursor"), ttl),
+        params.get("count_hits"),
+        params.get("max_hits"),
+        _normalize(params.get("paginator_options") or {}, ttl),
+        sorted(repr(_normalize(search_filter, ttl)) for search_filter in search_filters),
+        _normalize(params.get("date_from"), ttl),
+        _normalize(params.get("date_to"), ttl),
+        getattr(actor, "id", None),
+        _normalize(params.get("aggregate_kwargs") or {}, ttl),
+        params.get("use_group_snuba_dataset"),
+    )
+    digest = md5_text(repr(normalized)).hexdigest()
+    generation = _get_generation(organization_id)
+    return f"search:results:{organization_id}:{generation}:{digest}"
+
+
+def _dump_cursor(cursor: Cursor | None) -> tuple[Any, ...] | None:
+    if cursor is None:
+        return None
+    return (type(cursor), cursor.value, cursor.offset, cursor.is_prev, cursor.has_results)
+
+
+def _load_cursor(dumped: tuple[Any, ...] | None) -> Cursor | None:
+    if dumped is None:
+        return None
+    cls, value, offset, is_prev, has_results = dumped
+    return cls(value, offset, is_prev, has_results)
+
+
+def _dump_result(result: CursorResult[Any]) -> dict[str, Any]:
+    return {
+        "group_ids": [group.id for group in result.results],
+        "next": _dump_cursor(result.next),
+        "prev": _dump_cursor(result.prev),
+        "hits": result.hits,
+        "max_hits": result.max_hits,
+        "cached_at": time.time(),
+    }
+
+
+def _load_result(dumped: Mapping[str, Any]) -> CursorResult[Any]:
+    from sentry.models.group import Group
+
+    # Groups are always loaded fresh, only their order comes from the cache.
+    groups = Group.objects.in_bulk(dumped["group_ids"])
+    return CursorResult(
+        results=[groups[group_id] for group_id in dumped["group_ids"] if group_id in groups],
+        next=_load_cursor(dumped["next"]),
+        prev=_load_cursor(dumped["prev"]),
+        hits=dumped["hits"],
+        max_hits=dumped["max_hits"],
+    )
+
+
+def cache_search_results(query_func: F) -> F:
+    """
+    Caches the results of a query executor's `query` method, see the module
+    docstring. Disabled unless `snuba.search.result-cache.ttl` is set.
+    """
+    signature = inspect.signature(query_func)
+
+    @functools.wraps(query_func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> CursorResult[Any]:
+        ttl = options.get("snuba.search.result-cache.ttl")
+        if not ttl:
+            return query_func(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = bound.arguments
+        if not params["projects"]:
+            return query_func(self, *args, **kwargs)
+
+        executor = type(self).__name__
+        cache_key = get_search_result_cache_key(
+            executor, params["projects"][0].organization_id, params, ttl
+        )
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            metrics.incr("snuba.search.result_cache", tags={"result": "hit", "executor": executor})
+            metrics.distribution(
+                "snuba.search.result_cache.age",
+                time.time() - cached["cached_at"],
+                tags={"executor": executor},
+                unit="second",
+            )
+            return _load_result(cached)
+
+        metrics.incr("snuba.search.result_cache", tags={"result": "miss", "executor": executor})
+        result = query_func(self, *args, **kwargs)
+        cache.set(cache_key, _dump_result(result), ttl)
+        return result
+
+    return wrapper  # type: ignore[return-value]
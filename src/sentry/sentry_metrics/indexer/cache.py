@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import logging
 import random
+import threading
 from collections.abc import Collection, Iterable, Mapping, MutableMapping, Sequence
 from datetime import datetime, timedelta
+from typing import Any
 
+from cachetools import TTLCache
 from django.conf import settings
 from django.core.cache import caches
 
@@ -33,6 +36,9 @@ _INDEXER_CACHE_RESOLVE_CACHE_REPLENISHMENT_METRIC = (
 _INDEXER_CACHE_DOUBLE_WRITE_METRIC = "sentry_metrics.indexer.memcache.double-write"
 _INDEXER_CACHE_DOUBLE_READ_METRIC = "sentry_metrics.indexer.memcache.new-schema-read"
 _INDEXER_CACHE_STALE_KEYS_METRIC = "sentry_metrics.indexer.memcache.stale-keys"
+_INDEXER_CACHE_REVERSE_RESOLVE_METRIC = "sentry_metrics.indexer.memcache.reverse_resolve"
+_INDEXER_LOCAL_CACHE_METRIC = "sentry_metrics.indexer.local_cache"
+_INDEXER_LOCAL_CACHE_EVICTIONS_METRIC = "sentry_metrics.indexer.local_cache.evictions"
 
 # only used to compare to the older version of the PGIndexer
 _INDEXER_CACHE_FETCH_METRIC = "sentry_metrics.indexer.memcache.fetch"
@@ -40,9 +46,17 @@ _INDEXER_CACHE_FETCH_METRIC = "sentry_metrics.indexer.memcache.fetch"
 
 NAMESPACED_WRITE_FEAT_FLAG = "sentry-metrics.indexer.write-new-cache-namespace"
 NAMESPACED_READ_FEAT_FLAG = "sentry-metrics.indexer.read-new-cache-namespace"
+LOCAL_CACHE_FEAT_FLAG = "sentry-metrics.indexer.local-cache.enabled"
+LOCAL_CACHE_NEGATIVE_FEAT_FLAG = "sentry-metrics.indexer.local-cache.negative-resolve"
+REVERSE_RESOLVE_CACHE_FEAT_FLAG = "sentry-metrics.indexer.reverse-resolve-cache"
 
 BULK_RECORD_CACHE_NAMESPACE = "br"
 RESOLVE_CACHE_NAMESPACE = "res"
+REVERSE_RESOLVE_CACHE_NAMESPACE = "rev"
+
+LOCAL_CACHE_MAX_SIZE = 100_000
+LOCAL_CACHE_TTL = 60
+LOCAL_CACHE_NEGATIVE_TTL = 5
 
 
 class StringIndexerCache:
@@ -204,11 +218,156 @@ class StringIndexerCache:
                 version=self.version,
             )
 
+    def _make_reverse_cache_key(self, use_case_id: UseCaseID, org_id: int, id: int) -> str:
+        namespace = REVERSE_RESOLVE_CACHE_NAMESPACE
+        return f"indexer:{self.partition_key}:{namespace}:org:id:{use_case_id.value}:{org_id}:{id}"
+
+    def get_reverse(self, use_case_id: UseCaseID, org_id: int, id: int) -> str | None:
+        return self.cache.get(
+            self._make_reverse_cache_key(use_case_id, org_id, id), version=self.version
+        )
+
+    def set_reverse(self, use_case_id: UseCaseID, org_id: int, id: int, string: str) -> None:
+        self.cache.set(
+            key=self._make_reverse_cache_key(use_case_id, org_id, id),
+            value=string,
+            timeout=self.randomized_ttl,
+            version=self.version,
+        )
+
+
+class _EvictionCountingTTLCache(TTLCache):
+    """
+    A `TTLCache` that counts the entries it evicts because it is full.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.evictions = 0
+
+    def popitem(self) -> tuple[Any, Any]:
+        self.evictions += 1
+        return super().popitem()
+
+
+class LocalIndexerCache:
+    """
+    In-process tier in front of `StringIndexerCache`, with a bounded size and
+    TTL per entry.
+
+    The id of a string never changes once it has been written, so positive
+    entries (string -> id and id -> string) can only go stale if the string is
+    removed from the indexer altogether, in which case the local tier adds at
+    most `ttl` seconds to the staleness of the shared cache.
+
+    Negative entries for `resolve` misses are kept in a separate cache with a
+    much shorter TTL. Writing an id through this process replaces negative
+    entries immediately, other processes see the new id once their negative
+    entry expires.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = LOCAL_CACHE_MAX_SIZE,
+        ttl: float = LOCAL_CACHE_TTL,
+        negative_ttl: float = LOCAL_CACHE_NEGATIVE_TTL,
+    ):
+        self._entries = _EvictionCountingTTLCache(maxsize=maxsize, ttl=ttl)
+        self._negative = _EvictionCountingTTLCache(maxsize=maxsize, ttl=negative_ttl)
+        self._lock = threading.Lock()
+
+    def get_many(self, namespace: str, keys: Collection[Any], caller: str) -> dict[Any, Any]:
+        """
+        Returns the locally cached values of `keys` that are present, missing
+        keys are left out.
+        """
+        with self._lock:
+            results = {
+                key: value
+                for key in keys
+                if (value := self._entries.get((namespace, key))) is not None
+            }
+
+        self._record(namespace, caller, hits=len(results), total=len(keys))
+        return results
+
+    def get(self, namespace: str, key: Any, caller: str) -> Any | None:
+        return self.get_many(namespace, [key], caller).get(key)
+
+    def is_negative(self, namespace: str, key: Any) -> bool:
+        with self._lock:
+            return (namespace, key) in self._negative
+
+    def set_many(self, namespace: str, key_values: Mapping[Any, Any]) -> None:
+        if not key_values:
+            return
+
+        with self._lock:
+            evictions = self._entries.evictions
+            for key, value in key_values.items():
+                self._entries[(namespace, key)] = value
+                self._negative.pop((namespace, key), None)
+            evictions = self._entries.evictions - evictions
+
+        if evictions:
+            metrics.incr(
+                _INDEXER_LOCAL_CACHE_EVICTIONS_METRIC,
+                amount=evictions,
+                tags={"namespace": namespace, "negative": "false"},
+            )
+
+    def set(self, namespace: str, key: Any, value: Any) -> None:
+        self.set_many(namespace, {key: value})
+
+    def set_negative(self, namespace: str, key: Any) -> None:
+        with self._lock:
+            evictions = self._negative.evictions
+            self._negative[(namespace, key)] = True
+            evictions = self._negative.evictions - evictions
+
+        if evictions:
+            metrics.incr(
+                _INDEXER_LOCAL_CACHE_EVICTIONS_METRIC,
+                amount=evictions,
+                tags={"namespace": namespace, "negative": "true"},
+            )
+
+    def delete_many(self, namespace: str, keys: Iterable[Any]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop((namespace, key), None)
+                self._negative.pop((namespace, key), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._negative.clear()
+
+    def _record(self, namespace: str, caller: str, hits: int, total: int) -> None:
+        if hits:
+            metrics.incr(
+                _INDEXER_LOCAL_CACHE_METRIC,
+                amount=hits,
+                tags={"cache_hit": "true", "caller": caller, "namespace": namespace},
+            )
+        if total - hits:
+            metrics.incr(
+                _INDEXER_LOCAL_CACHE_METRIC,
+                amount=total - hits,
+                tags={"cache_hit": "false", "caller": caller, "namespace": namespace},
+            )
+
 
 class CachingIndexer(StringIndexer):
-    def __init__(self, cache: StringIndexerCache, indexer: StringIndexer) -> None:
+    def __init__(
+        self,
+        cache: StringIndexerCache,
+        indexer: StringIndexer,
+        local_cache: LocalIndexerCache | None = None,
+    ) -> None:
         self.cache = cache
         self.indexer = indexer
+        self.local_cache = local_cache if local_cache is not None else LocalIndexerCache()
 
     def bulk_record(
         self, strings: Mapping[UseCaseID, Mapping[OrgId, set[str]]]
@@ -216,7 +375,20 @@ class CachingIndexer(StringIndexer):
         cache_keys = UseCaseKeyCollection(strings)
         metrics.gauge("sentry_metrics.indexer.lookups_per_batch", value=cache_keys.size)
         cache_key_strs = cache_keys.as_strings()
-        cache_results = self.cache.get_many(BULK_RECORD_CACHE_NAMESPACE, cache_key_strs)
+
+        use_local_cache = options.get(LOCAL_CACHE_FEAT_FLAG)
+        local_results: Mapping[str, int] = {}
+        if use_local_cache:
+            local_results = self.local_cache.get_many(
+                BULK_RECORD_CACHE_NAMESPACE, cache_key_strs, caller="get_many_ids"
+            )
+            cache_key_strs = [k for k in cache_key_strs if k not in local_results]
+
+        cache_results = (
+            self.cache.get_many(BULK_RECORD_CACHE_NAMESPACE, cache_key_strs)
+            if cache_key_strs
+            else {}
+        )
 
         hits = [k for k, v in cache_results.items() if v is not None]
 
@@ -238,6 +410,13 @@ class CachingIndexer(StringIndexer):
             amount=cache_keys.size,
         )
 
+        if use_local_cache:
+            self.local_cache.set_many(
+                BULK_RECORD_CACHE_NAMESPACE,
+                {k: v for k, v in cache_results.items() if v is not None},
+            )
+            cache_results = {**cache_results, **local_results}
+
         cache_key_results = UseCaseKeyResults()
         cache_key_results.add_use_case_key_results(
             [UseCaseKeyResult.from_string(k, v) for k, v in cache_results.items() if v is not None],
@@ -256,9 +435,13 @@ class CachingIndexer(StringIndexer):
             }
         )
 
-        self.cache.set_many(
-            BULK_RECORD_CACHE_NAMESPACE, db_record_key_results.get_mapped_strings_to_ints()
-        )
+        db_record_strings_to_ints = db_record_key_results.get_mapped_strings_to_ints()
+        self.cache.set_many(BULK_RECORD_CACHE_NAMESPACE, db_record_strings_to_ints)
+
+        if use_local_cache:
+            self.local_cache.set_many(BULK_RECORD_CACHE_NAMESPACE, db_record_strings_to_ints)
+            # ids written by this process replace negative `resolve` entries right away
+            self.local_cache.set_many(RESOLVE_CACHE_NAMESPACE, db_record_strings_to_ints)
 
         return cache_key_results.merge(db_record_key_results)
 
@@ -269,6 +452,21 @@ class CachingIndexer(StringIndexer):
     @metric_path_key_compatible_resolve
     def resolve(self, use_case_id: UseCaseID, org_id: int, string: str) -> int | None:
         key = f"{use_case_id.value}:{org_id}:{string}"
+
+        use_local_cache = options.get(LOCAL_CACHE_FEAT_FLAG)
+        if use_local_cache:
+            local_result = self.local_cache.get(RESOLVE_CACHE_NAMESPACE, key, caller="resolve")
+            if local_result is not None:
+                return local_result
+            if options.get(LOCAL_CACHE_NEGATIVE_FEAT_FLAG) and self.local_cache.is_negative(
+                RESOLVE_CACHE_NAMESPACE, key
+            ):
+                metrics.incr(
+                    _INDEXER_LOCAL_CACHE_METRIC,
+                    tags={"cache_hit": "true", "caller": "resolve", "namespace": "negative"},
+                )
+                return None
+
         result = self.cache.get(RESOLVE_CACHE_NAMESPACE, key)
 
         if result and isinstance(result, int):
@@ -276,6 +474,8 @@ class CachingIndexer(StringIndexer):
                 _INDEXER_CACHE_RESOLVE_METRIC,
                 tags={"cache_hit": "true", "use_case": use_case_id.value},
             )
+            if use_local_cache:
+                self.local_cache.set(RESOLVE_CACHE_NAMESPACE, key, result)
             return result
 
         id = self.indexer.resolve(use_case_id, org_id, string)
@@ -293,12 +493,46 @@ class CachingIndexer(StringIndexer):
                     tags={"use_case": use_case_id.value},
                 )
                 self.cache.set(RESOLVE_CACHE_NAMESPACE, key, id)
+            if use_local_cache:
+                self.local_cache.set(RESOLVE_CACHE_NAMESPACE, key, id)
+        elif use_local_cache and options.get(LOCAL_CACHE_NEGATIVE_FEAT_FLAG):
+            self.local_cache.set_negative(RESOLVE_CACHE_NAMESPACE, key)
 
         return id
 
     @metric_path_key_compatible_rev_resolve
     def reverse_resolve(self, use_case_id: UseCaseID, org_id: int, id: int) -> str | None:
-        return self.indexer.reverse_resolve(use_case_id, org_id, id)
+        key = (use_case_id.value, org_id, id)
+
+        use_local_cache = options.get(LOCAL_CACHE_FEAT_FLAG)
+        if use_local_cache:
+            local_result = self.local_cache.get(
+                REVERSE_RESOLVE_CACHE_NAMESPACE, key, caller="reverse_resolve"
+            )
+            if local_result is not None:
+                return local_result
+
+        use_shared_cache = options.get(REVERSE_RESOLVE_CACHE_FEAT_FLAG)
+        string = None
+        if use_shared_cache:
+            string = self.cache.get_reverse(use_case_id, org_id, id)
+            metrics.incr(
+                _INDEXER_CACHE_REVERSE_RESOLVE_METRIC,
+                tags={
+                    "cache_hit": "true" if string is not None else "false",
+                    "use_case": use_case_id.value,
+                },
+            )
+
+        if string is None:
+            string = self.indexer.reverse_resolve(use_case_id, org_id, id)
+            if string is not None and use_shared_cache:
+                self.cache.set_reverse(use_case_id, org_id, id, string)
+
+        if string is not None and use_local_cache:
+            self.local_cache.set(REVERSE_RESOLVE_CACHE_NAMESPACE, key, string)
+
+        return string
 
     def bulk_reverse_resolve(
         self, use_case_id: UseCaseID, org_id: int, ids: Collection[int]
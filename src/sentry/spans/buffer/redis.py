@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Mapping
+import struct
+from collections.abc import Mapping, Sequence
 from typing import NamedTuple
 
 import sentry_sdk
@@ -9,9 +10,18 @@ from django.conf import settings
 from sentry_redis_tools.clients import RedisCluster, StrictRedis
 
 from sentry import options
-from sentry.utils import redis
+from sentry.utils import metrics, redis
 from sentry.utils.iterators import chunked
 
+# Spans of a segment in assembly mode are stored as one list element per
+# write, holding all spans of the write prefixed by their length.
+SPAN_FRAME_HEADER = struct.Struct(">I")
+FRAMED_SEGMENT_SUFFIX = ":framed"
+# Number of list elements fetched per LRANGE when streaming segments.
+SEGMENT_PAGE_SIZE = 100
+# Number of segments read with a single pipeline when streaming segments.
+SEGMENT_BATCH_SIZE = 100
+
 
 @dataclasses.dataclass
 class ProcessSegmentsContext:
@@ -34,6 +44,34 @@ def get_segment_key(project_id: str | int, segment_id: str) -> str:
     return f"segment:{segment_id}:{project_id}:process-segment"
 
 
+def get_framed_segment_key(project_id: str | int, segment_id: str) -> str:
+    return get_segment_key(project_id, segment_id) + FRAMED_SEGMENT_SUFFIX
+
+
+def get_segment_size_key(segment_key: str) -> str:
+    return f"{segment_key}:size"
+
+
+def is_framed_segment_key(segment_key: str) -> bool:
+    return segment_key.endswith(FRAMED_SEGMENT_SUFFIX)
+
+
+def encode_span_frames(spans: Sequence[bytes]) -> bytes:
+    return b"".join(SPAN_FRAME_HEADER.pack(len(span)) + span for span in spans)
+
+
+def decode_span_frames(frames: Sequence[bytes]) -> list[bytes]:
+    spans = []
+    for data in frames:
+        offset = 0
+        while offset < len(data):
+            (length,) = SPAN_FRAME_HEADER.unpack_from(data, offset)
+            offset += SPAN_FRAME_HEADER.size
+            spans.append(data[offset : offset + length])
+            offset += length
+    return spans
+
+
 def get_last_processed_timestamp_key(partition_index: int) -> str:
     return f"performance-issues:last-processed-timestamp:partition:{partition_index}"
 
@@ -61,20 +99,33 @@ class RedisSpansBuffer:
         3. Checks if 1 second has passed since the last time segments were processed for a partition.
         """
         keys = list(spans_map.keys())
+        segment_keys = []
         spans_written_per_segment = []
         ttl = options.get("standalone-spans.buffer-ttl.seconds")
+        assemble_segments = options.get("standalone-spans.buffer-segment-assembly.enable")
 
         # Batch write spans in a segment
         with self.client.pipeline() as p:
             for key in keys:
                 segment_id, project_id, partition = key
                 spans = spans_map[key]
-                segment_key = get_segment_key(project_id, segment_id)
-                # RPUSH is atomic
-                p.rpush(segment_key, *spans)
-                spans_written_per_segment.append(len(spans))
+                if assemble_segments:
+                    segment_key = get_framed_segment_key(project_id, segment_id)
+                    frames = encode_span_frames(spans)
+                    # RPUSH is atomic
+                    p.rpush(segment_key, frames)
+                    p.incrby(get_segment_size_key(segment_key), len(frames))
+                    spans_written_per_segment.append(1)
+                else:
+                    segment_key = get_segment_key(project_id, segment_id)
+                    # RPUSH is atomic
+                    p.rpush(segment_key, *spans)
+                    spans_written_per_segment.append(len(spans))
+                segment_keys.append(segment_key)
 
             results = p.execute()
+            if assemble_segments:
+                results = results[::2]
 
         partitions = list(latest_ts_by_partition.keys())
         with self.client.pipeline() as p:
@@ -86,16 +137,16 @@ class RedisSpansBuffer:
                 # GETSET is atomic
                 p.getset(timestamp_key, timestamp)
 
-            for result in zip(keys, spans_written_per_segment, results):
+            for result in zip(keys, segment_keys, spans_written_per_segment, results):
                 # Check if this is a new segment, if yes, add to bucket to be processed
-                key, num_written, num_total = result
+                key, segment_key, num_written, num_total = result
                 if num_written == num_total:
-                    segment_id, project_id, partition = key
-                    segment_key = get_segment_key(project_id, segment_id)
-                    bucket = get_unprocessed_segments_key(partition)
+                    bucket = get_unprocessed_segments_key(key.partition)
 
                     timestamp = segment_first_seen_ts[key]
                     p.expire(segment_key, ttl)
+                    if is_framed_segment_key(segment_key):
+                        p.expire(get_segment_size_key(segment_key), ttl)
                     p.rpush(bucket, timestamp, segment_key)
 
             timestamp_results = p.execute()
@@ -124,18 +175,72 @@ class RedisSpansBuffer:
             p.delete(*keys)
             response = p.execute()
 
-        for value in response[:-1]:
+        for key, value in zip(keys, response[:-1]):
+            if is_framed_segment_key(key):
+                value = decode_span_frames(value)
             values.append(value)
 
         return values
 
+    def read_and_expire_segment_batch(self, keys: Sequence[str]) -> list[tuple[str, list[bytes]]]:
+        """
+        Reads the spans of the given segments with a single pipeline and
+        expires the segments.
+
+        Segments are fetched in pages of `SEGMENT_PAGE_SIZE` list elements, so
+        no single Redis reply holds more than a page of every segment in the
+        batch. Segments larger than `standalone-spans.buffer-max-segment-bytes`
+        are evicted without being read, based on the size recorded when
+        writing them. Segments without spans are skipped.
+        """
+        max_segment_bytes = options.get("standalone-spans.buffer-max-segment-bytes")
+
+        with self.client.pipeline() as p:
+            for key in keys:
+                p.get(get_segment_size_key(key))
+                p.lrange(key, 0, SEGMENT_PAGE_SIZE - 1)
+            response = p.execute()
+
+        segments = []
+        for key, size, page in zip(keys, response[::2], response[1::2]):
+            if max_segment_bytes and size is not None and int(size) > max_segment_bytes:
+                metrics.incr("spans.buffer.segment_evicted", tags={"reason": "size"})
+                continue
+
+            frames = list(page)
+            while len(page) == SEGMENT_PAGE_SIZE:
+                page = self.client.lrange(key, len(frames), len(frames) + SEGMENT_PAGE_SIZE - 1)
+                frames.extend(page)
+
+            if not frames:
+                continue
+
+            if is_framed_segment_key(key):
+                segments.append((key, decode_span_frames(frames)))
+            else:
+                segments.append((key, frames))
+
+        self._expire_segments(keys)
+        return segments
+
+    def _expire_segments(self, keys: Sequence[str]) -> None:
+        with self.client.pipeline() as p:
+            for key in keys:
+                p.delete(key)
+                if is_framed_segment_key(key):
+                    p.delete(get_segment_size_key(key))
+            p.execute()
+
     def get_unprocessed_segments_and_prune_bucket(self, now: int, partition: int) -> list[str]:
         key = get_unprocessed_segments_key(partition)
         results = self.client.lrange(key, 0, -1) or []
 
         buffer_window = options.get("standalone-spans.buffer-window.seconds")
 
+        max_segment_age = options.get("standalone-spans.buffer-max-segment-age.seconds")
+
         segment_keys = []
+        expired_segment_keys = []
         processed_segment_ts = None
         for result in chunked(results, 2):
             try:
@@ -145,13 +250,38 @@ class RedisSpansBuffer:
                     break
 
                 processed_segment_ts = segment_timestamp
+                if max_segment_age and now - segment_timestamp > max_segment_age:
+                    expired_segment_keys.append(segment_key.decode("utf-8"))
+                    continue
+
                 segment_keys.append(segment_key.decode("utf-8"))
+                metrics.distribution(
+                    "spans.buffer.segment_assembly_latency",
+                    now - segment_timestamp,
+                    tags={"partition": partition},
+                    unit="second",
+                )
             except Exception:
                 # Just in case something funky happens here
                 sentry_sdk.capture_exception()
                 break
 
-        self.client.ltrim(key, len(segment_keys) * 2, -1)
+        num_pruned = len(segment_keys) + len(expired_segment_keys)
+        self.client.ltrim(key, num_pruned * 2, -1)
+
+        if expired_segment_keys:
+            metrics.incr(
+                "spans.buffer.segment_evicted",
+                amount=len(expired_segment_keys),
+                tags={"reason": "age"},
+            )
+            self._expire_segments(expired_segment_keys)
+
+        metrics.gauge(
+            "spans.buffer.unprocessed_segments",
+            len(results) // 2 - num_pruned,
+            tags={"partition": partition},
+        )
 
         segment_context = {"current_timestamp": now, "segment_timestamp": processed_segment_ts}
         sentry_sdk.set_context("processed_segment", segment_context)
@@ -1,7 +1,7 @@
 import dataclasses
 import logging
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import Any
 
 import orjson
@@ -21,10 +21,16 @@ from sentry_kafka_schemas.schema_types.snuba_spans_v1 import SpanEvent
 
 from sentry import options
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
-from sentry.spans.buffer.redis import ProcessSegmentsContext, RedisSpansBuffer, SegmentKey
-from sentry.spans.consumers.process.strategy import CommitSpanOffsets, NoOp
+from sentry.spans.buffer.redis import (
+    SEGMENT_BATCH_SIZE,
+    ProcessSegmentsContext,
+    RedisSpansBuffer,
+    SegmentKey,
+)
+from sentry.spans.consumers.process.strategy import CommitSpanOffsets, LazyUnfold, NoOp
 from sentry.utils import metrics
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
+from sentry.utils.iterators import chunked
 from sentry.utils.kafka_config import get_kafka_producer_cluster_options, get_topic_definition
 
 logger = logging.getLogger(__name__)
@@ -194,6 +200,19 @@ def batch_write_to_redis(
         return FILTERED_PAYLOAD
 
 
+def _build_segment_payload(segment_key: str, segment: list[bytes]) -> KafkaPayload | None:
+    payload_data = prepare_buffered_segment_payload(segment)
+    if len(payload_data) > MAX_PAYLOAD_SIZE:
+        logger.warning(
+            "Failed to produce message: max payload size exceeded.",
+            extra={"segment_key": segment_key},
+        )
+        metrics.incr("performance.buffered_segments.max_payload_size_exceeded")
+        return None
+
+    return KafkaPayload(None, payload_data, [])
+
+
 def _expand_segments(should_process_segments: list[ProcessSegmentsContext]):
     with sentry_sdk.start_transaction(op="process", name="spans.process.expand_segments") as txn:
         buffered_segments: list[KafkaPayload | FilteredPayload] = []
@@ -226,16 +245,9 @@ def _expand_segments(should_process_segments: list[ProcessSegmentsContext]):
                         if not segment:
                             continue
 
-                        payload_data = prepare_buffered_segment_payload(segment)
-                        if len(payload_data) > MAX_PAYLOAD_SIZE:
-                            logger.warning(
-                                "Failed to produce message: max payload size exceeded.",
-                                extra={"segment_key": keys[i + j]},
-                            )
-                            metrics.incr("performance.buffered_segments.max_payload_size_exceeded")
-                            continue
-
-                        buffered_segments.append(KafkaPayload(None, payload_data, []))
+                        payload = _build_segment_payload(keys[i + j], segment)
+                        if payload is not None:
+                            buffered_segments.append(payload)
 
     return buffered_segments
 
@@ -248,6 +260,46 @@ def expand_segments(should_process_segments: list[ProcessSegmentsContext]):
         return []
 
 
+def _stream_segments(
+    should_process_segments: list[ProcessSegmentsContext],
+) -> Iterator[KafkaPayload]:
+    client = RedisSpansBuffer()
+
+    for result in should_process_segments:
+        if not result.should_process_segments:
+            continue
+
+        with sentry_sdk.start_transaction(
+            op="process", name="spans.process.fetch_unprocessed_segments"
+        ):
+            keys = client.get_unprocessed_segments_and_prune_bucket(
+                result.timestamp, result.partition
+            )
+            sentry_sdk.set_measurement("segments.count", len(keys))
+
+        # Segments are read and built one batch at a time, and only yielded
+        # once the transaction of the batch is finished, so it doesn't stay
+        # open while the producer applies backpressure.
+        for batch in chunked(keys, SEGMENT_BATCH_SIZE):
+            with sentry_sdk.start_transaction(op="process", name="spans.process.stream_segments"):
+                payloads = [
+                    payload
+                    for key, segment in client.read_and_expire_segment_batch(batch)
+                    if (payload := _build_segment_payload(key, segment)) is not None
+                ]
+
+            yield from payloads
+
+
+def stream_segments(
+    should_process_segments: list[ProcessSegmentsContext],
+) -> Iterator[KafkaPayload]:
+    try:
+        yield from _stream_segments(should_process_segments)
+    except Exception:
+        sentry_sdk.capture_exception()
+
+
 class ProcessSpansStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
     """
     1. Process spans and push them to redis
@@ -293,7 +345,13 @@ class ProcessSpansStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
             next_step=NoOp(),
         )
 
-        unfold_step = Unfold(generator=expand_segments, next_step=produce_step)
+        unfold_step: ProcessingStrategy[Any]
+        if options.get("standalone-spans.buffer-segment-assembly.enable"):
+            # Segments are streamed to the producer instead of being expanded
+            # into one list per flush.
+            unfold_step = LazyUnfold(generator=stream_segments, next_step=produce_step)
+        else:
+            unfold_step = Unfold(generator=expand_segments, next_step=produce_step)
 
         commit_step = CommitSpanOffsets(commit=commit, next_step=unfold_step)
 
@@ -1,10 +1,14 @@
-from typing import Any, Generic, TypeVar
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Generic, TypeVar, Union, cast
 
-from arroyo.processing.strategies.abstract import ProcessingStrategy
+from arroyo.processing.strategies.abstract import MessageRejected, ProcessingStrategy
 from arroyo.processing.strategies.commit import CommitOffsets
-from arroyo.types import Commit, Message
+from arroyo.types import Commit, FilteredPayload, Message, Value
 
 TPayload = TypeVar("TPayload")
+TInput = TypeVar("TInput")
+TOutput = TypeVar("TOutput")
 
 
 class CommitSpanOffsets(CommitOffsets, Generic[TPayload]):
@@ -56,3 +60,95 @@ class NoOp(ProcessingStrategy[Any]):
 
     def join(self, timeout: float | None = None) -> None:
         pass
+
+
+class LazyUnfold(ProcessingStrategy[Union[FilteredPayload, TInput]], Generic[TInput, TOutput]):
+    """
+    Like arroyo's `Unfold`, but the generator function may return any iterable,
+    which is consumed lazily. `Unfold` needs the size of the collection upfront,
+    so every generated value has to be held in memory at once. Here values are
+    only pulled from the iterator while the next step accepts them, so when the
+    next step applies backpressure only the rejected message and the value read
+    ahead of it are held.
+
+    Offsets are carried by the last generated message, like in `Unfold`.
+    """
+
+    def __init__(
+        self,
+        generator: Callable[[TInput], Iterable[TOutput]],
+        next_step: ProcessingStrategy[FilteredPayload | TOutput],
+    ) -> None:
+        self.__generator = generator
+        self.__next_step = next_step
+        self.__closed = False
+        self.__messages: Iterator[Message[TOutput]] | None = None
+        self.__pending: Message[TOutput] | None = None
+
+    def __unfold(self, message: Message[TInput]) -> Iterator[Message[TOutput]]:
+        iterator = iter(self.__generator(message.payload))
+        try:
+            value = next(iterator)
+        except StopIteration:
+            return
+
+        # Look ahead one value so the last message can carry the offsets.
+        for next_value in iterator:
+            yield Message(Value(value, {}, message.timestamp))
+            value = next_value
+
+        yield Message(Value(value, message.committable, message.timestamp))
+
+    def __flush(self) -> None:
+        while self.__pending is not None:
+            self.__next_step.submit(self.__pending)
+            assert self.__messages is not None
+            self.__pending = next(self.__messages, None)
+
+        self.__messages = None
+
+    def submit(self, message: Message[FilteredPayload | TInput]) -> None:
+        assert not self.__closed
+        if self.__pending is not None:
+            raise MessageRejected
+
+        if isinstance(message.payload, FilteredPayload):
+            self.__next_step.submit(cast(Message[Union[FilteredPayload, TOutput]], message))
+            return
+
+        self.__messages = self.__unfold(cast(Message[TInput], message))
+        self.__pending = next(self.__messages, None)
+
+        try:
+            self.__flush()
+        except MessageRejected:
+            pass
+
+    def poll(self) -> None:
+        try:
+            self.__flush()
+        except MessageRejected:
+            pass
+
+        self.__next_step.poll()
+
+    def close(self) -> None:
+        self.__closed = True
+
+    def terminate(self) -> None:
+        self.__closed = True
+        if self.__messages is not None:
+            self.__messages.close()
+        self.__next_step.terminate()
+
+    def join(self, timeout: float | None = None) -> None:
+        deadline = time.time() + timeout if timeout is not None else None
+        while self.__pending is not None:
+            if deadline is not None and time.time() >= deadline:
+                break
+            self.poll()
+
+        self.__next_step.close()
+        self.__next_step.join(
+            timeout=max(deadline - time.time(), 0) if deadline is not None else None
+        )
@@ -2,15 +2,18 @@ import logging
 import time
 from datetime import datetime
 
+from sentry import options
 from sentry.digests import get_option_key
 from sentry.digests.backends.base import InvalidState
-from sentry.digests.notifications import build_digest, split_key
+from sentry.digests.notifications import DigestInfo, build_digest, split_key
 from sentry.digests.types import Record
 from sentry.models.options.project_option import ProjectOption
 from sentry.models.project import Project
+from sentry.notifications.types import ActionTargetType, FallthroughChoiceType
 from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task
-from sentry.utils import snuba
+from sentry.utils import metrics, snuba
+from sentry.utils.iterators import chunked
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +39,16 @@ def schedule_digests() -> None:
     timeout = 300
     digests.backend.maintenance(deadline - timeout)
 
-    for entry in digests.backend.schedule(deadline):
-        deliver_digest.delay(entry.key, entry.timestamp)
+    batch_size = options.get("digests.delivery-batch-size")
+    if not batch_size:
+        for entry in digests.backend.schedule(deadline):
+            deliver_digest.delay(entry.key, entry.timestamp)
+        return
+
+    # The batch size also bounds how many digests are built concurrently, as
+    # every batch is delivered by a single task.
+    for entries in chunked(digests.backend.schedule(deadline), batch_size):
+        deliver_digests.delay([(entry.key, entry.timestamp) for entry in entries])
 
 
 @instrumented_task(
@@ -51,7 +62,6 @@ def deliver_digest(
     notification_uuid: str | None = None,
 ) -> None:
     from sentry import digests
-    from sentry.mail import mail_adapter
 
     try:
         project, target_type, target_identifier, fallthrough_choice = split_key(key)
@@ -75,27 +85,95 @@ def deliver_digest(
             logger.info("Skipped digest delivery: %s", error, exc_info=True)
             return
 
-        if digest.digest:
-            mail_adapter.notify_digest(
+        _notify_digest(
+            project, digest, target_type, target_identifier, fallthrough_choice, notification_uuid
+        )
+
+
+@instrumented_task(
+    name="sentry.tasks.digests.deliver_digests",
+    queue="digests.delivery",
+    silo_mode=SiloMode.REGION,
+)
+def deliver_digests(entries: list[tuple[str, float]]) -> None:
+    """
+    Delivers a batch of scheduled digests, opening and closing all of their
+    timelines together rather than one task and lock per timeline.
+    """
+    from sentry import digests
+
+    targets = {}
+    for key, _ in entries:
+        try:
+            targets[key] = split_key(key)
+        except Project.DoesNotExist as error:
+            logger.info("Cannot deliver digest %s due to error: %s", key, error)
+            digests.backend.delete(key)
+
+    minimum_delays = {
+        key: ProjectOption.objects.get_value(project, get_option_key("mail", "minimum_delay"))
+        for key, (project, *_) in targets.items()
+    }
+
+    notifications: list[tuple[str, DigestInfo, str | None]] = []
+    with snuba.options_override({"consistent": True}):
+        with digests.backend.digest_many(minimum_delays) as records_by_key:
+            for key, records in list(records_by_key.items()):
+                try:
+                    digest = build_digest(targets[key][0], records)
+                except Exception:
+                    # Leaves the timeline in the ready state, so that it is
+                    # retried without holding up the rest of the batch.
+                    logger.exception("Failed to build digest %s", key)
+                    del records_by_key[key]
+                    continue
+                notifications.append((key, digest, get_notification_uuid_from_records(records)))
+
+        metrics.incr("digests.deliver_digests.skipped", amount=len(entries) - len(notifications))
+
+        for key, digest, notification_uuid in notifications:
+            project, target_type, target_identifier, fallthrough_choice = targets[key]
+            _notify_digest(
                 project,
                 digest,
                 target_type,
                 target_identifier,
-                fallthrough_choice=fallthrough_choice,
-                notification_uuid=notification_uuid,
-            )
-        else:
-            logger.info(
-                "Skipped digest delivery due to empty digest",
-                extra={
-                    "project": project.id,
-                    "target_type": target_type.value,
-                    "target_identifier": target_identifier,
-                    "fallthrough_choice": fallthrough_choice.value if fallthrough_choice else None,
-                },
+                fallthrough_choice,
+                notification_uuid,
             )
 
 
+def _notify_digest(
+    project: Project,
+    digest: DigestInfo,
+    target_type: ActionTargetType,
+    target_identifier: str | None,
+    fallthrough_choice: FallthroughChoiceType | None,
+    notification_uuid: str | None,
+) -> None:
+    from sentry.mail import mail_adapter
+
+    if digest.digest:
+        mail_adapter.notify_digest(
+            project,
+            digest,
+            target_type,
+            target_identifier,
+            fallthrough_choice=fallthrough_choice,
+            notification_uuid=notification_uuid,
+        )
+    else:
+        logger.info(
+            "Skipped digest delivery due to empty digest",
+            extra={
+                "project": project.id,
+                "target_type": target_type.value,
+                "target_identifier": target_identifier,
+                "fallthrough_choice": fallthrough_choice.value if fallthrough_choice else None,
+            },
+        )
+
+
 def get_notification_uuid_from_records(records: list[Record]) -> str | None:
     for record in records:
         try:
@@ -1,9 +1,12 @@
 import logging
 import time
+import uuid
+from datetime import datetime, timezone
 
 import sentry_sdk
 from django.db import router, transaction
 
+from sentry import options
 from sentry.models.organization import Organization
 from sentry.relay import projectconfig_cache, projectconfig_debounce_cache
 from sentry.silo.base import SiloMode
@@ -102,20 +105,35 @@ def validate_args(organization_id=None, project_id=None, public_key=None):
         raise TypeError("Must provide exactly one of organzation_id, project_id or public_key")
 
 
-def compute_configs(organization_id=None, project_id=None, public_key=None):
+def compute_configs(
+    organization_id=None, project_id=None, public_key=None, sections=None, revisions=None
+):
     """Computes all configs for the org, project or single public key.
 
     You must only provide one single argument, not all.
 
+    :param sections: If given, only these sections of the cached configs are recomputed
+       and spliced into them, see :func:`recompute_projectkey_config_sections`.
+    :param revisions: If given, the revision of the cached config every spliced config is
+       based on is added to it, by public key.
     :returns: A dict mapping all affected public keys to their config.  The dict will not
        contain keys which should be retained in the cache unchanged.
     """
     from sentry.models.project import Project
     from sentry.models.projectkey import ProjectKey
+    from sentry.relay.config import get_organization_config_sections
 
     validate_args(organization_id, project_id, public_key)
     configs = {}
 
+    def recompute(key, organization_sections=None):
+        cached = projectconfig_cache.backend.get(key.public_key)
+        if cached is None:
+            return None
+        if sections:
+            return recompute_projectkey_config_sections(key, cached, sections, revisions)
+        return compute_projectkey_config(key, organization_sections=organization_sections)
+
     if organization_id:
         # We want to re-compute all projects in an organization, instead of simply
         # removing the configs and rely on relay requests to lazily re-compute them.  This
@@ -124,15 +142,21 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
         # it could be possible that refrequent invalidations cause the task to take excessive time
         # to complete.
         for organization in Organization.objects.filter(id=organization_id):
+            # Sections shared by all projects of the organization are computed lazily, at
+            # most once for the whole organization.
+            organization_sections = None
             for project in Project.objects.filter(organization_id=organization_id):
                 project.set_cached_field_value("organization", organization)
                 for key in ProjectKey.objects.filter(project_id=project.id):
                     key.set_cached_field_value("project", project)
+                    if organization_sections is None and not sections:
+                        organization_sections = get_organization_config_sections(organization)
                     # If we find the config in the cache it means it was active.  As such we want to
                     # recalculate it.  If the config was not there at all, we leave it and avoid the
                     # cost of re-computation.
-                    if projectconfig_cache.backend.get(key.public_key) is not None:
-                        configs[key.public_key] = compute_projectkey_config(key)
+                    config = recompute(key, organization_sections)
+                    if config is not None:
+                        configs[key.public_key] = config
                         action = "recompute"
                     else:
                         action = "not-cached"
@@ -147,8 +171,9 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
                 # If we find the config in the cache it means it was active.  As such we want to
                 # recalculate it.  If the config was not there at all, we leave it and avoid the
                 # cost of re-computation.
-                if projectconfig_cache.backend.get(key.public_key) is not None:
-                    configs[key.public_key] = compute_projectkey_config(key)
+                config = recompute(key)
+                if config is not None:
+                    configs[key.public_key] = config
                     action = "recompute"
                 else:
                     action = "not-cached"
@@ -170,7 +195,13 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
             # bug was fixed in https://github.com/getsentry/sentry/pull/35671
             configs[public_key] = {"disabled": True}
         else:
-            configs[public_key] = compute_projectkey_config(key)
+            cached = projectconfig_cache.backend.get(public_key) if sections else None
+            if cached is not None:
+                configs[public_key] = recompute_projectkey_config_sections(
+                    key, cached, sections, revisions
+                )
+            else:
+                configs[public_key] = compute_projectkey_config(key)
 
     else:
         raise TypeError("One of the arguments must not be None")
@@ -178,9 +209,11 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
     return configs
 
 
-def compute_projectkey_config(key):
+def compute_projectkey_config(key, organization_sections=None):
     """Computes a single config for the given :class:`ProjectKey`.
 
+    :param organization_sections: Pre-computed organization sections, see
+       :func:`sentry.relay.config.get_organization_config_sections`.
     :returns: A dict with the project config.
     """
     from sentry.models.projectkey import ProjectKeyStatus
@@ -189,7 +222,57 @@ def compute_projectkey_config(key):
     if key.status != ProjectKeyStatus.ACTIVE:
         return {"disabled": True}
     else:
-        return get_project_config(key.project, project_keys=[key]).to_dict()
+        return get_project_config(
+            key.project, project_keys=[key], organization_sections=organization_sections
+        ).to_dict()
+
+
+def recompute_projectkey_config_sections(key, cached, sections, revisions=None):
+    """Recomputes only the given sections of the cached config of a :class:`ProjectKey`.
+
+    The new sections are spliced into a copy of ``cached``, sections which are no longer
+    part of the config are removed from it.  Falls back to computing the full config if the
+    cached config is disabled or has no revision, or the key or project are no longer
+    active.
+
+    :param revisions: If given, the revision of ``cached`` is added to it if the sections
+       were spliced into ``cached``.
+    :returns: A dict with the project config.
+    """
+    from sentry.constants import ObjectStatus
+    from sentry.models.projectkey import ProjectKeyStatus
+    from sentry.relay.config import get_project_config_sections
+
+    if (
+        cached.get("disabled")
+        or "config" not in cached
+        or not cached.get("rev")
+        or key.status != ProjectKeyStatus.ACTIVE
+        or key.project.status != ObjectStatus.ACTIVE
+    ):
+        metrics.incr("relay.projectconfig_cache.recompute_sections", tags={"action": "full"})
+        return compute_projectkey_config(key)
+
+    metrics.incr("relay.projectconfig_cache.recompute_sections", tags={"action": "sections"})
+    if revisions is not None:
+        revisions[key.public_key] = cached["rev"]
+    section_configs = get_project_config_sections(key.project, sections, project_keys=[key])
+
+    config = dict(cached["config"])
+    for section in sections:
+        if section in section_configs:
+            config[section] = section_configs[section]
+        else:
+            config.pop(section, None)
+
+    now = datetime.now(timezone.utc)
+    return {
+        **cached,
+        "config": config,
+        "lastFetch": now,
+        "lastChange": now,
+        "rev": uuid.uuid4().hex,
+    }
 
 
 @instrumented_task(
@@ -200,7 +283,12 @@ def compute_projectkey_config(key):
     silo_mode=SiloMode.REGION,
 )
 def invalidate_project_config(
-    organization_id=None, project_id=None, public_key=None, trigger="invalidated", **kwargs
+    organization_id=None,
+    project_id=None,
+    public_key=None,
+    trigger="invalidated",
+    sections=None,
+    **kwargs,
 ):
     """Task which re-computes an invalidated project config.
 
@@ -220,11 +308,18 @@ def invalidate_project_config(
 
     Both these mean that an outdated version of the project config could still end up in the
     cache.  These will be addressed in the future using config revisions tracked in Redis.
+
+    If ``sections`` is given, only those sections of the cached configs are recomputed.
+    They are only written if the revisions of the cached configs did not change in the
+    meantime, configs which were changed are recomputed fully instead.
     """
     # Make sure we start by deleting the deduplication key so that new invalidation triggers
     # can schedule a new message while we already started computing the project config.
     projectconfig_debounce_cache.invalidation.mark_task_done(
-        organization_id=organization_id, project_id=project_id, public_key=public_key
+        organization_id=organization_id,
+        project_id=project_id,
+        public_key=public_key,
+        sections=sections,
     )
 
     if project_id:
@@ -238,9 +333,35 @@ def invalidate_project_config(
     sentry_sdk.set_tag("trigger", trigger)
     sentry_sdk.set_context("kwargs", kwargs)
 
+    revisions = {}
     updated_configs = compute_configs(
-        organization_id=organization_id, project_id=project_id, public_key=public_key
+        organization_id=organization_id,
+        project_id=project_id,
+        public_key=public_key,
+        sections=sections,
+        revisions=revisions,
     )
+
+    if revisions:
+        # A concurrent invalidation may have written a newer config since the sections were
+        # spliced into the cached one.  Writing the spliced config would then overwrite it
+        # with older data, so recompute the full config instead.
+        #
+        # Note: This check is best effort, it is not atomic with the write below.  A config
+        # written in between is overwritten, like with concurrent full recomputes.
+        current = projectconfig_cache.backend.get_many(revisions)
+        for key, config in current.items():
+            if config is not None and config.get("rev") == revisions[key]:
+                continue
+            metrics.incr(
+                "relay.projectconfig_cache.recompute_sections", tags={"action": "conflict"}
+            )
+            if config is None:
+                # The config is no longer cached, leave it to be computed lazily.
+                del updated_configs[key]
+            else:
+                updated_configs.update(compute_configs(public_key=key))
+
     projectconfig_cache.backend.set_many(updated_configs)
 
 
@@ -326,9 +447,18 @@ def _schedule_invalidate_project_config(
     """For param docs, see :func:`schedule_invalidate_project_config`."""
     from sentry.models.project import Project
     from sentry.models.projectkey import ProjectKey
+    from sentry.relay.config import get_invalidated_sections
 
     validate_args(organization_id, project_id, public_key)
 
+    sections = None
+    if options.get("relay.project-config.incremental-invalidation"):
+        sections = get_invalidated_sections(trigger)
+    # Invalidations of only some sections are debounced separately for every set of
+    # sections: a pending full invalidation must not be dropped in favor of them, and a
+    # pending invalidation of other sections would not recompute these.
+    task = "invalidation-sections" if sections else "invalidation"
+
     # The keys we need to check for to see if this is debounced, we want to check all
     # levels.
     check_debounce_keys = {
@@ -356,30 +486,35 @@ def _schedule_invalidate_project_config(
         else:
             check_debounce_keys["organization_id"] = org_id
 
-    if projectconfig_debounce_cache.invalidation.is_debounced(**check_debounce_keys):
+    if projectconfig_debounce_cache.invalidation.is_debounced(
+        **check_debounce_keys, sections=sections
+    ):
         # If this task is already in the queue, do not schedule another task.
         metrics.incr(
             "relay.projectconfig_cache.skipped",
-            tags={"reason": "debounce", "update_reason": trigger, "task": "invalidation"},
+            tags={"reason": "debounce", "update_reason": trigger, "task": task},
         )
         return
 
     metrics.incr(
         "relay.projectconfig_cache.scheduled",
-        tags={"update_reason": trigger, "task": "invalidation"},
+        tags={"update_reason": trigger, "task": task},
     )
 
-    invalidate_project_config.apply_async(
-        countdown=countdown,
-        kwargs={
-            "project_id": project_id,
-            "organization_id": organization_id,
-            "public_key": public_key,
-            "trigger": trigger,
-        },
-    )
+    task_kwargs = {
+        "project_id": project_id,
+        "organization_id": organization_id,
+        "public_key": public_key,
+        "trigger": trigger,
+    }
+    if sections:
+        task_kwargs["sections"] = sections
+    invalidate_project_config.apply_async(countdown=countdown, kwargs=task_kwargs)
 
     # Use the original arguments to this function to set the debounce key.
     projectconfig_debounce_cache.invalidation.debounce(
-        organization_id=organization_id, project_id=project_id, public_key=public_key
+        organization_id=organization_id,
+        project_id=project_id,
+        public_key=public_key,
+        sections=sections,
     )
@@ -37,6 +37,13 @@ class RetryProcessing(Exception):
     pass
 
 
+class SaveEventNotStarted(Exception):
+    """
+    Raised if saving an event inline failed before `EventManager.save` was
+    called, so that the event can still be saved by the `save_event` task.
+    """
+
+
 def should_process(data: Mapping[str, Any]) -> bool:
     """Quick check if processing is needed at all."""
     from sentry.plugins.base import plugins
@@ -112,6 +119,18 @@ def submit_save_event(
     task.delay(**task_kwargs)
 
 
+def should_run_inline(from_reprocessing: bool, has_attachments: bool) -> bool:
+    """
+    Check if an event that needs no symbolication should be processed and saved
+    by the caller of `preprocess_event` (the ingest consumer), instead of going
+    through the `process_event` and `save_event` queues.
+    """
+    if from_reprocessing or has_attachments:
+        return False
+
+    return random.random() < options.get("store.inline-pipeline-sample-rate")
+
+
 def _do_preprocess_event(
     cache_key: str,
     data: MutableMapping[str, Any] | None,
@@ -192,7 +211,33 @@ def _do_preprocess_event(
         # else: go directly to process, do not go through the symbolicate queue, do not collect 200
 
     # NOTE: Events considered for symbolication always go through `do_process_event`
-    if should_symbolicate or should_process(data):
+    needs_processing = should_symbolicate or should_process(data)
+
+    if not should_symbolicate and should_run_inline(from_reprocessing, has_attachments):
+        if not needs_processing:
+            if _save_event_inline(cache_key, original_data, start_time, event_id, project_id):
+                return
+        else:
+            try:
+                do_process_event(
+                    cache_key=cache_key,
+                    start_time=start_time,
+                    event_id=event_id,
+                    from_reprocessing=from_reprocessing,
+                    data=original_data,
+                    has_attachments=has_attachments,
+                    inline=True,
+                )
+                return
+            except Exception:
+                # Failures while saving inline already fell back to the
+                # `save_event` queue, so this can only be plugin processing.
+                metrics.incr("events.inline_pipeline.fallback", tags={"stage": "process"})
+                error_logger.exception(
+                    "process.inline.failed", extra={"cache_key": cache_key, "event_id": event_id}
+                )
+
+    if needs_processing:
         submit_process(
             from_reprocessing=from_reprocessing,
             cache_key=cache_key,
@@ -307,6 +352,7 @@ def do_process_event(
     data_has_changed: bool = False,
     from_symbolicate: bool = False,
     has_attachments: bool = False,
+    inline: bool = False,
 ) -> None:
     from sentry.plugins.base import plugins
 
@@ -326,6 +372,9 @@ def do_process_event(
     data_event_id = data["event_id"]
 
     def _continue_to_save_event() -> None:
+        if inline and _save_event_inline(cache_key, data, start_time, data_event_id, project_id):
+            return
+
         task_kind = SaveEventTaskKind(
             from_reprocessing=from_reprocessing,
             has_attachments=has_attachments,
@@ -486,6 +535,41 @@ def process_event_from_reprocessing(
     )
 
 
+def _save_event_inline(
+    cache_key: str,
+    data: MutableMapping[str, Any],
+    start_time: float | None,
+    event_id: str | None,
+    project_id: int,
+) -> bool:
+    """
+    Saves an event in the current process. Returns `False` if saving failed
+    before anything was written, in which case the event has to be submitted
+    to the `save_event` queue instead.
+
+    Once `EventManager.save` was called, the event may be saved partially, so
+    it must not be saved again. Such failures are logged like a failing
+    `save_event` task, without blocking the ingest consumer.
+    """
+    try:
+        _do_save_event(cache_key, data, start_time, event_id, project_id, pipeline="inline")
+    except SaveEventNotStarted:
+        metrics.incr("events.inline_pipeline.fallback", tags={"stage": "save"})
+        error_logger.exception(
+            "save.inline.fallback", extra={"cache_key": cache_key, "event_id": event_id}
+        )
+        return False
+    except Exception:
+        metrics.incr(
+            "events.failed", tags={"reason": "exception", "stage": "post"}, skip_internal=False
+        )
+        error_logger.exception(
+            "save.inline.failed", extra={"cache_key": cache_key, "event_id": event_id}
+        )
+
+    return True
+
+
 def _do_save_event(
     cache_key: str | None = None,
     data: MutableMapping[str, Any] | None = None,
@@ -493,10 +577,14 @@ def _do_save_event(
     event_id: str | None = None,
     project_id: int | None = None,
     has_attachments: bool = False,
+    pipeline: str = "queued",
     **kwargs: Any,
 ) -> None:
     """
     Saves an event to the database.
+
+    `pipeline` is either "queued" if the event went through the `save_event`
+    task, or "inline" if it was processed and saved by the ingest consumer.
     """
 
     set_current_event_project(project_id)
@@ -508,8 +596,8 @@ def _do_save_event(
 
     if cache_key and data is None:
         data = processing.event_processing_store.get(cache_key)
-        if data is not None:
-            event_type = data.get("type") or "none"
+    if data is not None:
+        event_type = data.get("type") or "none"
 
     with metrics.global_tags(event_type=event_type):
         if event_id is None and data is not None:
@@ -538,6 +626,8 @@ def _do_save_event(
             )
             return
 
+        save_started = False
+        fall_back = False
         try:
             if killswitch_matches_context(
                 "store.load-shed-save-event-projects",
@@ -550,6 +640,7 @@ def _do_save_event(
                 raise HashDiscarded("Load shedding save_event")
 
             manager = EventManager(data)
+            save_started = True
             # event.project.organization is populated after this statement.
             manager.save(
                 project_id,
@@ -568,28 +659,35 @@ def _do_save_event(
             # Delete the event payload from cache since it won't show up in post-processing.
             if cache_key:
                 processing.event_processing_store.delete_by_key(cache_key)
-        except Exception:
+        except Exception as exc:
+            if pipeline == "inline" and not save_started:
+                fall_back = True
+                raise SaveEventNotStarted() from exc
+
             metrics.incr("events.save_event.exception", tags={"event_type": event_type})
             raise
 
         finally:
-            reprocessing2.mark_event_reprocessed(data)
-            if cache_key and has_attachments:
-                attachment_cache.delete(cache_key)
-
-            if start_time:
-                metrics.timing(
-                    "events.time-to-process",
-                    time() - start_time,
-                    instance=data["platform"],
-                    tags={
-                        "is_reprocessing2": (
-                            "true" if reprocessing2.is_reprocessed_event(data) else "false"
-                        ),
-                    },
-                )
-
-            time_synthetic_monitoring_event(data, project_id, start_time)
+            # When falling back, the `save_event` task takes care of this.
+            if not fall_back:
+                reprocessing2.mark_event_reprocessed(data)
+                if cache_key and has_attachments:
+                    attachment_cache.delete(cache_key)
+
+                if start_time:
+                    metrics.timing(
+                        "events.time-to-process",
+                        time() - start_time,
+                        instance=data["platform"],
+                        tags={
+                            "is_reprocessing2": (
+                                "true" if reprocessing2.is_reprocessed_event(data) else "false"
+                            ),
+                            "pipeline": pipeline,
+                        },
+                    )
+
+                time_synthetic_monitoring_event(data, project_id, start_time)
 
 
 def time_synthetic_monitoring_event(
@@ -21,6 +21,20 @@ requires_not_arm64 = pytest.mark.skipif(
 )
 
 
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+requires_pytest_benchmark = pytest.mark.skipif(
+    not benchmark_available(), reason="requires pytest-benchmark"
+)
+
+
 def xfail_if_not_postgres(reason: str) -> Callable[[T], T]:
     def decorator(function: T) -> T:
         return pytest.mark.xfail(os.environ.get("TEST_SUITE") != "postgres", reason=reason)(
@@ -3,6 +3,7 @@ import itertools
 import logging
 import random
 import uuid
+from array import array
 from collections import defaultdict, namedtuple
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from datetime import datetime
@@ -15,7 +16,9 @@ from django.utils import timezone
 from django.utils.encoding import force_bytes
 from redis.client import Script
 
+from sentry import options
 from sentry.tsdb.base import BaseTSDB, IncrMultiOptions, TSDBItem, TSDBKey, TSDBModel
+from sentry.utils import metrics
 from sentry.utils.dates import to_datetime
 from sentry.utils.redis import (
     check_cluster_versions,
@@ -66,6 +69,38 @@ class SuppressionWrapper(Generic[T]):
         return True
 
 
+class CounterSeries:
+    """
+    Counter values of a number of keys over a shared series of timestamps.
+
+    Values are stored as one integer array per key, aligned with
+    ``timestamps``, instead of as a list of ``(timestamp, count)`` tuples.
+    """
+
+    __slots__ = ("timestamps", "values")
+
+    def __init__(self, timestamps: array, values: dict[TSDBKey, array]):
+        self.timestamps = timestamps
+        self.values = values
+
+    def sums(self) -> dict[TSDBKey, int]:
+        return {key: sum(values) for key, values in self.values.items()}
+
+    def total(self) -> array:
+        """
+        Returns the values of all keys added up per timestamp.
+        """
+        if not self.values:
+            return array("q", [0]) * len(self.timestamps)
+        return array("q", map(sum, zip(*self.values.values())))
+
+    def to_points(self) -> dict[TSDBKey, list[tuple[int, int]]]:
+        """
+        Returns the series in the format of ``get_range``.
+        """
+        return {key: list(zip(self.timestamps, values)) for key, values in self.values.items()}
+
+
 class RedisTSDB(BaseTSDB):
     """
     A time series storage backend for Redis.
@@ -103,6 +138,16 @@ class RedisTSDB(BaseTSDB):
             ...
         }
 
+    With ``tsdb.redis.distinct-counts.merge-span`` set, totals over wide
+    ranges count spans of that many past intervals from a pre-merged
+    HyperLogLog, which is created on first use and expires after
+    ``tsdb.redis.distinct-counts.merge-ttl`` seconds::
+
+        {
+            "<model>:<rollup>x<span>:<span index>:<key>": value,
+            ...
+        }
+
     Frequency tables are modeled using two data structures:
 
         * top-N index: a sorted set containing the most frequently observed items,
@@ -199,21 +244,22 @@ class RedisTSDB(BaseTSDB):
         """
         model_key = self.get_model_key(key)
 
-        if isinstance(model_key, int):
-            vnode = model_key % self.vnodes
-        else:
-            vnode = _crc32(force_bytes(model_key)) % self.vnodes
-
         return (
             "{prefix}{model}:{epoch}:{vnode}".format(
                 prefix=self.prefix,
                 model=model.value,
                 epoch=self.normalize_to_rollup(timestamp, rollup),
-                vnode=vnode,
+                vnode=self.get_counter_vnode(model_key),
             ),
             self.add_environment_parameter(model_key, environment_id),
         )
 
+    def get_counter_vnode(self, model_key: int | str) -> int:
+        if isinstance(model_key, int):
+            return model_key % self.vnodes
+        else:
+            return _crc32(force_bytes(model_key)) % self.vnodes
+
     def get_model_key(self, key: int | str | bytes) -> int | str:
         # We specialize integers so that a pure int-map can be optimized by
         # Redis, whereas long strings (say tag values) will store in a more
@@ -336,31 +382,70 @@ class RedisTSDB(BaseTSDB):
             raise NotImplementedError
         environment_id = environment_ids[0] if environment_ids else None
 
+        return self.get_range_series(model, keys, start, end, rollup, environment_id).to_points()
+
+    def get_sums(
+        self,
+        model: TSDBModel,
+        keys: list[int],
+        start: datetime,
+        end: datetime,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+        use_cache: bool = False,
+        jitter_value: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+        referrer_suffix: str | None = None,
+    ) -> dict[int, int]:
+        return self.get_range_series(model, keys, start, end, rollup, environment_id).sums()
+
+    def get_range_series(
+        self,
+        model: TSDBModel,
+        keys: Sequence[TSDBKey],
+        start: datetime,
+        end: datetime,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+    ) -> CounterSeries:
+        """
+        Returns the counters of all keys between ``start`` and ``end``.
+
+        Counters of keys sharing a hash (the same vnode of the same rollup
+        bucket) are read with a single ``HMGET``, so the number of commands
+        is bounded by the number of buckets and vnodes rather than growing
+        with the number of keys.
+        """
         self.validate_arguments([model], [environment_id])
 
         rollup, series = self.get_optimal_rollup_series(start, end, rollup)
-        _series = [to_datetime(item) for item in series]
+        if not series:
+            return CounterSeries(array("q"), {})
+
+        fields_by_vnode: dict[int, list[tuple[TSDBKey, str | int]]] = defaultdict(list)
+        for key in dict.fromkeys(keys):
+            model_key = self.get_model_key(key)
+            fields_by_vnode[self.get_counter_vnode(model_key)].append(
+                (key, self.add_environment_parameter(model_key, environment_id))
+            )
 
-        results = []
+        responses = []
         cluster, _ = self.get_cluster(environment_id)
         with cluster.map() as client:
-            for key in keys:
-                for timestamp in _series:
-                    hash_key, hash_field = self.make_counter_key(
-                        model, rollup, timestamp, key, environment_id
-                    )
-                    results.append(
-                        (int(timestamp.timestamp()), key, client.hget(hash_key, hash_field))
-                    )
+            for index, timestamp in enumerate(series):
+                epoch = self.normalize_to_rollup(timestamp, rollup)
+                for vnode, fields in fields_by_vnode.items():
+                    hash_key = f"{self.prefix}{model.value}:{epoch}:{vnode}"
+                    response = client.hmget(hash_key, [field for _, field in fields])
+                    responses.append((index, fields, response))
 
-        results_by_key: dict[TSDBKey, dict[int, int]] = defaultdict(dict)
-        for epoch, key, count in results:
-            results_by_key[key][epoch] = int(count.value or 0)
+        values = {key: array("q", [0]) * len(series) for key in dict.fromkeys(keys)}
+        for index, fields, response in responses:
+            for (key, _), count in zip(fields, response.value):
+                if count:
+                    values[key][index] = int(count)
 
-        output = {}
-        for key, points in results_by_key.items():
-            output[key] = sorted(points.items())
-        return output
+        return CounterSeries(array("q", series), values)
 
     def merge(
         self,
@@ -545,24 +630,142 @@ class RedisTSDB(BaseTSDB):
 
         rollup, series = self.get_optimal_rollup_series(start, end, rollup)
 
-        responses = {}
         cluster, _ = self.get_cluster(environment_id)
+
+        span = options.get("tsdb.redis.distinct-counts.merge-span")
+        merged_spans = self.get_merged_distinct_counts_spans(rollup, series, span)
+        if merged_spans:
+            missing = self.get_missing_merged_distinct_counts(
+                cluster, model, rollup, span, merged_spans, keys, environment_id
+            )
+        else:
+            missing = {}
+        ttl = options.get("tsdb.redis.distinct-counts.merge-ttl")
+
+        responses = {}
         with cluster.fanout() as client:
             for key in keys:
+                c = client.target_key(key)
+
+                # Merges are pipelined in front of the count on the same host,
+                # so they are complete by the time the count runs.
+                for index in missing.get(key, ()):
+                    merged_key = self.make_merged_distinct_counts_key(
+                        model, rollup, span, index, key, environment_id
+                    )
+                    c.execute_command(
+                        "PFMERGE",
+                        merged_key,
+                        *(
+                            self.make_key(model, rollup, timestamp, key, environment_id)
+                            for timestamp in range(
+                                index * span * rollup, (index + 1) * span * rollup, rollup
+                            )
+                        ),
+                    )
+                    c.expire(merged_key, ttl)
+
                 # XXX: The current versions of the Redis driver don't implement
                 # ``PFCOUNT`` correctly (although this is fixed in the Git
                 # master, so should be available in the next release) and only
                 # supports a single key argument -- not the variadic signature
                 # supported by the protocol -- so we have to call the command
                 # directly here instead.
-                ks = []
+                ks = [
+                    self.make_merged_distinct_counts_key(
+                        model, rollup, span, index, key, environment_id
+                    )
+                    for index in merged_spans
+                ]
                 for timestamp in series:
-                    ks.append(self.make_key(model, rollup, timestamp, key, environment_id))
+                    if self.normalize_ts_to_rollup(timestamp, rollup) // span not in merged_spans:
+                        ks.append(self.make_key(model, rollup, timestamp, key, environment_id))
 
-                responses[key] = client.target_key(key).execute_command("PFCOUNT", *ks)
+                responses[key] = c.execute_command("PFCOUNT", *ks)
 
         return {key: value.value for key, value in responses.items()}
 
+    def make_merged_distinct_counts_key(
+        self,
+        model: TSDBModel,
+        rollup: int,
+        span: int,
+        index: int,
+        key: int | str,
+        environment_id: int | None,
+    ) -> str | int:
+        """
+        Make the key of a pre-merged span of distinct counter values.
+        """
+        return self.add_environment_parameter(
+            f"{self.prefix}{model.value}:{rollup}x{span}:{index}:{self.get_model_key(key)}",
+            environment_id,
+        )
+
+    def get_merged_distinct_counts_spans(
+        self, rollup: int, series: Sequence[int], span: int
+    ) -> list[int]:
+        """
+        Returns the indexes of the spans of the series that can be counted
+        from a pre-merged key: spans that are entirely within the series and
+        entirely in the past, so that they no longer receive new values.
+        """
+        if span <= 1:
+            return []
+
+        current = self.normalize_ts_to_rollup(timezone.now().timestamp(), rollup)
+        intervals = {self.normalize_ts_to_rollup(timestamp, rollup) for timestamp in series}
+        return [
+            index
+            for index in sorted({interval // span for interval in intervals})
+            if (index + 1) * span <= current
+            and all(interval in intervals for interval in range(index * span, (index + 1) * span))
+        ]
+
+    def get_missing_merged_distinct_counts(
+        self,
+        cluster: rb.Cluster,
+        model: TSDBModel,
+        rollup: int,
+        span: int,
+        merged_spans: Sequence[int],
+        keys: Sequence[int],
+        environment_id: int | None,
+    ) -> dict[int, list[int]]:
+        """
+        Returns the spans that have no pre-merged key yet, by key.
+        """
+        responses = {}
+        with cluster.fanout() as client:
+            for key in keys:
+                c = client.target_key(key)
+                responses[key] = [
+                    (
+                        index,
+                        c.exists(
+                            self.make_merged_distinct_counts_key(
+                                model, rollup, span, index, key, environment_id
+                            )
+                        ),
+                    )
+                    for index in merged_spans
+                ]
+
+        missing = {
+            key: [index for index, exists in value if not exists.value]
+            for key, value in responses.items()
+        }
+        merges = sum(len(indexes) for indexes in missing.values())
+        metrics.incr(
+            "tsdb.redis.distinct_counts.merged_spans",
+            amount=len(keys) * len(merged_spans) - merges,
+            tags={"result": "hit"},
+        )
+        metrics.incr(
+            "tsdb.redis.distinct_counts.merged_spans", amount=merges, tags={"result": "miss"}
+        )
+        return missing
+
     def get_distinct_counts_union(
         self,
         model: TSDBModel,
@@ -725,6 +928,10 @@ class RedisTSDB(BaseTSDB):
                                     self.calculate_expiry(rollup, self.rollups[rollup], _timestamp),
                                 )
 
+                self.delete_merged_distinct_counts(
+                    client, model, rollups, [destination, *sources], _ids
+                )
+
     def delete_distinct_counts(
         self,
         models: list[TSDBModel],
@@ -762,6 +969,42 @@ class RedisTSDB(BaseTSDB):
                                         )
                                     )
 
+                for model in models:
+                    self.delete_merged_distinct_counts(client, model, rollups, keys, _ids)
+
+    def delete_merged_distinct_counts(
+        self,
+        client: Any,
+        model: TSDBModel,
+        rollups: Mapping[int, Sequence[datetime]],
+        keys: Iterable[int],
+        environment_ids: Iterable[int | None],
+    ) -> None:
+        """
+        Deletes the pre-merged spans that cover the given series, as they
+        are outdated once the values of their intervals are modified.
+        """
+        span = options.get("tsdb.redis.distinct-counts.merge-span")
+        if span <= 1:
+            return
+
+        for rollup, series in rollups.items():
+            indexes = {self.normalize_to_rollup(timestamp, rollup) // span for timestamp in series}
+            if not indexes:
+                continue
+
+            for key in keys:
+                c = client.target_key(key)
+                for environment_id in environment_ids:
+                    c.delete(
+                        *(
+                            self.make_merged_distinct_counts_key(
+                                model, rollup, span, index, key, environment_id
+                            )
+                            for index in indexes
+                        )
+                    )
+
     def make_frequency_table_keys(
         self,
         model: TSDBModel,
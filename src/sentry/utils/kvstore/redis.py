@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import timedelta
 from typing import TypeVar
 
@@ -26,6 +27,12 @@ class RedisKVStorage(KVStorage[str, T]):
     def set(self, key: str, value: T, ttl: timedelta | None = None) -> None:
         self.client.set(key.encode("utf8"), value, ex=ttl)
 
+    def set_many(self, items: Sequence[tuple[str, T]], ttl: timedelta | None = None) -> None:
+        with self.client.pipeline(transaction=False) as pipeline:
+            for key, value in items:
+                pipeline.set(key.encode("utf8"), value, ex=ttl)
+            pipeline.execute()
+
     def delete(self, key: str) -> None:
         self.client.delete(key.encode("utf8"))
 
@@ -125,6 +125,15 @@ class PerformanceDetector(ABC):
     def visit_span(self, span: Span) -> None:
         raise NotImplementedError
 
+    def span_op_prefixes(self) -> tuple[str, ...] | None:
+        """
+        Returns the op prefixes of all spans this detector can act on, if
+        `visit_span` ignores every other span without changing any state. Only
+        spans with a matching op are then visited. `None` means every span has
+        to be visited.
+        """
+        return None
+
     def on_complete(self) -> None:
         pass
 
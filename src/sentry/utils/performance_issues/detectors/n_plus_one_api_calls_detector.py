@@ -78,6 +78,9 @@ class NPlusOneAPICallsDetector(PerformanceDetector):
             self._maybe_store_problem()
             self.spans = [span]
 
+    def span_op_prefixes(self) -> tuple[str, ...] | None:
+        return tuple(self.settings.get("allowed_span_ops", []))
+
     def is_creation_allowed_for_organization(self, organization: Organization) -> bool:
         return True
 
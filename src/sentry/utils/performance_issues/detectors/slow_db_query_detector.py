@@ -101,6 +101,16 @@ class SlowDBQueryDetector(PerformanceDetector):
                 ],
             )
 
+    def span_op_prefixes(self) -> tuple[str, ...] | None:
+        prefixes: list[str] = []
+        for setting in self.settings:
+            allowed_span_ops = setting.get("allowed_span_ops", [])
+            if not allowed_span_ops:
+                # Spans of any op are eligible, see `find_span_prefix`.
+                return None
+            prefixes.extend(allowed_span_ops)
+        return tuple(prefixes)
+
     def is_creation_allowed_for_organization(self, organization: Organization | None) -> bool:
         return True
 
@@ -127,6 +127,9 @@ class UncompressedAssetSpanDetector(PerformanceDetector):
                 ],
             )
 
+    def span_op_prefixes(self) -> tuple[str, ...] | None:
+        return tuple(self.settings.get("allowed_span_ops"))
+
     def _fingerprint(self, span: Span) -> str:
         resource_span = fingerprint_resource_span(span)
         return f"1-{PerformanceUncompressedAssetsGroupType.type_id}-{resource_span}"
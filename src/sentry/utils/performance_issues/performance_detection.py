@@ -35,6 +35,7 @@ from .detectors.render_blocking_asset_span_detector import RenderBlockingAssetSp
 from .detectors.slow_db_query_detector import SlowDBQueryDetector
 from .detectors.uncompressed_asset_detector import UncompressedAssetSpanDetector
 from .performance_problem import PerformanceProblem
+from .span_index import SpanOpIndex
 
 PERFORMANCE_GROUP_COUNT_LIMIT = 10
 INTEGRATIONS_OF_INTEREST = [
@@ -346,11 +347,16 @@ def _detect_performance_problems(
             if detector_class.is_detector_enabled()
         ]
 
+    span_index = None
+    if options.get("performance.issues.span-op-index.enabled"):
+        with sentry_sdk.start_span(op="initialize", name="SpanOpIndex"):
+            span_index = SpanOpIndex(data.get("spans", []))
+
     for detector in detectors:
         with sentry_sdk.start_span(
             op="function", name=f"run_detector_on_data.{detector.type.value}"
         ):
-            run_detector_on_data(detector, data)
+            run_detector_on_data(detector, data, span_index)
 
     with sentry_sdk.start_span(op="function", name="report_metrics_for_detectors"):
         # Metrics reporting only for detection, not created issues.
@@ -398,11 +404,18 @@ def _detect_performance_problems(
     return list(unique_problems)
 
 
-def run_detector_on_data(detector: PerformanceDetector, data: dict[str, Any]) -> None:
+def run_detector_on_data(
+    detector: PerformanceDetector, data: dict[str, Any], span_index: SpanOpIndex | None = None
+) -> None:
     if not detector.is_event_eligible(data):
         return
 
     spans = data.get("spans", [])
+    if span_index is not None:
+        prefixes = detector.span_op_prefixes()
+        if prefixes is not None:
+            spans = span_index.spans_with_op_prefixes(prefixes)
+
     for span in spans:
         detector.visit_span(span)
 
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any
+
+from .types import Span
+
+
+class SpanOpIndex:
+    """
+    Positions of the spans of an event grouped by op. The index is built once
+    per event and shared by all detectors, so that a detector only interested
+    in a few ops gets exactly those spans in event order, without every
+    detector walking all spans of a large transaction.
+    """
+
+    def __init__(self, spans: Sequence[Span]) -> None:
+        self.spans = spans
+        self._positions_by_op: dict[Any, list[int]] = defaultdict(list)
+        for position, span in enumerate(spans):
+            self._positions_by_op[span.get("op")].append(position)
+
+    def spans_with_op_prefixes(self, prefixes: tuple[str, ...]) -> list[Span]:
+        """
+        Returns the spans whose op starts with any of `prefixes`, in the order
+        they appear in the event.
+        """
+        positions: list[int] = []
+        # Only the distinct ops are matched, of which there are few even in
+        # transactions with many thousand spans.
+        for op, op_positions in self._positions_by_op.items():
+            if isinstance(op, str) and op.startswith(prefixes):
+                positions.extend(op_positions)
+
+        positions.sort()
+        return [self.spans[position] for position in positions]
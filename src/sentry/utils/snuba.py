@@ -875,11 +875,60 @@ def raw_query(
     descriptions.
     """
 
+    snuba_params = _raw_query_params(
+        dataset=dataset,
+        start=start,
+        end=end,
+        groupby=groupby,
+        conditions=conditions,
+        filter_keys=filter_keys,
+        aggregations=aggregations,
+        rollup=rollup,
+        referrer=referrer,
+        is_grouprelease=is_grouprelease,
+        **kwargs,
+    )
+
+    return bulk_raw_query([snuba_params], referrer=referrer, use_cache=use_cache)[0]
+
+
+def prepare_raw_query(referrer=None, **kwargs) -> SnubaRequest:
+    """
+    Prepares a query for `execute_snuba_requests`, accepts the same arguments
+    as `raw_query`. Preparing a query may read from the database to translate
+    its filters, executing it does not.
+    """
+    snuba_params = _raw_query_params(referrer=referrer, **kwargs)
+    return _prepare_snuba_requests([snuba_params], referrer)[0]
+
+
+def execute_snuba_requests(
+    snuba_requests: Sequence[SnubaRequest], use_cache: bool | None = False
+) -> ResultSet:
+    """
+    Executes prepared queries concurrently, returns their results in order.
+    """
+    return _apply_cache_and_build_results(snuba_requests, use_cache=use_cache)
+
+
+def _raw_query_params(
+    dataset=None,
+    start=None,
+    end=None,
+    groupby=None,
+    conditions=None,
+    filter_keys=None,
+    aggregations=None,
+    rollup=None,
+    referrer=None,
+    is_grouprelease=False,
+    **kwargs,
+) -> SnubaQueryParams:
     if referrer:
         kwargs["tenant_ids"] = kwargs.get("tenant_ids") or dict()
         kwargs["tenant_ids"]["referrer"] = referrer
 
-    snuba_params = SnubaQueryParams(
+    return SnubaQueryParams(
         dataset=dataset,
         start=start,
         end=end,
@@ -892,8 +941,6 @@ def raw_query(
         **kwargs,
     )
 
-    return bulk_raw_query([snuba_params], referrer=referrer, use_cache=use_cache)[0]
-
 
 Translator = Callable[[Any], Any]
 
@@ -1014,8 +1061,15 @@ def bulk_raw_query(
     Used to make queries using the (very) old JSON format for Snuba queries. Queries submitted here
     will be converted to SnQL queries before being sent to Snuba.
     """
+    snuba_requests = _prepare_snuba_requests(snuba_param_list, referrer)
+    return _apply_cache_and_build_results(snuba_requests, use_cache=use_cache)
+
+
+def _prepare_snuba_requests(
+    snuba_param_list: Sequence[SnubaQueryParams], referrer: str | None = None
+) -> list[SnubaRequest]:
     params = [_prepare_query_params(param, referrer) for param in snuba_param_list]
-    snuba_requests = [
+    return [
         SnubaRequest(
             request=json_to_snql(query, query["dataset"]),
             referrer=referrer,
@@ -1024,7 +1078,6 @@ def bulk_raw_query(
         )
         for query, forward, reverse in params
     ]
-    return _apply_cache_and_build_results(snuba_requests, use_cache=use_cache)
 
 
 def get_cache_key(query: Request) -> str:
@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+
+from sentry.api.serializers.loaders import AttrLoader, run_attr_loaders
+
+
+def test_dependencies():
+    results = run_attr_loaders(
+        [
+            AttrLoader("sum", lambda a, b: a + b, depends_on=("a", "b")),
+            AttrLoader("a", lambda: 1),
+            AttrLoader("b", lambda a: a + 1, depends_on=("a",), concurrent=True),
+        ],
+        op="test",
+    )
+
+    assert results == {"a": 1, "b": 2, "sum": 3}
+
+
+def test_concurrent_loaders_overlap():
+    started = threading.Event()
+    finished = threading.Event()
+
+    def concurrent():
+        started.set()
+        assert finished.wait(timeout=5)
+        return threading.get_ident()
+
+    def inline():
+        # Only returns if the concurrent loader is running at the same time.
+        assert started.wait(timeout=5)
+        finished.set()
+        return threading.get_ident()
+
+    results = run_attr_loaders(
+        [AttrLoader("concurrent", concurrent, concurrent=True), AttrLoader("inline", inline)],
+        op="test",
+    )
+
+    assert results["inline"] == threading.get_ident()
+    assert results["concurrent"] != threading.get_ident()
+
+
+def test_errors_are_raised():
+    def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        run_attr_loaders([AttrLoader("fail", fail, concurrent=True)], op="test")
+
+
+def test_invalid_dependencies():
+    with pytest.raises(ValueError, match="unknown"):
+        run_attr_loaders([AttrLoader("a", lambda b: b, depends_on=("b",))], op="test")
+
+    with pytest.raises(ValueError, match="cycle"):
+        run_attr_loaders(
+            [
+                AttrLoader("a", lambda b: b, depends_on=("b",)),
+                AttrLoader("b", lambda a: a, depends_on=("a",)),
+            ],
+            op="test",
+        )
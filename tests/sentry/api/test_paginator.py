@@ -26,6 +26,7 @@ from sentry.api.paginator import (
     CombinedQuerysetPaginator,
     DateTimePaginator,
     GenericOffsetPaginator,
+    KeysetCombinedQuerysetPaginator,
     OffsetPaginator,
     Paginator,
     SequencePaginator,
@@ -38,7 +39,7 @@ from sentry.testutils.cases import APITestCase, SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import iso_format
 from sentry.testutils.silo import control_silo_test
 from sentry.users.models.user import User
-from sentry.utils.cursors import Cursor
+from sentry.utils.cursors import Cursor, StringCursor
 from sentry.utils.snuba import raw_snql_query
 
 
@@ -824,6 +825,90 @@ class CombinedQuerysetPaginatorTest(APITestCase):
         assert result == page1_results
 
 
+class KeysetCombinedQuerysetPaginatorTest(APITestCase):
+    def setUp(self):
+        super().setUp()
+        project = self.project
+        AlertRule.objects.all().delete()
+        Rule.objects.all().delete()
+        date_added = timezone.now() - timedelta(days=1)
+        self.alert_rules = [
+            self.create_alert_rule(name=name, date_added=date_added + timedelta(minutes=minutes))
+            for name, minutes in [("Beta", 0), ("alpha", 2), ("delta", 2)]
+        ]
+        self.rules = [
+            Rule.objects.create(label=label, project=project, date_added=date_added + delta)
+            for label, delta in [("Charlie", timedelta(minutes=1)), ("echo", timedelta(minutes=2))]
+        ]
+
+    def get_paginator(self, keys=("date_added",), rule_keys=None, **kwargs):
+        return KeysetCombinedQuerysetPaginator(
+            intermediaries=[
+                CombinedQuerysetIntermediary(AlertRule.objects.all(), list(keys)),
+                CombinedQuerysetIntermediary(Rule.objects.all(), list(rule_keys or keys)),
+            ],
+            **kwargs,
+        )
+
+    def get_all_pages(self, paginator, limit):
+        pages = []
+        cursor = None
+        while True:
+            result = paginator.get_result(limit=limit, cursor=cursor)
+            pages.append(list(result))
+            if not result.next:
+                return pages
+            # Cursors are sent to clients as strings.
+            cursor = StringCursor.from_string(str(result.next))
+
+    def test_pages(self):
+        pages = self.get_all_pages(self.get_paginator(desc=True), limit=2)
+        # Ties on the sort key are broken by model and id.
+        assert pages == [
+            [self.rules[1], self.alert_rules[2]],
+            [self.alert_rules[1], self.rules[0]],
+            [self.alert_rules[0]],
+        ]
+
+    def test_prev(self):
+        paginator = self.get_paginator()
+        page1 = paginator.get_result(limit=2)
+        assert not page1.prev
+        page2 = paginator.get_result(limit=2, cursor=page1.next)
+        assert page2.prev
+
+        result = paginator.get_result(limit=2, cursor=page2.prev)
+        assert list(result) == list(page1)
+        assert not result.prev
+        assert result.next
+
+    def test_case_insensitive(self):
+        paginator = self.get_paginator(keys=["name"], rule_keys=["label"], case_insensitive=True)
+        pages = self.get_all_pages(paginator, limit=2)
+        assert [item for page in pages for item in page] == [
+            self.alert_rules[1],
+            self.alert_rules[0],
+            self.rules[0],
+            self.alert_rules[2],
+            self.rules[1],
+        ]
+
+    def test_stable_across_pages(self):
+        paginator = self.get_paginator()
+        page1 = paginator.get_result(limit=2)
+
+        # Rows added before the cursor do not shift the next page.
+        Rule.objects.create(
+            label="early", project=self.project, date_added=timezone.now() - timedelta(days=2)
+        )
+        page2 = paginator.get_result(limit=2, cursor=page1.next)
+        assert list(page2) == [self.alert_rules[1], self.alert_rules[2]]
+
+    def test_invalid_cursor(self):
+        with pytest.raises(BadPaginationError):
+            self.get_paginator().get_result(limit=2, cursor=StringCursor("invalid", 0, 0))
+
+
 class TestChainPaginator(SimpleTestCase):
     cls = ChainPaginator
 
@@ -21,6 +21,7 @@ from sentry.models.project import Project
 from sentry.rules.processing.delayed_processing import process_delayed_alert_conditions
 from sentry.rules.processing.processor import PROJECT_ID_BUFFER_LIST_KEY
 from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.utils import json
 from sentry.utils.redis import get_cluster_routing_client
@@ -209,6 +210,72 @@ class TestRedisBuffer:
         else:
             assert pending == [key.encode("utf-8")]
 
+    def test_incr_script_matches_pipeline(self):
+        now = datetime.datetime(2017, 5, 3, 6, 6, 6, tzinfo=datetime.UTC)
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        model = mock.Mock()
+        model.__name__ = "Mock"
+        filters = {"pk": 1, "datetime": now}
+        key = self.buf._make_key(model, filters=filters)
+
+        def incr():
+            self.buf.incr(model, {"times_seen": 1}, filters, extra={"foo": "bar"})
+            self.buf.incr(model, {"times_seen": 2}, filters, extra={"datetime": now})
+            self.buf.incr(model, {"times_seen": 3}, filters, signal_only=True)
+            return client.hgetall(key), client.zrange("b:p", 0, -1)
+
+        expected = incr()
+        client.delete(key)
+        with override_options({"buffer.redis.lua-incr": True}):
+            assert incr() == expected
+        assert client.ttl(key) > 0
+
+    def test_incr_coalesces(self):
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        model = mock.Mock()
+        model.__name__ = "Mock"
+        filters = {"pk": 1}
+        key = self.buf._make_key(model, filters=filters)
+
+        with override_options({"buffer.redis.coalesce-window": 60.0}):
+            self.buf.incr(model, {"times_seen": 1}, filters, extra={"foo": "bar"})
+            self.buf.incr(model, {"times_seen": 2}, filters, extra={"foo": "baz"})
+            self.buf.incr(model, {"times_seen": 3}, {"pk": 2})
+            assert client.hgetall(key) == {}
+
+            self.buf.flush_coalesced()
+
+        assert self.buf.get(model, ["times_seen"], filters) == {"times_seen": 3}
+        assert self.buf.get(model, ["times_seen"], {"pk": 2}) == {"times_seen": 3}
+        result = _hgetall_decode_keys(client, key, self.buf.is_redis_cluster)
+        if self.buf.is_redis_cluster:
+            assert self.buf._load_value(json.loads(result["e+foo"])) == "baz"
+        else:
+            assert pickle.loads(result["e+foo"]) == "baz"
+        assert self.buf._coalesce_timer is None
+
+    @mock.patch("sentry.buffer.base.Buffer.process")
+    def test_process_batch_incr(self, process):
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        keys = []
+        for pk in range(1, 4):
+            self.buf.incr(Group, {"times_seen": pk}, {"pk": pk}, extra={"foo": "bar"})
+            keys.append(self.buf._make_key(Group, {"pk": pk}))
+        client.set(self.buf._make_lock_key(keys[2]), "1")
+
+        with override_options({"buffer.redis.batch-process": True}):
+            self.buf.process(batch_keys=keys)
+
+        assert process.mock_calls == [
+            mock.call(Group, {"times_seen": 1}, {"pk": 1}, {"foo": "bar"}, None),
+            mock.call(Group, {"times_seen": 2}, {"pk": 2}, {"foo": "bar"}, None),
+        ]
+        assert client.hgetall(keys[0]) == {}
+        assert client.hgetall(keys[1]) == {}
+        assert client.get(self.buf._make_lock_key(keys[0])) is None
+        # Locked keys are left for the next run.
+        assert client.hgetall(keys[2]) != {}
+
     def group_rule_data_by_project_id(self, buffer, project_ids):
         project_ids_to_rule_data = defaultdict(list)
         for proj_id in project_ids:
@@ -158,3 +158,62 @@ class RedisBackendTestCase(TestCase):
 
         with backend.digest("timeline", 0) as records:
             assert len(records) == n
+
+    def test_digest_many(self):
+        backend = RedisBackend()
+
+        for timeline in ("timeline:1", "timeline:2"):
+            backend.add(timeline, Record(f"{timeline}:record", self.notification, time.time()))
+
+        with backend.digest_many({"timeline:1": 0, "timeline:2": 0, "timeline:3": 0}) as digests:
+            assert {
+                key: [record.key for record in records] for key, records in digests.items()
+            } == {"timeline:1": ["timeline:1:record"], "timeline:2": ["timeline:2:record"]}
+
+        # Both timelines were closed and are scheduled again.
+        assert {entry.key for entry in backend.schedule(time.time())} == {
+            "timeline:1",
+            "timeline:2",
+        }
+
+        with backend.digest_many({"timeline:1": 0, "timeline:2": 0}) as digests:
+            assert digests == {"timeline:1": [], "timeline:2": []}
+
+    def test_digest_many_skips_locked(self):
+        backend = RedisBackend()
+
+        for timeline in ("timeline:1", "timeline:2"):
+            backend.add(timeline, Record(f"{timeline}:record", self.notification, time.time()))
+
+        with backend.digest("timeline:1", 0):
+            with backend.digest_many({"timeline:1": 0, "timeline:2": 0}) as digests:
+                assert list(digests) == ["timeline:2"]
+
+        # The locks of the batch were released.
+        assert not backend._get_timeline_lock("timeline:2", duration=30).locked()
+
+    def test_digest_many_removed_and_failed(self):
+        backend = RedisBackend()
+
+        for timeline in ("timeline:1", "timeline:2"):
+            backend.add(timeline, Record(f"{timeline}:record", self.notification, time.time()))
+
+        with backend.digest_many({"timeline:1": 0, "timeline:2": 0}) as digests:
+            del digests["timeline:1"]
+
+        # The removed timeline was not closed and is still ready, ...
+        with backend.digest("timeline:1", 0) as records:
+            assert [record.key for record in records] == ["timeline:1:record"]
+
+        # ...while the other one was closed.
+        with pytest.raises(InvalidState):
+            with backend.digest("timeline:2", 0):
+                pass
+
+        backend.add("timeline:3", Record("timeline:3:record", self.notification, time.time()))
+        with pytest.raises(Exception, match="not closed"):
+            with backend.digest_many({"timeline:3": 0}):
+                raise Exception("This causes the digests to not be closed.")
+
+        with backend.digest("timeline:3", 0) as records:
+            assert [record.key for record in records] == ["timeline:3:record"]
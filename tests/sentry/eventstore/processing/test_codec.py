@@ -0,0 +1,57 @@
+import zstandard
+
+from sentry.eventstore.processing.codec import EventPayloadCodec, RawEventPayload
+from sentry.testutils.helpers.options import override_options
+from sentry.utils import json
+
+EVENT = {"event_id": "a" * 32, "project": 1, "message": "hello world", "tags": [["a", "b"]]}
+
+
+def test_uncompressed() -> None:
+    codec = EventPayloadCodec()
+
+    encoded = codec.encode(EVENT)
+    assert json.loads(encoded) == EVENT
+    assert codec.decode(encoded) == EVENT
+
+
+def test_raw_payload_is_stored_as_is() -> None:
+    codec = EventPayloadCodec()
+    payload = '{"event_id": "%s",   "project": 1}' % ("a" * 32)
+
+    assert codec.encode(RawEventPayload(payload)) == payload.encode()
+    assert codec.encode(RawEventPayload(payload.encode())) == payload.encode()
+    assert codec.decode(codec.encode(RawEventPayload(payload))) == {
+        "event_id": "a" * 32,
+        "project": 1,
+    }
+
+
+@override_options({"eventstore.processing.compress": True})
+def test_compressed() -> None:
+    codec = EventPayloadCodec()
+
+    encoded = codec.encode(EVENT)
+    assert zstandard.ZstdDecompressor().decompress(encoded) == json.dumps(EVENT).encode()
+    assert codec.decode(encoded) == EVENT
+
+    # Payloads that were stored before compression was enabled can still be read.
+    assert codec.decode(json.dumps(EVENT).encode()) == EVENT
+
+
+def test_compressed_with_dictionary(tmp_path) -> None:
+    samples = [
+        json.dumps({**EVENT, "event_id": f"{i:032x}", "message": f"hello world {i}"}).encode()
+        for i in range(1000)
+    ]
+    dictionary_path = tmp_path / "dictionary"
+    dictionary_path.write_bytes(zstandard.train_dictionary(4096, samples).as_bytes())
+
+    codec = EventPayloadCodec(dictionary_path=str(dictionary_path))
+    with override_options({"eventstore.processing.compress": True}):
+        encoded = codec.encode(EVENT)
+        # Payloads that were compressed without a dictionary can still be read.
+        assert codec.decode(EventPayloadCodec().encode(EVENT)) == EVENT
+
+    assert len(encoded) < len(EventPayloadCodec().encode(EVENT))
+    assert codec.decode(encoded) == EVENT
@@ -52,3 +52,51 @@ def test_basic():
             }
         },
     )
+
+
+def test_verbatim():
+    _assert_roundtrip({"modules": None})
+    _assert_roundtrip({"modules": {"django": "5.0", "celery": "5.3"}})
+    _assert_roundtrip(
+        {"sdk": {"name": "sentry.python", "version": "2.0.0"}, "modules": {"django": "5.0"}}
+    )
+
+
+def test_contexts():
+    _assert_roundtrip({"contexts": None})
+    _assert_roundtrip({"contexts": {}})
+    _assert_roundtrip({"contexts": {"trace": {"trace_id": "a" * 32}}})
+    _assert_roundtrip(
+        {
+            "contexts": {
+                "os": {"name": "iOS", "version": "16.3"},
+                "device": {"free_memory": 1234},
+            }
+        },
+    )
+
+
+def test_does_not_mutate_input():
+    data = {
+        "debug_meta": {"images": [{"debug_id": "1234abcdef", "image_addr": "0xdeadbeef"}]},
+        "contexts": {"os": {"name": "iOS"}, "device": {"free_memory": 1234}},
+    }
+    original = copy.deepcopy(data)
+
+    deduplicate(data)
+
+    assert data == original
+
+
+def test_missing_blob():
+    new_data, _ = deduplicate(
+        {
+            "debug_meta": {"images": [{"debug_id": "1234abcdef", "image_addr": "0xdeadbeef"}]},
+            "modules": {"django": "5.0"},
+        }
+    )
+
+    assert assemble(new_data, lambda checksums: {}) == {
+        "debug_meta": {"images": [{"image_addr": "0xdeadbeef"}]},
+        "modules": None,
+    }
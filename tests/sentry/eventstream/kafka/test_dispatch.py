@@ -1,12 +1,16 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
 from arroyo.backends.kafka import KafkaPayload
-from arroyo.types import BrokerValue, Message, Partition, Topic
+from arroyo.types import BrokerValue, Message, Partition, Topic, Value
 
-from sentry.eventstream.kafka.dispatch import _get_task_kwargs_and_dispatch
+from sentry.eventstream.kafka.dispatch import (
+    _get_task_kwargs_and_dispatch,
+    _get_task_kwargs_and_dispatch_batch,
+)
 from sentry.utils import json
 
 
@@ -127,3 +131,40 @@ def test_dispatch_task_with_occurrence(mock_post_process_group: Mock) -> None:
         },
         "queue": "post_process_issue_platform",
     }
+
+
+def get_batch_message() -> Message:
+    partition = Partition(Topic("test"), 0)
+    return Message(
+        Value(
+            [
+                BrokerValue(get_kafka_payload(), partition, 1, datetime.now()),
+                BrokerValue(get_occurrence_kafka_payload(), partition, 2, datetime.now()),
+            ],
+            {partition: 3},
+        )
+    )
+
+
+@pytest.mark.django_db
+@patch("sentry.tasks.post_process.post_process_group.apply_async")
+def test_dispatch_batch(mock_post_process_group: Mock) -> None:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        _get_task_kwargs_and_dispatch_batch(get_batch_message(), executor)
+
+    assert mock_post_process_group.call_count == 2
+    assert sorted(
+        (call.kwargs["kwargs"]["project_id"], call.kwargs["queue"])
+        for call in mock_post_process_group.call_args_list
+    ) == [(1, "post_process_errors"), (2, "post_process_issue_platform")]
+    assert all(call.kwargs["producer"] for call in mock_post_process_group.call_args_list)
+
+
+@pytest.mark.django_db
+@patch("sentry.tasks.post_process.post_process_group.apply_async")
+def test_dispatch_batch_fails(mock_post_process_group: Mock) -> None:
+    mock_post_process_group.side_effect = ConnectionError
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ConnectionError):
+            _get_task_kwargs_and_dispatch_batch(get_batch_message(), executor)
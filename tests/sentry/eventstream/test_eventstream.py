@@ -464,3 +464,37 @@ class SnubaEventStreamTest(TestCase, SnubaTestCase, OccurrenceTestMixin):
             assert "contexts" in send_extra_data_data
             contexts_after_processing = send_extra_data_data["contexts"]
             assert contexts_after_processing == {**{"geo": geo_interface}}
+
+    def test_insert_many(self):
+        now = timezone.now()
+        error_event = self.__build_event(now)
+        transaction_event = self.__build_transaction_event()
+
+        self.kafka_eventstream.insert_many(
+            [
+                {
+                    "event": event,
+                    "is_new": False,
+                    "is_regression": False,
+                    "is_new_group_environment": False,
+                    "primary_hash": None,
+                    "received_timestamp": event.data["received"],
+                    "skip_consume": False,
+                    "group_states": None,
+                }
+                for event in (error_event, transaction_event)
+            ]
+        )
+
+        producer = self.producer_mock
+        assert [call.kwargs["topic"] for call in producer.produce.call_args_list] == [
+            "events",
+            "transactions",
+        ]
+        for call, event in zip(producer.produce.call_args_list, (error_event, transaction_event)):
+            _, type_, payload1, _ = json.loads(call.kwargs["value"])
+            assert type_ == "insert"
+            assert payload1["event_id"] == event.event_id
+            assert ("operation", b"insert") in call.kwargs["headers"]
+
+        assert not producer.flush.called
@@ -1,22 +1,15 @@
 import pytest
 
 from sentry.grouping.api import get_default_grouping_config_dict
+from sentry.grouping.parameterization import Parameterizer
 from sentry.grouping.strategies.configurations import CONFIGURATIONS
+from sentry.testutils.skips import requires_pytest_benchmark
 from tests.sentry.grouping import grouping_input as grouping_inputs
 
 CONFIGS = {key: get_default_grouping_config_dict(key) for key in sorted(CONFIGURATIONS.keys())}
 
 
-def benchmark_available() -> bool:
-    try:
-        __import__("pytest_benchmark")
-    except ModuleNotFoundError:
-        return False
-    else:
-        return True
-
-
-@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+@requires_pytest_benchmark
 @pytest.mark.parametrize(
     "config_name", sorted(CONFIGURATIONS.keys()), ids=lambda x: x.replace("-", "_")
 )
@@ -37,3 +30,89 @@ def run_configuration(grouping_input, config):
     event.project = None
 
     event.get_hashes()
+
+
+PARAMETERIZATION_CORPUS = [
+    (
+        "Connection to db.internal.example.com:5432 timed out after 3000ms",
+        "Connection to <hostname>:<int> timed out after <duration>",
+    ),
+    (
+        "User 8412 (jane.doe@example.com) exceeded quota of 1000 requests",
+        "User <int> (<email>) exceeded quota of <int> requests",
+    ),
+    (
+        "Failed to fetch https://api.example.com/v1/users/12345?include=orgs: 503 Service Unavailable",
+        "Failed to fetch <url> <int> Service Unavailable",
+    ),
+    (
+        "Task 3f2b8c9e-1d4a-4b7e-9f0a-2c6d8e1f3a5b failed: worker lost at 2024-03-18T22:52:00Z",
+        "Task <uuid> failed: worker lost at <date>",
+    ),
+    (
+        "Segmentation fault at address 0x7ffee3b4a9c0 in thread 14",
+        "Segmentation fault at address <hex> in thread <int>",
+    ),
+    (
+        "Could not resolve commit 1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b for release 2.3.1",
+        "Could not resolve commit <sha1> for release <float>.<int>",
+    ),
+    (
+        "Request from 192.168.10.34 rejected: rate limit 50.5 req/s exceeded",
+        "Request from <ip> rejected: rate limit <float> req/s exceeded",
+    ),
+    (
+        'Cache miss for key="project:4505469596663808:config" after 2.5s',
+        "Cache miss for key=<quoted_str> after <duration>",
+    ),
+    (
+        "Invalid flag enabled=true for org 1383997",
+        "Invalid flag enabled=<bool> for org <int>",
+    ),
+    (
+        "Slow query took 1532ms: SELECT * FROM sentry_groupedmessage WHERE id = 99812",
+        "Slow query took <duration>: SELECT * FROM sentry_groupedmessage WHERE id = <int>",
+    ),
+    (
+        "Payment of -42.50 USD declined for order 77312 on Mon, 02 Jan 2006 15:04 MST",
+        "Payment of <float> USD declined for order <int> on <date>",
+    ),
+    (
+        "Upload of md5 5d41402abc4b2a76b9719d911017c592 failed with status 413",
+        "Upload of md5 <md5> failed with status <int>",
+    ),
+]
+
+PARAMETERIZATION_KEYS = (
+    "email",
+    "url",
+    "hostname",
+    "ip",
+    "uuid",
+    "sha1",
+    "md5",
+    "date",
+    "duration",
+    "hex",
+    "float",
+    "int",
+    "quoted_str",
+    "bool",
+)
+
+
+@requires_pytest_benchmark
+@pytest.mark.parametrize("cache_results", [False, True], ids=["uncached", "cached"])
+def test_benchmark_parameterization(cache_results, benchmark):
+    def run():
+        # Like `normalize_message_for_grouping`, a parameterizer is created for every message.
+        return [
+            Parameterizer(PARAMETERIZATION_KEYS, cache_results=cache_results).parameterize_all(
+                message
+            )
+            for message, _ in PARAMETERIZATION_CORPUS
+        ]
+
+    result = benchmark(run)
+
+    assert result == [expected for _, expected in PARAMETERIZATION_CORPUS]
@@ -8,6 +8,7 @@ import pytest
 from sentry.grouping.enhancer import Enhancements
 from sentry.grouping.enhancer.exceptions import InvalidEnhancerConfig
 from sentry.grouping.enhancer.matchers import _cached, create_match_frame
+from sentry.testutils.helpers.options import override_options
 
 
 def dump_obj(obj):
@@ -494,3 +495,54 @@ def test_cached_with_kwargs():
     # Call with different kwargs order - call_count is still one:
     _cached(cache, foo, kw2=2, kw1=1)
     assert foo.call_count == 1
+
+
+def test_has_frame_local_modifications():
+    assert Enhancements.from_config_string(
+        """
+        function:foo +app
+        function:bar category=bar
+        category:bar -app
+        error.type:ValueError function:baz +app
+        function:panic_handler ^-group
+        """
+    ).has_frame_local_modifications
+
+    assert not Enhancements.from_config_string("function:foo ^-app").has_frame_local_modifications
+    assert not Enhancements.from_config_string(
+        "[ function:foo ] | function:bar +app"
+    ).has_frame_local_modifications
+
+
+@override_options({"grouping.enhancer.modifications-cache.enabled": True})
+def test_modifications_cache():
+    config = """
+        function:foo +app
+        function:bar category=bar
+        category:bar -app
+        error.type:ValueError function:baz +app
+    """
+    enhancements = Enhancements.from_config_string(config)
+    uncached = Enhancements.from_config_string(config)
+    uncached.has_frame_local_modifications = False
+
+    def make_frames():
+        return [
+            {"function": "foo"},
+            {"function": "bar", "in_app": True},
+            {"function": "baz"},
+            {"function": "qux", "in_app": False},
+        ]
+
+    for exception_data in [{}, {"type": "ValueError"}, {}]:
+        frames = make_frames()
+        enhancements.apply_modifications_to_frame(frames, "python", exception_data)
+        expected_frames = make_frames()
+        uncached.apply_modifications_to_frame(expected_frames, "python", exception_data)
+        assert frames == expected_frames
+
+    with mock.patch.object(enhancements, "rust_enhancements") as rust_enhancements:
+        frames = make_frames()
+        enhancements.apply_modifications_to_frame(frames, "python", {})
+        assert frames == expected_frames
+        assert not rust_enhancements.apply_modifications_to_frames.called
@@ -6,6 +6,7 @@ from sentry.grouping.parameterization import (
     ParameterizationRegexExperiment,
     Parameterizer,
     UniqueIdExperiment,
+    _result_cache,
 )
 
 
@@ -268,6 +269,47 @@ def test_parameterize_regex_experiment_cached_compiled():
     mocked_pattern.assert_called_once()
 
 
+def test_parameterize_cache_results():
+    FooExperiment = ParameterizationRegexExperiment(name="foo", raw_pattern=r"f[oO]{2}")
+    input = "blah foobarbaz fooooo 1234"
+
+    def make_parameterizer():
+        return Parameterizer(
+            regex_pattern_keys=("int",),
+            experiments=(FooExperiment,),
+            cache_results=True,
+        )
+
+    with mock.patch.object(
+        Parameterizer, "_parameterize_all", wraps=Parameterizer._parameterize_all, autospec=True
+    ) as parameterize:
+        first = make_parameterizer()
+        assert first.parameterize_all(input) == "blah <foo>barbaz <foo>ooo <int>"
+
+        second = make_parameterizer()
+        assert second.parameterize_all(input) == "blah <foo>barbaz <foo>ooo <int>"
+        assert parameterize.call_count == 1
+        assert second.matches_counter == first.matches_counter == {"foo": 2, "int": 1}
+        assert second.get_successful_experiments() == [FooExperiment]
+
+        # whether experiments run is part of the cache key
+        third = make_parameterizer()
+        assert third.parameterize_all(input, lambda _: False) == "blah foobarbaz fooooo <int>"
+        assert parameterize.call_count == 2
+        assert third.matches_counter == {"int": 1}
+
+
+def test_parameterize_cache_size():
+    input = "cache size 1234 5678"
+    size_before = _result_cache.currsize
+
+    parameterizer = Parameterizer(regex_pattern_keys=("int",), cache_results=True)
+    assert parameterizer.parameterize_all(input) == "cache size <int> <int>"
+
+    # Both the message in the key and the parameterized message are counted.
+    assert _result_cache.currsize - size_before == len(input) + len("cache size <int> <int>")
+
+
 # These are test cases that we should fix
 @pytest.mark.xfail()
 @pytest.mark.parametrize(
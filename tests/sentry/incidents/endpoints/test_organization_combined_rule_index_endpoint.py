@@ -10,6 +10,7 @@ from sentry.models.rulefirehistory import RuleFireHistory
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.cases import APITestCase
 from sentry.testutils.helpers.datetime import before_now, freeze_time
+from sentry.testutils.helpers.options import override_options
 from sentry.types.actor import Actor
 from sentry.uptime.models import ProjectUptimeSubscriptionMode, UptimeStatus
 from sentry.utils import json
@@ -227,6 +228,34 @@ class OrganizationCombinedRuleIndexEndpointTest(BaseAlertRuleSerializerTest, API
         assert result[0]["id"] == str(self.issue_rule.id)
         assert result[0]["type"] == "rule"
 
+    @override_options({"api.alert-rule-index.keyset-pagination": True})
+    def test_keyset_pagination(self):
+        self.setup_project_and_rules()
+        ids = []
+        request_data = {"per_page": "1", "project": self.project_ids}
+        while True:
+            with self.feature(["organizations:incidents", "organizations:performance-view"]):
+                response = self.client.get(
+                    path=self.combined_rules_url,
+                    data=request_data,
+                    content_type="application/json",
+                )
+            assert response.status_code == 200, response.content
+            ids.extend(rule["id"] for rule in json.loads(response.content))
+            links = requests.utils.parse_header_links(
+                response.get("link", "").rstrip(">").replace(">,<", ",<")
+            )
+            if links[1]["results"] != "true":
+                break
+            request_data = {**request_data, "cursor": links[1]["cursor"]}
+
+        assert ids == [
+            str(self.yet_another_alert_rule.id),
+            str(self.issue_rule.id),
+            str(self.other_alert_rule.id),
+            str(self.alert_rule.id),
+        ]
+
     def test_limit_as_1_with_paging_sort_name_urlencode(self):
         self.org = self.create_organization(owner=self.user, name="Rowdy Tiger")
         self.team = self.create_team(
@@ -87,3 +87,48 @@ def test_dlq_invalid_messages(factories, topic_name, consumer_type) -> None:
 
         assert exc_info.value.partition == partition
         assert exc_info.value.offset == offset
+
+
+@django_db_all
+def test_dlq_invalid_messages_batched(factories) -> None:
+    organization = factories.create_organization()
+    project = factories.create_project(organization=organization)
+
+    empty_event_payload = msgpack.packb(
+        {
+            "type": "event",
+            "project_id": project.id,
+            "payload": b"{}",
+            "start_time": int(time.time()),
+            "event_id": "aaa",
+        }
+    )
+
+    partition = Partition(Topic(TopicNames.INGEST_EVENTS.value), 0)
+    factory = IngestStrategyFactory(
+        ConsumerType.Events,
+        reprocess_only_stuck_events=False,
+        stop_at_timestamp=False,
+        num_processes=1,
+        max_batch_size=2,
+        max_batch_time=1,
+        input_block_size=None,
+        output_block_size=None,
+        mode="batched",
+    )
+    commit = Mock()
+    strategy = factory.create_with_partitions(commit, Mock())
+
+    strategy.submit(make_message(b"bogus message", partition, 5))
+    strategy.submit(make_message(empty_event_payload, partition, 6))
+    # Flushes the batch, and raises the invalid messages one by one.
+    strategy.submit(make_message(empty_event_payload, partition, 7))
+
+    for offset in (5, 6):
+        with pytest.raises(InvalidMessage) as exc_info:
+            strategy.poll()
+
+        assert exc_info.value.partition == partition
+        assert exc_info.value.offset == offset
+
+    strategy.poll()
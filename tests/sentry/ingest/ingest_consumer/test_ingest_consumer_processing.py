@@ -22,6 +22,7 @@ from sentry.ingest.consumer.processors import (
     collect_span_metrics,
     process_attachment_chunk,
     process_event,
+    process_event_batch,
     process_individual_attachment,
     process_userreport,
 )
@@ -109,6 +110,72 @@ def test_deduplication_works(default_project, task_runner, preprocess_event):
     }
 
 
+@django_db_all
+def test_batch_deduplication_works(default_project, task_runner, preprocess_event):
+    payloads = [
+        get_normalized_event({"message": f"hello world {i}"}, default_project) for i in range(3)
+    ]
+    start_time = time.time() - 3600
+
+    def make_message(payload):
+        return {
+            "payload": orjson.dumps(payload).decode(),
+            "start_time": start_time,
+            "event_id": payload["event_id"],
+            "project_id": default_project.id,
+            "remote_addr": "127.0.0.1",
+        }
+
+    # The first event is processed on its own before the batch, the second
+    # one is contained in the batch twice.
+    process_event(make_message(payloads[0]), project=default_project)
+    errors = process_event_batch(
+        [
+            (make_message(payloads[0]), default_project),
+            (make_message(payloads[1]), default_project),
+            (make_message(payloads[1]), default_project),
+            (make_message(payloads[2]), default_project),
+        ]
+    )
+
+    assert errors == [None, None, None, None]
+    assert [kwargs["event_id"] for kwargs in preprocess_event] == [
+        payload["event_id"] for payload in payloads
+    ]
+    assert preprocess_event[1] == {
+        "cache_key": f"e:{payloads[1]['event_id']}:{default_project.id}",
+        "data": payloads[1],
+        "event_id": payloads[1]["event_id"],
+        "project": default_project,
+        "start_time": start_time,
+        "has_attachments": False,
+    }
+
+
+@django_db_all
+def test_batch_invalid_messages(default_project, task_runner, preprocess_event):
+    payload = get_normalized_event({"message": "hello world"}, default_project)
+    message = {
+        "payload": orjson.dumps(payload).decode(),
+        "start_time": time.time(),
+        "event_id": payload["event_id"],
+        "project_id": default_project.id,
+    }
+
+    errors = process_event_batch(
+        [
+            ({**message, "payload": "bogus", "event_id": "a" * 32}, default_project),
+            (message, default_project),
+            ({"payload": "{}", "project_id": default_project.id}, default_project),
+        ]
+    )
+
+    assert isinstance(errors[0], orjson.JSONDecodeError)
+    assert errors[1] is None
+    assert isinstance(errors[2], KeyError)
+    assert [kwargs["event_id"] for kwargs in preprocess_event] == [payload["event_id"]]
+
+
 @django_db_all
 def test_transactions_spawn_save_event_transaction(
     default_project,
@@ -0,0 +1,76 @@
+"""
+Benchmarks for nodestore interface deduplication. Bytes per event are
+reported in the benchmark's `extra_info`.
+
+    pytest tests/sentry/nodestore/test_benchmark.py --benchmark-only
+"""
+
+import copy
+import uuid
+import zlib
+from datetime import timedelta
+
+import pytest
+
+from fixtures.sdk_crash_detection.crash_event_cocoa import get_crash_event
+from sentry.nodestore.base import DEDUPLICATED_BLOB_PREFIX, NodeStorage
+from sentry.testutils.helpers import override_options
+from sentry.testutils.skips import requires_pytest_benchmark
+
+CORPUS_SIZE = 200
+
+
+class InMemoryNodeStorage(NodeStorage):
+    cache = None
+
+    def __init__(self):
+        self.nodes: dict[str, bytes] = {}
+
+    def _get_bytes(self, id: str) -> bytes | None:
+        data = self.nodes.get(id)
+        return zlib.decompress(data) if data is not None else None
+
+    def _set_bytes(self, id: str, data: bytes, ttl: timedelta | None = None) -> None:
+        self.nodes[id] = zlib.compress(data)
+
+    def delete(self, id: str) -> None:
+        self.nodes.pop(id, None)
+
+
+def _corpus():
+    events = []
+    for i in range(CORPUS_SIZE):
+        event = get_crash_event()
+        event["event_id"] = uuid.uuid4().hex
+        event["contexts"]["device"]["free_memory"] = i
+        for j, image in enumerate(event["debug_meta"]["images"]):
+            # image addresses change with every process because of ASLR
+            image["image_addr"] = hex(0x100000000 + i * 0x1000 + j)
+        events.append((event["event_id"], event))
+    return events
+
+
+def _store(corpus, rate):
+    ns = InMemoryNodeStorage()
+    with override_options({"nodestore.deduplicate-interfaces.rate": rate}):
+        for id, event in corpus:
+            ns.set(id, copy.deepcopy(event))
+    return ns
+
+
+@requires_pytest_benchmark
+@pytest.mark.parametrize("rate", [0.0, 1.0], ids=["inline", "deduplicated"])
+def test_benchmark_decode(rate, benchmark):
+    corpus = _corpus()
+    ns = _store(corpus, rate)
+
+    event_bytes = sum(
+        len(v) for k, v in ns.nodes.items() if not k.startswith(DEDUPLICATED_BLOB_PREFIX)
+    )
+    benchmark.extra_info["bytes_per_event"] = event_bytes / len(corpus)
+    benchmark.extra_info["total_bytes_per_event"] = sum(map(len, ns.nodes.values())) / len(corpus)
+
+    ids = [id for id, _ in corpus]
+    result = benchmark(ns.get_multi, ids)
+
+    assert result == dict(corpus)
@@ -2,10 +2,14 @@
 Testsuite of backend-independent nodestore tests. Add your backend to the
 `ns` fixture to have it tested.
 """
+
 from contextlib import nullcontext
+from unittest import mock
 
 import pytest
 
+from sentry.eventstore.compressor import deduplicate
+from sentry.nodestore.base import DEDUPLICATED_BLOB_PREFIX
 from sentry.nodestore.django.backend import DjangoNodeStorage
 from sentry.testutils.helpers import override_options
 from tests.sentry.nodestore.bigtable.test_backend import (
@@ -42,6 +46,32 @@ def test_get_multi(ns):
     assert result == {n[0]: n[1] for n in nodes}
 
 
+@override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
+def test_get_multi_missing(ns):
+    ns.set("a" * 32, {"foo": "a"})
+
+    assert ns.get_multi(["a" * 32, "c" * 32]) == {"a" * 32: {"foo": "a"}, "c" * 32: None}
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.get-multi.parallel-threshold": 1,
+    }
+)
+def test_get_multi_parallel(ns):
+    nodes = [(f"node_{i}", {"foo": i}) for i in range(10)]
+
+    for node_id, data in nodes:
+        ns.set(node_id, data)
+
+    result = ns.get_multi([node_id for node_id, _ in nodes] + ["node_missing"])
+    assert result == {**dict(nodes), "node_missing": None}
+    assert ns.get_multi([node_id for node_id, _ in nodes], subkey="other") == {
+        node_id: None for node_id, _ in nodes
+    }
+
+
 @override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
 def test_set(ns):
     node_id = "d2502ebbd7df41ceba8d3275595cac33"
@@ -97,3 +127,85 @@ def test_set_subkeys(ns):
     ns.delete("node_1")
     assert ns.get("node_1") is None
     assert ns.get("node_1", subkey="other") is None
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.deduplicate-interfaces.rate": 1.0,
+    }
+)
+def test_deduplicate_interfaces(ns):
+    debug_meta = {
+        "images": [
+            {
+                "type": "macho",
+                "image_addr": "0x100260000",
+                "code_file": "/private/var/containers/Bundle/Application/iOS-Swift.app/iOS-Swift",
+                "debug_id": "aa8a3697-c88a-36f9-a687-3d3596568c8d",
+            }
+        ]
+    }
+    nodes = [
+        ("node_1", {"foo": "a", "debug_meta": debug_meta, "modules": {"django": "5.0"}}),
+        ("node_2", {"foo": "b", "debug_meta": debug_meta, "modules": {"django": "5.0"}}),
+    ]
+
+    ns.set_subkeys(nodes[0][0], {None: nodes[0][1], "other": {"foo": "c"}})
+    ns.set(nodes[1][0], nodes[1][1])
+
+    assert b"debug_meta" in ns.get_bytes(nodes[0][0])
+    assert b"aa8a3697" not in ns.get_bytes(nodes[0][0])
+
+    assert ns.get(nodes[0][0]) == nodes[0][1]
+    assert ns.get(nodes[0][0], subkey="other") == {"foo": "c"}
+    assert ns.get_multi([n[0] for n in nodes]) == dict(nodes)
+
+    # shared blobs outlive the nodes that reference them
+    ns.delete(nodes[0][0])
+    assert ns.get(nodes[1][0]) == nodes[1][1]
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.deduplicate-interfaces.rate": 1.0,
+    }
+)
+def test_deduplicate_interfaces_missing_blob(ns):
+    data = {"foo": "a", "modules": {"django": "5.0"}}
+    ns.set("node_1", data)
+    ns.set("node_2", {"foo": "b"})
+
+    blob_ids = [f"{DEDUPLICATED_BLOB_PREFIX}{checksum}" for checksum in deduplicate(data)[1]]
+    ns.delete_multi(blob_ids)
+
+    # a node can't be returned without its blobs
+    assert ns.get("node_1") is None
+    assert ns.get_multi(["node_1", "node_2"]) == {"node_1": None, "node_2": {"foo": "b"}}
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.deduplicate-interfaces.rate": 1.0,
+    }
+)
+def test_deduplicate_interfaces_rewrites_read_blobs(ns):
+    data = {"foo": "a", "modules": {"django": "5.0"}}
+    ns.set("node_1", data)
+    assert ns.cache is not None
+    ns.cache.clear()
+
+    # reading the blob caches it, but doesn't count as a recent write
+    assert ns.get("node_1") == data
+    with mock.patch.object(ns, "set_bytes", wraps=ns.set_bytes) as set_bytes:
+        ns.set("node_2", data)
+        ns.set("node_3", data)
+
+    blob_writes = [
+        call.args[0]
+        for call in set_bytes.call_args_list
+        if call.args[0].startswith(DEDUPLICATED_BLOB_PREFIX)
+    ]
+    assert len(blob_writes) == 1
@@ -0,0 +1,157 @@
+import pickle
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from sentry.ownership.compiled import (
+    CompiledRules,
+    get_compiled_rules,
+    get_required_literal,
+    get_schema_digest,
+    memoize_schema_digest,
+)
+from sentry.ownership.grammar import Matcher, Owner, Rule, dump_schema, parse_rules
+from sentry.testutils.skips import requires_pytest_benchmark
+
+fixture_data = """
+*.js                    #frontend
+url:http://google.com/* #backend
+path:src/sentry/*       david@sentry.io
+path:*.py               python@sentry.io
+path:SRC/Sentry/API/*   api@sentry.io
+tags.foo:bar            tagperson@sentry.io
+module:foo.bar          #workflow
+module:foo.*            #foo
+codeowners:/src/components/  githubuser@sentry.io
+codeowners:frontend/*.ts     githubmod@sentry.io
+codeowners:**               everyone@sentry.io
+codeowners:\\filename        backslash@sentry.io
+path:[sS]rc/{a,b}/*.py      brackets@sentry.io
+"""
+
+events = [
+    {},
+    {"tags": [["foo", "bar"]], "request": {"url": "http://google.com/search"}},
+    {
+        "stacktrace": {
+            "frames": [
+                {"filename": "src/sentry/api/base.py", "module": "foo.bar"},
+                {"abs_path": "/usr/src/components/button.js", "in_app": False},
+            ]
+        }
+    },
+    {
+        "exception": {
+            "values": [
+                {
+                    "stacktrace": {
+                        "frames": [
+                            {"filename": "frontend/app.ts", "in_app": True},
+                            {"filename": "src\\b\\views.py"},
+                            {"filename": "subdir/\\/backslash_dir"},
+                        ]
+                    }
+                }
+            ]
+        }
+    },
+    {"platform": "python", "stacktrace": {"frames": [{"module": "foo.baz"}]}},
+]
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("src/sentry/*.py", "sentry"),
+        ("*", None),
+        ("**", None),
+        ("*.js", ".js"),
+        ("/src/components/", "components"),
+        ("[abc]def*", "def"),
+        ("foo{a,b}xyz", "foo"),
+        ("\\filename", None),
+        ("./*", None),
+        ("a[b", None),
+        ("SRC/Sentry/*", "sentry"),
+    ],
+)
+def test_get_required_literal(pattern, expected):
+    assert get_required_literal(pattern) == expected
+
+
+@pytest.mark.parametrize("data", events)
+def test_match_same_as_linear(data):
+    rules = parse_rules(fixture_data)
+
+    assert CompiledRules(rules).match(data) == [rule for rule in rules if rule.test(data, None)]
+
+
+def test_get_compiled_rules_cached():
+    schema = dump_schema(parse_rules(fixture_data))
+
+    compiled = get_compiled_rules(schema)
+    assert get_compiled_rules(dump_schema(parse_rules(fixture_data))) is compiled
+
+    schema["rules"].pop()
+    assert get_compiled_rules(schema) is not compiled
+
+
+def test_memoize_schema_digest():
+    instance = SimpleNamespace(schema=dump_schema(parse_rules(fixture_data)))
+    digest = memoize_schema_digest(instance)
+    assert digest == get_schema_digest(instance.schema)
+
+    with mock.patch("sentry.ownership.compiled.get_schema_digest") as get_digest:
+        assert memoize_schema_digest(instance) == digest
+        # The memoized digest survives pickling, e.g. through the cache.
+        assert memoize_schema_digest(pickle.loads(pickle.dumps(instance))) == digest
+    get_digest.assert_not_called()
+
+    instance.schema = {**instance.schema, "rules": instance.schema["rules"][:-1]}
+    assert memoize_schema_digest(instance) != digest
+
+    instance.schema = None
+    assert memoize_schema_digest(instance) is None
+
+
+def _codeowners_rules(num_rules):
+    owners = [Owner("team", "team")]
+    return [
+        Rule(Matcher("codeowners", f"/src/app{i % 100}/module{i}/**/*.py"), owners)
+        for i in range(num_rules)
+    ]
+
+
+def _codeowners_event():
+    return {
+        "platform": "python",
+        "exception": {
+            "values": [
+                {
+                    "stacktrace": {
+                        "frames": [
+                            {"filename": f"src/app{i}/module{i * 37}/views/handler.py"}
+                            for i in range(50)
+                        ]
+                    }
+                }
+            ]
+        },
+    }
+
+
+@requires_pytest_benchmark
+@pytest.mark.parametrize("compiled", [False, True], ids=["linear", "compiled"])
+def test_benchmark_codeowners(compiled, benchmark):
+    rules = _codeowners_rules(5000)
+    data = _codeowners_event()
+    expected = [rule for rule in rules if rule.test(data, None)]
+
+    if compiled:
+        compiled_rules = CompiledRules(rules)
+        result = benchmark(compiled_rules.match, data)
+    else:
+        result = benchmark(lambda: [rule for rule in rules if rule.test(data, None)])
+
+    assert result == expected
@@ -3,6 +3,7 @@ from time import time
 from sentry.ratelimits.redis import RedisRateLimiter
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
 
 
 class RedisRateLimiterTest(TestCase):
@@ -64,3 +65,47 @@ class RedisRateLimiterTest(TestCase):
             assert not limited
             assert value == 1
             assert reset_time == expected_reset_time + 5
+
+
+@override_options({"ratelimits.redis.lease-fraction": 0.1, "ratelimits.redis.lease-max-size": 5})
+class RedisRateLimiterLeaseTest(TestCase):
+    def setUp(self):
+        self.backend = RedisRateLimiter()
+
+    def test_leases_in_chunks(self):
+        with freeze_time("2000-01-01"):
+            for _ in range(5):
+                assert not self.backend.is_limited("foo", 100)
+            assert self.backend.current_value("foo") == 5
+
+            assert not self.backend.is_limited("foo", 100)
+            assert self.backend.current_value("foo") == 10
+
+    def test_limit_is_enforced(self):
+        with freeze_time("2000-01-01"):
+            results = [self.backend.is_limited_with_value("foo", 50) for _ in range(60)]
+
+        assert [limited for limited, _, _ in results] == [False] * 50 + [True] * 10
+        assert [value for _, value, _ in results] == list(range(1, 61))
+
+    def test_processes_share_limit(self):
+        other = RedisRateLimiter()
+        with freeze_time("2000-01-01"):
+            admitted = 0
+            for _ in range(40):
+                admitted += not self.backend.is_limited("foo", 50)
+                admitted += not other.is_limited("foo", 50)
+
+        assert admitted == 50
+
+    def test_window_rolls(self):
+        with freeze_time("2000-01-01") as frozen_time:
+            for _ in range(60):
+                self.backend.is_limited("foo", 50, window=10)
+            assert self.backend.is_limited("foo", 50, window=10)
+
+            frozen_time.shift(10)
+            limited, value, _ = self.backend.is_limited_with_value("foo", 50, window=10)
+            assert not limited
+            assert value == 1
+            assert self.backend.current_value("foo", window=10) == 5
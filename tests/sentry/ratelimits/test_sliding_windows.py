@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from sentry.ratelimits.sliding_windows import (
@@ -6,6 +8,7 @@ from sentry.ratelimits.sliding_windows import (
     RedisSlidingWindowRateLimiter,
     RequestedQuota,
 )
+from sentry.testutils.helpers.options import override_options
 
 
 @pytest.fixture
@@ -71,3 +74,68 @@ def test_basic(limiter):
         )
 
         assert resp == [GrantedQuota(prefix="foo", granted=0, reached_quotas=quotas)]
+
+
+@pytest.fixture(params=(False, True), ids=("separate", "combined"))
+def combined_check_and_use(request):
+    with override_options({"ratelimits.sliding-windows.combined-check-and-use": request.param}):
+        yield request.param
+
+
+def test_check_and_use_partial_grant(limiter, combined_check_and_use):
+    quotas = [Quota(window_seconds=10, granularity_seconds=1, limit=5)]
+
+    resp = limiter.check_and_use_quotas(
+        [RequestedQuota(prefix="foo", requested=3, quotas=quotas)], timestamp=TIMESTAMP_OFFSET
+    )
+    assert resp == [GrantedQuota(prefix="foo", granted=3, reached_quotas=[])]
+
+    resp = limiter.check_and_use_quotas(
+        [RequestedQuota(prefix="foo", requested=4, quotas=quotas)], timestamp=TIMESTAMP_OFFSET
+    )
+    assert resp == [GrantedQuota(prefix="foo", granted=2, reached_quotas=quotas)]
+
+    # Only the granted amount remains used.
+    _, grants = limiter.check_within_quotas(
+        [RequestedQuota(prefix="foo", requested=1, quotas=quotas)], timestamp=TIMESTAMP_OFFSET
+    )
+    assert grants == [GrantedQuota(prefix="foo", granted=0, reached_quotas=quotas)]
+
+    resp = limiter.check_and_use_quotas(
+        [RequestedQuota(prefix="foo", requested=4, quotas=quotas)],
+        timestamp=TIMESTAMP_OFFSET + 10,
+    )
+    assert resp == [GrantedQuota(prefix="foo", granted=4, reached_quotas=[])]
+
+
+def test_check_and_use_batch(limiter, combined_check_and_use):
+    per_org = Quota(window_seconds=10, granularity_seconds=1, limit=3)
+    global_quota = Quota(window_seconds=10, granularity_seconds=1, limit=4, prefix_override="all")
+    quotas = [per_org, global_quota]
+
+    resp = limiter.check_and_use_quotas(
+        [
+            RequestedQuota(prefix="a", requested=2, quotas=quotas),
+            RequestedQuota(prefix="b", requested=5, quotas=quotas),
+            RequestedQuota(prefix="c", requested=1, quotas=quotas),
+        ],
+        timestamp=TIMESTAMP_OFFSET,
+    )
+
+    assert resp == [
+        GrantedQuota(prefix="a", granted=2, reached_quotas=[]),
+        GrantedQuota(prefix="b", granted=2, reached_quotas=[per_org, global_quota]),
+        GrantedQuota(prefix="c", granted=0, reached_quotas=[global_quota]),
+    ]
+
+
+def test_check_and_use_combined_skips_use_quotas(limiter, combined_check_and_use):
+    quotas = [Quota(window_seconds=10, granularity_seconds=1, limit=5)]
+
+    with mock.patch.object(limiter, "use_quotas", wraps=limiter.use_quotas) as use_quotas:
+        resp = limiter.check_and_use_quotas(
+            [RequestedQuota(prefix="foo", requested=3, quotas=quotas)], timestamp=TIMESTAMP_OFFSET
+        )
+
+    assert resp == [GrantedQuota(prefix="foo", granted=3, reached_quotas=[])]
+    assert use_quotas.called is not combined_check_and_use
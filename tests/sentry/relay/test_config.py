@@ -20,7 +20,13 @@ from sentry.dynamic_sampling.rules.base import NEW_MODEL_THRESHOLD_IN_MINUTES
 from sentry.models.projectkey import ProjectKey
 from sentry.models.projectteam import ProjectTeam
 from sentry.models.transaction_threshold import TransactionMetric
-from sentry.relay.config import ProjectConfig, get_project_config
+from sentry.relay.config import (
+    SECTION_INPUTS,
+    ProjectConfig,
+    get_invalidated_sections,
+    get_project_config,
+    get_project_config_sections,
+)
 from sentry.sentry_metrics.visibility import block_metric, block_tags_of_metric
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.factories import Factories
@@ -132,6 +138,31 @@ def test_get_project_config(default_project, insta_snapshot):
     insta_snapshot(cfg)
 
 
+@django_db_all
+@region_silo_test
+def test_get_project_config_sections(default_project):
+    keys = list(ProjectKey.objects.filter(project=default_project))
+
+    with Feature(
+        {
+            "organizations:dynamic-sampling": True,
+            "organizations:transaction-metrics-extraction": True,
+        }
+    ):
+        config = get_project_config(default_project, project_keys=keys).to_dict()["config"]
+        sections = get_project_config_sections(default_project, SECTION_INPUTS, project_keys=keys)
+
+    assert "sampling" in sections
+    for section in SECTION_INPUTS:
+        assert sections.get(section) == config.get(section)
+
+
+def test_get_invalidated_sections():
+    assert get_invalidated_sections("dynamic_sampling:boost_release") == ["sampling"]
+    assert get_invalidated_sections("monitors:monitor_created") == ["quotas"]
+    assert get_invalidated_sections("projectoption.set") is None
+
+
 SOME_EXCEPTION = RuntimeError("foo")
 
 
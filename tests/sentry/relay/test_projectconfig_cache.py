@@ -1,8 +1,17 @@
 from unittest import mock
 
+import pytest
+
+from sentry.relay.config import (
+    _get_desktop_browser_performance_profiles,
+    _get_mobile_browser_performance_profiles,
+)
 from sentry.relay.projectconfig_cache import redis
+from sentry.relay.projectconfig_cache.base import UNCHANGED
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
-from sentry.utils import metrics
+from sentry.testutils.skips import requires_pytest_benchmark
+from sentry.utils import json, metrics
 
 
 def test_delete_count(monkeypatch):
@@ -34,3 +43,87 @@ def test_read_write():
 
     assert cache.get_rev(dsn1) == "my_rev_123"
     assert cache.get_rev(dsn2) is None
+
+
+def _make_config(public_key):
+    # The performance score profiles are identical for all projects of an organization.
+    profiles = [
+        *_get_desktop_browser_performance_profiles(mock.Mock()),
+        *_get_mobile_browser_performance_profiles(mock.Mock()),
+    ]
+    return {
+        "rev": f"rev-{public_key}",
+        "config": {
+            "allowedDomains": ["*"],
+            "performanceScore": {"profiles": profiles},
+            "publicKey": public_key,
+        },
+    }
+
+
+def _stored_size(cache, public_keys):
+    keys = [f"relayconfig:{public_key}" for public_key in public_keys]
+    keys.extend(key.decode() for key in cache.cluster.keys("relayconfig:blob:*"))
+    return sum(len(cache.cluster.get(key)) for key in keys)
+
+
+@django_db_all
+def test_shared_blobs():
+    cache = redis.RedisProjectConfigCache()
+    cache.cluster.flushdb()
+
+    configs = {public_key: _make_config(public_key) for public_key in ("a", "b")}
+    with override_options({"relay.projectconfig-cache.shared-blobs": True}):
+        cache.set_many(configs)
+
+    assert len(cache.cluster.keys("relayconfig:blob:*")) == 1
+    assert cache.get("a") == configs["a"]
+    assert cache.get_many(["a", "b"]) == configs
+
+    # Configs cannot be read without their blobs.
+    cache.cluster.delete(*cache.cluster.keys("relayconfig:blob:*"))
+    assert cache.get("a") is None
+
+
+@django_db_all
+def test_get_many_revisions():
+    cache = redis.RedisProjectConfigCache()
+
+    configs = {public_key: _make_config(public_key) for public_key in ("a", "b")}
+    cache.set_many(configs)
+
+    assert cache.get_many(
+        ["a", "b", "c"], revisions={"a": "rev-a", "b": "outdated", "c": "rev-c"}
+    ) == {"a": UNCHANGED, "b": configs["b"], "c": None}
+
+    # The revision of the config is authoritative, not the revision key.
+    cache.cluster.delete("relayconfig:a.rev")
+    assert cache.get_many(["a"], revisions={"a": "rev-a"}) == {"a": UNCHANGED}
+
+    # A config without a revision is never unchanged, and drops the old revision key.
+    cache.set_many({"a": {"disabled": True}})
+    assert cache.get_rev("a") is None
+    cache.cluster.set("relayconfig:a.rev", "rev-a")
+    assert cache.get_many(["a"], revisions={"a": "rev-a"}) == {"a": {"disabled": True}}
+
+    cache.delete_many(["a"])
+    assert cache.get_many(["a"], revisions={"a": "rev-a"}) == {"a": None}
+
+
+@requires_pytest_benchmark
+@pytest.mark.parametrize("shared_blobs", (False, True), ids=("full", "shared_blobs"))
+@pytest.mark.parametrize("unchanged", (False, True), ids=("changed", "unchanged"))
+@django_db_all
+def test_benchmark_get_many(shared_blobs, unchanged, benchmark):
+    cache = redis.RedisProjectConfigCache()
+    cache.cluster.flushdb()
+
+    public_keys = [f"key-{i}" for i in range(100)]
+    with override_options({"relay.projectconfig-cache.shared-blobs": shared_blobs}):
+        cache.set_many({public_key: _make_config(public_key) for public_key in public_keys})
+
+    revisions = {public_key: f"rev-{public_key}" for public_key in public_keys} if unchanged else {}
+    results = benchmark(cache.get_many, public_keys, revisions)
+
+    benchmark.extra_info["stored_bytes"] = _stored_size(cache, public_keys)
+    benchmark.extra_info["response_bytes"] = len(json.dumps(results))
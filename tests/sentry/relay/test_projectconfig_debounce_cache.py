@@ -76,3 +76,20 @@ def test_custom_prefix():
     redis = cache._get_redis_client(expected_key)
 
     assert redis.get(expected_key) == b"1"
+
+
+def test_sections_lifecycle():
+    cache = RedisProjectConfigDebounceCache()
+    kwargs = {
+        "public_key": None,
+        "project_id": 42,
+        "organization_id": None,
+    }
+
+    cache.debounce(**kwargs, sections=["metrics", "quotas"])
+    assert cache.is_debounced(**kwargs, sections=["quotas", "metrics"])
+    assert not cache.is_debounced(**kwargs, sections=["metrics"])
+    assert not cache.is_debounced(**kwargs)
+
+    cache.mark_task_done(**kwargs, sections=["metrics", "quotas"])
+    assert not cache.is_debounced(**kwargs, sections=["metrics", "quotas"])
@@ -23,15 +23,18 @@ from sentry.rules.processing.delayed_processing import (
     DataAndGroups,
     UniqueConditionQuery,
     apply_delayed,
+    apply_delayed_organization,
     bucket_num_groups,
     bulk_fetch_events,
     cleanup_redis_buffer,
+    fetch_project_rule_groups,
     generate_unique_queries,
     get_condition_group_results,
     get_condition_query_groups,
     get_group_to_groupevent,
     get_rules_to_fire,
     get_rules_to_groups,
+    get_shared_condition_group_results,
     get_slow_conditions,
     parse_rulegroup_to_event_data,
     process_delayed_alert_conditions,
@@ -341,6 +344,19 @@ class GetConditionGroupResultsTest(CreateEventTestCase):
             offset_percent_query: {group_id: 1},
         }
 
+    @override_options({"delayed_processing.window_count_cache_ttl": 60})
+    def test_window_count_cache(self):
+        condition_data = self.create_event_frequency_condition(interval=self.interval)
+        condition_groups, group_id, unique_queries = self.create_condition_groups([condition_data])
+        results = get_condition_group_results(condition_groups, self.project)
+        assert results == {unique_queries[0]: {group_id: 2}}
+
+        with patch(
+            "sentry.rules.conditions.event_frequency.BaseEventFrequencyCondition.get_rate_bulk"
+        ) as mock_get_rate_bulk:
+            assert get_condition_group_results(condition_groups, self.project) == results
+        mock_get_rate_bulk.assert_not_called()
+
     def test_count_percent_nonexistent_fast_conditions_together(self):
         """
         Test that a percent and count condition are processed as expected, and
@@ -797,6 +813,69 @@ class ProcessDelayedAlertConditionsTest(CreateEventTestCase, PerformanceIssueTes
         get_condition_query_groups([rule_1, rule_2], rules_to_groups)  # type: ignore[arg-type]
         assert orig_rules_to_groups == rules_to_groups
 
+    @override_options({"delayed_processing.share_organization_queries": True})
+    @patch("sentry.rules.processing.delayed_processing.apply_delayed_organization.delay")
+    def test_process_by_organization(self, mock_apply_delayed_organization):
+        self._push_base_events()
+        process_delayed_alert_conditions()
+
+        mock_apply_delayed_organization.assert_called_once()
+        (project_ids,) = mock_apply_delayed_organization.call_args[0]
+        assert sorted(project_ids) == sorted([self.project.id, self.project_two.id])
+
+        project_ids = buffer.backend.get_sorted_set(
+            PROJECT_ID_BUFFER_LIST_KEY, 0, self.buffer_timestamp
+        )
+        assert project_ids == []
+
+    @patch("sentry.rules.conditions.event_frequency.MIN_SESSIONS_TO_FIRE", 1)
+    def test_apply_delayed_organization_rules_to_fire(self):
+        self._push_base_events()
+        apply_delayed_organization([self.project.id, self.project_two.id])
+
+        rule_fire_histories = RuleFireHistory.objects.filter(
+            rule__in=[self.rule1, self.rule2, self.rule3, self.rule4],
+        ).values_list("rule", "group")
+        assert set(rule_fire_histories) == {
+            (self.rule1.id, self.group1.id),
+            (self.rule2.id, self.group2.id),
+            (self.rule3.id, self.group3.id),
+            (self.rule4.id, self.group4.id),
+        }
+        self.assert_buffer_cleared(project_id=self.project.id)
+        self.assert_buffer_cleared(project_id=self.project_two.id)
+
+    def test_shared_condition_group_results(self):
+        rule5 = self.create_project_rule(
+            project=self.project_two,
+            condition_match=[self.event_frequency_condition],
+            environment_id=self.environment.id,
+        )
+        self._push_base_events()
+        self.push_to_hash(self.project_two.id, rule5.id, self.group3.id, self.event3.event_id)
+
+        all_rule_groups = [
+            fetch_project_rule_groups(self.project, None),
+            fetch_project_rule_groups(self.project_two, None),
+        ]
+        with patch(
+            "sentry.rules.processing.delayed_processing.get_condition_group_results",
+            wraps=get_condition_group_results,
+        ) as mock_get_condition_group_results:
+            project_results = get_shared_condition_group_results(all_rule_groups)
+
+        shared_query = generate_unique_queries(self.event_frequency_condition, self.environment.id)[
+            0
+        ]
+        shared_condition_groups = mock_get_condition_group_results.call_args_list[0][0][0]
+        assert shared_condition_groups[shared_query].group_ids == {self.group1.id, self.group3.id}
+        # Percent conditions depend on the project, so they are not shared.
+        assert all(
+            "Percent" not in unique_condition.cls_id for unique_condition in shared_condition_groups
+        )
+        assert project_results[self.project.id][shared_query][self.group1.id] == 2
+        assert project_results[self.project_two.id][shared_query].get(self.group3.id, 0) == 0
+
     @patch("sentry.rules.processing.delayed_processing.logger")
     def test_apply_delayed_nonexistent_project(self, mock_logger):
         self.push_to_hash(self.project.id, self.rule1.id, self.group1.id, self.event1.event_id)
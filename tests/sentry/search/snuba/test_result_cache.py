@@ -0,0 +1,132 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from sentry.models.group import Group
+from sentry.models.grouphistory import (
+    GroupHistoryStatus,
+    bulk_record_group_history,
+    record_group_history,
+)
+from sentry.search.snuba.result_cache import (
+    cache_search_results,
+    invalidate_group_search_results,
+    invalidate_search_results,
+)
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
+from sentry.utils.cursors import Cursor, CursorResult
+
+
+class CountingExecutor:
+    def __init__(self, results):
+        self.results = results
+        self.calls = 0
+
+    @cache_search_results
+    def query(self, projects, environments, sort_by, limit, cursor, search_filters, date_from):
+        self.calls += 1
+        return CursorResult(
+            results=self.results,
+            next=Cursor(10, 0, False, True),
+            prev=Cursor(0, 0, True, False),
+            hits=len(self.results),
+        )
+
+
+@freeze_time()
+@override_options({"snuba.search.result-cache.ttl": 60})
+class SearchResultCacheTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.groups = [self.create_group(), self.create_group()]
+        self.executor = CountingExecutor(self.groups)
+
+    def query(self, **kwargs):
+        params = {
+            "projects": [self.project],
+            "environments": None,
+            "sort_by": "date",
+            "limit": 25,
+            "cursor": None,
+            "search_filters": [],
+            "date_from": timezone.now() - timedelta(days=14),
+            **kwargs,
+        }
+        return self.executor.query(**params)
+
+    def test_hit(self):
+        result = self.query()
+        cached = self.query()
+
+        assert self.executor.calls == 1
+        assert [group.id for group in cached] == [group.id for group in result]
+        assert cached.next == result.next
+        assert cached.prev == result.prev
+        assert cached.hits == result.hits
+
+    def test_keyed_by_params(self):
+        self.query()
+        self.query(sort_by="new")
+        self.query(cursor=Cursor(10, 0, False, True))
+        self.query(cursor=Cursor(10, 0, False, True))
+
+        assert self.executor.calls == 3
+
+    def test_deleted_groups_are_skipped(self):
+        self.query()
+        self.groups[0].delete()
+
+        assert [group.id for group in self.query()] == [self.groups[1].id]
+        assert self.executor.calls == 1
+
+    def test_invalidated_by_group_history(self):
+        self.query()
+        record_group_history(self.groups[0], GroupHistoryStatus.ASSIGNED)
+        self.query()
+
+        assert self.executor.calls == 2
+
+    def test_invalidated_by_bulk_group_history(self):
+        self.query()
+        bulk_record_group_history(self.groups, GroupHistoryStatus.RESOLVED)
+        self.query()
+
+        assert self.executor.calls == 2
+
+    def test_invalidate_groups_single_query(self):
+        other_groups = [
+            self.create_group(project=self.create_project(organization=self.organization)),
+            self.create_group(project=self.create_project()),
+        ]
+        group_ids = [self.groups[0].id] + [group.id for group in other_groups]
+        groups = list(Group.objects.filter(id__in=group_ids))
+
+        self.query()
+        with self.assertNumQueries(1):
+            invalidate_group_search_results(groups)
+        self.query()
+
+        assert self.executor.calls == 2
+
+    def test_invalidate_groups_disabled(self):
+        group = Group.objects.get(id=self.groups[0].id)
+
+        with override_options({"snuba.search.result-cache.ttl": 0}):
+            with self.assertNumQueries(0):
+                invalidate_group_search_results([group])
+
+    def test_invalidation_is_per_organization(self):
+        self.query()
+        invalidate_search_results(self.create_organization().id)
+        self.query()
+
+        assert self.executor.calls == 1
+
+    def test_disabled(self):
+        with override_options({"snuba.search.result-cache.ttl": 0}):
+            self.query()
+            self.query()
+
+        assert self.executor.calls == 2
@@ -398,6 +398,81 @@ def test_invalid_timestamp_in_indexer_cache(indexer, indexer_cache) -> None:
         )
 
 
+def test_local_cache_tier(indexer, indexer_cache, use_case_id) -> None:
+    """
+    Test that ids are served from the in-process tier once the shared cache
+    no longer has them.
+    """
+    with override_options(
+        {
+            "sentry-metrics.indexer.read-new-cache-namespace": False,
+            "sentry-metrics.indexer.write-new-cache-namespace": False,
+            "sentry-metrics.indexer.local-cache.enabled": True,
+        }
+    ):
+        org_id = 1
+        indexer = CachingIndexer(indexer_cache, indexer)
+
+        res = indexer.bulk_record({use_case_id: {org_id: {"hello"}}})
+        id = res[use_case_id][org_id]["hello"]
+        assert id is not None
+
+        indexer_cache.cache.clear()
+
+        res = indexer.bulk_record({use_case_id: {org_id: {"hello"}}})
+        assert res[use_case_id][org_id]["hello"] == id
+        assert (
+            res.get_fetch_metadata()[use_case_id][org_id]["hello"].fetch_type == FetchType.CACHE_HIT
+        )
+        assert indexer_cache.get("br", f"{use_case_id.value}:{org_id}:hello") is None
+
+        assert indexer.resolve(use_case_id, org_id, "hello") == id
+        assert indexer.reverse_resolve(use_case_id, org_id, id) == "hello"
+
+
+def test_local_cache_negative_resolve(indexer, indexer_cache, use_case_id) -> None:
+    """
+    Test that cached resolve misses are replaced by ids written through the
+    same indexer, but not by ids written elsewhere.
+    """
+    with override_options(
+        {
+            "sentry-metrics.indexer.read-new-cache-namespace": False,
+            "sentry-metrics.indexer.write-new-cache-namespace": False,
+            "sentry-metrics.indexer.local-cache.enabled": True,
+            "sentry-metrics.indexer.local-cache.negative-resolve": True,
+        }
+    ):
+        org_id = 1
+        raw_indexer = indexer
+        indexer = CachingIndexer(indexer_cache, indexer)
+
+        assert indexer.resolve(use_case_id, org_id, "hello") is None
+
+        # written by another process, the miss stays cached until it expires
+        raw_indexer.record(use_case_id, org_id, "hello")
+        assert indexer.resolve(use_case_id, org_id, "hello") is None
+
+        assert indexer.resolve(use_case_id, org_id, "hi") is None
+        id = indexer.record(use_case_id, org_id, "hi")
+        assert id is not None
+        assert indexer.resolve(use_case_id, org_id, "hi") == id
+
+
+def test_reverse_resolve_cache(indexer, indexer_cache, use_case_id) -> None:
+    with override_options({"sentry-metrics.indexer.reverse-resolve-cache": True}):
+        org_id = 1
+        raw_indexer = indexer
+        indexer = CachingIndexer(indexer_cache, indexer)
+
+        id = raw_indexer.record(use_case_id, org_id, "hello")
+        assert indexer_cache.get_reverse(use_case_id, org_id, id) is None
+
+        assert indexer.reverse_resolve(use_case_id, org_id, id) == "hello"
+        assert indexer_cache.get_reverse(use_case_id, org_id, id) == "hello"
+        assert indexer.reverse_resolve(use_case_id, org_id, 1234) is None
+
+
 def test_already_cached_plus_read_results(indexer, indexer_cache, use_case_id) -> None:
     """
     Test that we correctly combine cached results with read results
@@ -4,7 +4,7 @@ import pytest
 from django.conf import settings
 from django.utils import timezone
 
-from sentry.sentry_metrics.indexer.cache import StringIndexerCache
+from sentry.sentry_metrics.indexer.cache import LocalIndexerCache, StringIndexerCache
 from sentry.sentry_metrics.use_case_id_registry import UseCaseID
 from sentry.testutils.helpers.options import override_options
 from sentry.utils.cache import cache
@@ -240,3 +240,38 @@ def test_is_valid_timestamp() -> None:
 
     assert not indexer_cache._is_valid_timestamp(str(stale_ts))
     assert indexer_cache._is_valid_timestamp(str(new_ts))
+
+
+def test_local_cache() -> None:
+    local_cache = LocalIndexerCache(maxsize=2)
+    namespace = "test"
+
+    local_cache.set_many(namespace, {"sessions:3:a": 1, "sessions:3:b": 2})
+    assert local_cache.get_many(namespace, ["sessions:3:a", "sessions:3:b"], caller="test") == {
+        "sessions:3:a": 1,
+        "sessions:3:b": 2,
+    }
+    assert local_cache.get("other", "sessions:3:a", caller="test") is None
+
+    # the oldest entry is evicted once the cache is full
+    local_cache.set(namespace, "sessions:3:c", 3)
+    assert local_cache.get_many(namespace, ["sessions:3:a", "sessions:3:c"], caller="test") == {
+        "sessions:3:c": 3
+    }
+
+    local_cache.delete_many(namespace, ["sessions:3:c"])
+    assert local_cache.get(namespace, "sessions:3:c", caller="test") is None
+
+
+def test_local_cache_negative_entries() -> None:
+    local_cache = LocalIndexerCache()
+    namespace = "test"
+
+    local_cache.set_negative(namespace, "sessions:3:a")
+    assert local_cache.is_negative(namespace, "sessions:3:a")
+    assert local_cache.get(namespace, "sessions:3:a", caller="test") is None
+
+    # writing an id replaces the negative entry
+    local_cache.set(namespace, "sessions:3:a", 1)
+    assert not local_cache.is_negative(namespace, "sessions:3:a")
+    assert local_cache.get(namespace, "sessions:3:a", caller="test") == 1
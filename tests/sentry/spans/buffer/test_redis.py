@@ -1,7 +1,22 @@
-from sentry.spans.buffer.redis import ProcessSegmentsContext, RedisSpansBuffer, SegmentKey
+from sentry.spans.buffer.redis import (
+    ProcessSegmentsContext,
+    RedisSpansBuffer,
+    SegmentKey,
+    decode_span_frames,
+    encode_span_frames,
+)
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 
 
+def test_span_frames():
+    spans = [b"span data", b"", b"\x00" * 300]
+    assert decode_span_frames([encode_span_frames(spans), encode_span_frames([b"x"])]) == [
+        *spans,
+        b"x",
+    ]
+
+
 class TestRedisSpansBuffer:
     @django_db_all
     def test_batch_write(self):
@@ -148,3 +163,80 @@ class TestRedisSpansBuffer:
             b"1710280892",
             b"segment:segment_3:1:process-segment",
         ]
+
+    @django_db_all
+    @override_options({"standalone-spans.buffer-segment-assembly.enable": True})
+    def test_segment_assembly(self):
+        buffer = RedisSpansBuffer()
+        for spans in ([b"span data", b"span data 2"], [b"span data 3"]):
+            buffer.batch_write_and_check_processing(
+                spans_map={
+                    SegmentKey("segment_1", 1, 1): spans,
+                    SegmentKey("segment_2", 1, 1): [b"span data"] * 150,
+                },
+                segment_first_seen_ts={
+                    SegmentKey("segment_1", 1, 1): 1710280889,
+                    SegmentKey("segment_2", 1, 1): 1710280889,
+                },
+                latest_ts_by_partition={1: 1710280889},
+            )
+
+        segment_key_1 = "segment:segment_1:1:process-segment:framed"
+        segment_key_2 = "segment:segment_2:1:process-segment:framed"
+        assert buffer.client.ttl(segment_key_1) == 300
+        assert buffer.client.llen(segment_key_1) == 2
+        assert buffer.client.lrange(
+            "performance-issues:unprocessed-segments:partition-2:1", 0, -1
+        ) == [
+            b"1710280889",
+            segment_key_1.encode(),
+            b"1710280889",
+            segment_key_2.encode(),
+        ]
+
+        with override_options({"standalone-spans.buffer-max-segment-bytes": 1000}):
+            segments = buffer.read_and_expire_segment_batch([segment_key_1, segment_key_2])
+
+        # The second segment is larger than the cap and is evicted unread.
+        assert segments == [(segment_key_1, [b"span data", b"span data 2", b"span data 3"])]
+        assert not buffer.client.exists(segment_key_1)
+        assert not buffer.client.exists(segment_key_2)
+        assert not buffer.client.exists(segment_key_1 + ":size")
+
+    @django_db_all
+    def test_read_segments_in_pages(self):
+        buffer = RedisSpansBuffer()
+        spans = [f"span {i}".encode() for i in range(250)]
+        buffer.batch_write_and_check_processing(
+            spans_map={SegmentKey("segment_1", 1, 1): spans},
+            segment_first_seen_ts={SegmentKey("segment_1", 1, 1): 1710280889},
+            latest_ts_by_partition={1: 1710280889},
+        )
+
+        segment_key = "segment:segment_1:1:process-segment"
+        assert buffer.read_and_expire_segment_batch([segment_key]) == [(segment_key, spans)]
+        assert not buffer.client.exists(segment_key)
+
+    @django_db_all
+    @override_options({"standalone-spans.buffer-max-segment-age.seconds": 150})
+    def test_evict_old_segments(self):
+        buffer = RedisSpansBuffer()
+        buffer.batch_write_and_check_processing(
+            spans_map={
+                SegmentKey("segment_1", 1, 1): [b"span data"],
+                SegmentKey("segment_2", 1, 1): [b"span data"],
+            },
+            segment_first_seen_ts={
+                SegmentKey("segment_1", 1, 1): 1710280800,
+                SegmentKey("segment_2", 1, 1): 1710280880,
+            },
+            latest_ts_by_partition={1: 1710280880},
+        )
+
+        segment_keys = buffer.get_unprocessed_segments_and_prune_bucket(1710281011, 1)
+        assert segment_keys == ["segment:segment_2:1:process-segment"]
+        assert not buffer.client.exists("segment:segment_1:1:process-segment")
+        assert (
+            buffer.client.lrange("performance-issues:unprocessed-segments:partition-2:1", 0, -1)
+            == []
+        )
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from unittest import mock
 
+import pytest
 from arroyo.backends.kafka import KafkaPayload
 from arroyo.types import BrokerValue, Message, Partition
 from arroyo.types import Topic as ArroyoTopic
@@ -133,15 +134,19 @@ def test_consumer_pushes_to_redis():
         "standalone-spans.process-spans-consumer.project-allowlist": [1],
     }
 )
-def test_produces_valid_segment_to_kafka():
+@pytest.mark.parametrize("assemble_segments", (False, True), ids=("expand", "stream"))
+def test_produces_valid_segment_to_kafka(assemble_segments):
     topic = ArroyoTopic(get_topic_definition(Topic.SNUBA_SPANS)["real_topic_name"])
     partition = Partition(topic, 0)
     factory = process_spans_strategy()
-    with mock.patch.object(
-        factory,
-        "producer",
-        new=mock.Mock(),
-    ) as mock_producer:
+    with (
+        override_options({"standalone-spans.buffer-segment-assembly.enable": assemble_segments}),
+        mock.patch.object(
+            factory,
+            "producer",
+            new=mock.Mock(),
+        ) as mock_producer,
+    ):
         strategy = factory.create_with_partitions(
             commit=mock.Mock(),
             partitions={},
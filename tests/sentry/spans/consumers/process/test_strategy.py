@@ -0,0 +1,73 @@
+from datetime import datetime
+from unittest import mock
+
+import pytest
+from arroyo.processing.strategies.abstract import MessageRejected
+from arroyo.types import BrokerValue, Message, Partition, Topic
+
+from sentry.spans.consumers.process.strategy import LazyUnfold
+
+
+def make_message(payload, offset=1):
+    return Message(BrokerValue(payload, Partition(Topic("spans"), 0), offset, datetime.now()))
+
+
+def test_lazy_unfold_submits_all_values():
+    next_step = mock.Mock()
+    strategy = LazyUnfold(generator=lambda n: range(n), next_step=next_step)
+
+    message = make_message(3)
+    strategy.submit(message)
+
+    submitted = [call.args[0] for call in next_step.submit.call_args_list]
+    assert [m.payload for m in submitted] == [0, 1, 2]
+    assert [m.committable for m in submitted] == [{}, {}, message.committable]
+
+
+def test_lazy_unfold_consumes_generator_lazily():
+    pulled = []
+
+    def generator(n):
+        for i in range(n):
+            pulled.append(i)
+            yield i
+
+    next_step = mock.Mock()
+    next_step.submit.side_effect = [None, MessageRejected()]
+    strategy = LazyUnfold(generator=generator, next_step=next_step)
+
+    strategy.submit(make_message(10))
+    # The rejected value is held, and only one value past it was read ahead.
+    assert pulled == [0, 1, 2]
+
+    with pytest.raises(MessageRejected):
+        strategy.submit(make_message(10, offset=2))
+
+    next_step.submit.side_effect = None
+    strategy.poll()
+    assert pulled == list(range(10))
+    assert [call.args[0].payload for call in next_step.submit.call_args_list[2:]] == list(
+        range(1, 10)
+    )
+
+
+def test_lazy_unfold_empty_iterable():
+    next_step = mock.Mock()
+    strategy = LazyUnfold(generator=lambda _: iter(()), next_step=next_step)
+
+    strategy.submit(make_message(0))
+    strategy.join()
+
+    next_step.submit.assert_not_called()
+    next_step.join.assert_called_once()
+
+
+def test_lazy_unfold_join_drains_pending():
+    next_step = mock.Mock()
+    next_step.submit.side_effect = [MessageRejected(), None, None]
+    strategy = LazyUnfold(generator=lambda n: range(n), next_step=next_step)
+
+    strategy.submit(make_message(2))
+    strategy.join()
+
+    assert [call.args[0].payload for call in next_step.submit.call_args_list] == [0, 0, 1]
@@ -9,7 +9,7 @@ from sentry.digests.backends.redis import RedisBackend
 from sentry.digests.notifications import event_to_record
 from sentry.models.projectownership import ProjectOwnership
 from sentry.models.rule import Rule
-from sentry.tasks.digests import deliver_digest
+from sentry.tasks.digests import deliver_digest, deliver_digests
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
 from sentry.testutils.skips import requires_snuba
@@ -77,3 +77,32 @@ class DeliverDigestTest(TestCase):
     def test_no_records(self):
         # This shouldn't error if no records are present
         deliver_digest(f"mail:p:{self.project.id}:IssueOwners:")
+
+    def test_deliver_digests(self):
+        key = f"mail:p:{self.project.id}:IssueOwners::AllMembers"
+        with mock.patch.object(sentry, "digests") as digests:
+            backend = RedisBackend()
+            digests.backend.digest_many = backend.digest_many
+
+            rule = Rule.objects.create(project=self.project, label="Test Rule", data={})
+            ProjectOwnership.objects.create(project_id=self.project.id, fallthrough=True)
+            for fingerprint in ("group-1", "group-2"):
+                event = self.store_event(
+                    data={
+                        "timestamp": iso_format(before_now(days=1)),
+                        "fingerprint": [fingerprint],
+                    },
+                    project_id=self.project.id,
+                )
+                backend.add(
+                    key,
+                    event_to_record(event, [rule], str(uuid.uuid4())),
+                    increment_delay=0,
+                    maximum_delay=0,
+                )
+
+            with self.tasks():
+                deliver_digests([(key, 0.0), (f"mail:p:{self.project.id}:IssueOwners:", 0.0)])
+
+        assert len(mail.outbox) == 1
+        assert "2 new alerts since" in mail.outbox[0].subject
@@ -9,15 +9,19 @@ from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
 from sentry.models.options.project_option import ProjectOption
 from sentry.models.project import Project
 from sentry.models.projectkey import ProjectKey, ProjectKeyStatus
+from sentry.relay.config import get_organization_config_sections
 from sentry.relay.projectconfig_cache.redis import RedisProjectConfigCache
 from sentry.relay.projectconfig_debounce_cache.redis import RedisProjectConfigDebounceCache
 from sentry.tasks.relay import (
     _schedule_invalidate_project_config,
     build_project_config,
+    compute_projectkey_config,
     invalidate_project_config,
     schedule_build_project_config,
     schedule_invalidate_project_config,
 )
+from sentry.testutils.factories import Factories
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.helpers.task_runner import BurstTaskRunner
 from sentry.testutils.hybrid_cloud import simulated_transaction_watermarks
 from sentry.testutils.pytest.fixtures import django_db_all
@@ -94,6 +98,7 @@ def redis_cache(monkeypatch):
     monkeypatch.setattr("sentry.relay.projectconfig_cache.set_many", cache.set_many)
     monkeypatch.setattr("sentry.relay.projectconfig_cache.delete_many", cache.delete_many)
     monkeypatch.setattr("sentry.relay.projectconfig_cache.get", cache.get)
+    monkeypatch.setattr("sentry.relay.projectconfig_cache.get_many", cache.get_many)
 
     return cache
 
@@ -464,6 +469,169 @@ class TestInvalidationTask:
             assert new_cfg is not None
             assert new_cfg != cfg
 
+    def test_invalidate_sections_debounced_separately(
+        self,
+        monkeypatch,
+        default_project,
+        invalidation_debounce_cache,
+        django_cache,
+    ):
+        tasks = []
+
+        def apply_async(args=None, kwargs=None, countdown=None):
+            assert not args
+            tasks.append(kwargs)
+
+        monkeypatch.setattr("sentry.tasks.relay.invalidate_project_config.apply_async", apply_async)
+
+        for sections in (None, ["metrics"], ["quotas"]):
+            invalidation_debounce_cache.mark_task_done(
+                public_key=None,
+                project_id=default_project.id,
+                organization_id=None,
+                sections=sections,
+            )
+        with override_options({"relay.project-config.incremental-invalidation": True}):
+            schedule_invalidate_project_config(project_id=default_project.id, trigger="test")
+            schedule_invalidate_project_config(
+                project_id=default_project.id, trigger="metrics_blocking"
+            )
+            schedule_invalidate_project_config(
+                project_id=default_project.id, trigger="metrics_blocking"
+            )
+            schedule_invalidate_project_config(
+                project_id=default_project.id, trigger="monitors:monitor_created"
+            )
+
+        assert tasks == [
+            {
+                "project_id": default_project.id,
+                "organization_id": None,
+                "public_key": None,
+                "trigger": "test",
+            },
+            {
+                "project_id": default_project.id,
+                "organization_id": None,
+                "public_key": None,
+                "trigger": "metrics_blocking",
+                "sections": ["metrics"],
+            },
+            {
+                "project_id": default_project.id,
+                "organization_id": None,
+                "public_key": None,
+                "trigger": "monitors:monitor_created",
+                "sections": ["quotas"],
+            },
+        ]
+
+    def test_invalidate_sections(
+        self,
+        monkeypatch,
+        default_project,
+        default_projectkey,
+        task_runner,
+        redis_cache,
+        django_cache,
+    ):
+        cfg = compute_projectkey_config(default_projectkey)
+        redis_cache.set_many({default_projectkey.public_key: cfg})
+        cached = redis_cache.get(default_projectkey.public_key)
+
+        metrics_config = {"deniedNames": ["c:custom/foo@none"]}
+        monkeypatch.setattr(
+            "sentry.relay.config.get_metrics_config", lambda timeout, project: metrics_config
+        )
+
+        with (
+            override_options({"relay.project-config.incremental-invalidation": True}),
+            task_runner(),
+        ):
+            schedule_invalidate_project_config(
+                project_id=default_project.id, trigger="metrics_blocking"
+            )
+
+        new_cfg = redis_cache.get(default_projectkey.public_key)
+        assert new_cfg["config"].pop("metrics") == metrics_config
+        assert new_cfg["rev"] != cached["rev"]
+
+        cached["config"].pop("metrics", None)
+        for key in ("lastFetch", "lastChange", "rev"):
+            new_cfg.pop(key)
+            cached.pop(key)
+        assert new_cfg == cached
+
+    @pytest.mark.parametrize("concurrent_rev", ("concurrent", None))
+    def test_invalidate_sections_conflict(
+        self,
+        concurrent_rev,
+        monkeypatch,
+        default_project,
+        default_projectkey,
+        task_runner,
+        redis_cache,
+        django_cache,
+    ):
+        public_key = default_projectkey.public_key
+        cfg = compute_projectkey_config(default_projectkey)
+        redis_cache.set_many({public_key: {**cfg, "config": {**cfg["config"], "stale": True}}})
+
+        metrics_config = {"deniedNames": ["c:custom/foo@none"]}
+
+        def get_metrics_config(timeout, project):
+            # A concurrent invalidation writes a new config while the sections are computed.
+            cached = redis_cache.get(public_key)
+            if cached.get("rev") == cfg["rev"]:
+                cached.pop("rev")
+                if concurrent_rev:
+                    cached["rev"] = concurrent_rev
+                redis_cache.set_many({public_key: cached})
+            return metrics_config
+
+        monkeypatch.setattr("sentry.relay.config.get_metrics_config", get_metrics_config)
+
+        with (
+            override_options({"relay.project-config.incremental-invalidation": True}),
+            task_runner(),
+        ):
+            schedule_invalidate_project_config(
+                project_id=default_project.id, trigger="metrics_blocking"
+            )
+
+        # The full config was recomputed instead of splicing into the outdated config.
+        new_cfg = redis_cache.get(public_key)
+        assert new_cfg["rev"] not in (cfg["rev"], concurrent_rev)
+        assert "stale" not in new_cfg["config"]
+        assert new_cfg["config"]["metrics"] == metrics_config
+
+    def test_invalidate_org_shares_organization_sections(
+        self,
+        default_project,
+        default_organization,
+        redis_cache,
+        task_runner,
+        django_cache,
+    ):
+        project = Factories.create_project(organization=default_organization)
+        for key in [*_cache_keys_for_project(default_project), *_cache_keys_for_project(project)]:
+            redis_cache.set_many({key: {"dummy-key": "val"}})
+
+        with (
+            mock.patch(
+                "sentry.relay.config.get_organization_config_sections",
+                wraps=get_organization_config_sections,
+            ) as get_sections,
+            task_runner(),
+        ):
+            schedule_invalidate_project_config(
+                organization_id=default_organization.id, trigger="test"
+            )
+
+        assert get_sections.call_count == 1
+        for cache_key in _cache_keys_for_org(default_organization):
+            assert redis_cache.get(cache_key)["config"]["trustedRelays"] == []
+
     @mock.patch(
         "sentry.tasks.relay._schedule_invalidate_project_config",
         wraps=_schedule_invalidate_project_config,
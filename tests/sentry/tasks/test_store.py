@@ -15,6 +15,7 @@ from sentry.tasks.store import (
     save_event,
     time_synthetic_monitoring_event,
 )
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 
 EVENT_ID = "cc3e6c2bb6b6498097f336d1e6979f4b"
@@ -121,6 +122,115 @@ def test_move_to_save_event(
     assert mock_save_event.delay.call_count == 1
 
 
+@django_db_all
+@override_options({"store.inline-pipeline-sample-rate": 1.0})
+def test_inline_save_event(
+    default_project,
+    mock_process_event,
+    mock_save_event,
+    mock_event_processing_store,
+    register_plugin,
+):
+    register_plugin(globals(), BasicPreprocessorPlugin)
+    data = {
+        "project": default_project.id,
+        "platform": "NOTMATTLANG",
+        "logentry": {"formatted": "test"},
+        "event_id": EVENT_ID,
+        "extra": {"foo": "bar"},
+    }
+
+    with mock.patch.object(EventManager, "save") as mock_save:
+        preprocess_event(cache_key="e:1", data=data, start_time=1)
+
+    assert mock_save.call_count == 1
+    assert mock_process_event.delay.call_count == 0
+    assert mock_save_event.delay.call_count == 0
+
+
+@django_db_all
+@override_options({"store.inline-pipeline-sample-rate": 1.0})
+def test_inline_process_and_save_event(
+    default_project,
+    mock_process_event,
+    mock_save_event,
+    mock_event_processing_store,
+    register_plugin,
+):
+    register_plugin(globals(), BasicPreprocessorPlugin)
+    data = {
+        "project": default_project.id,
+        "platform": "mattlang",
+        "logentry": {"formatted": "test"},
+        "event_id": EVENT_ID,
+        "extra": {"foo": "bar"},
+    }
+    mock_event_processing_store.store.return_value = "e:1"
+
+    with mock.patch.object(EventManager, "save", autospec=True) as mock_save:
+        preprocess_event(cache_key="e:1", data=data, start_time=1)
+
+    ((_, (manager, project_id), _),) = mock_save.mock_calls
+    assert project_id == default_project.id
+    assert "extra" not in manager.get_data()
+    assert mock_process_event.delay.call_count == 0
+    assert mock_save_event.delay.call_count == 0
+
+
+@django_db_all
+@override_options({"store.inline-pipeline-sample-rate": 1.0})
+def test_inline_save_event_falls_back_to_queue(
+    default_project,
+    mock_process_event,
+    mock_save_event,
+    mock_event_processing_store,
+    register_plugin,
+):
+    register_plugin(globals(), BasicPreprocessorPlugin)
+    data = {
+        "project": default_project.id,
+        "platform": "NOTMATTLANG",
+        "logentry": {"formatted": "test"},
+        "event_id": EVENT_ID,
+        "extra": {"foo": "bar"},
+    }
+
+    with mock.patch.object(EventManager, "__init__", side_effect=ValueError):
+        preprocess_event(cache_key="e:1", data=data, start_time=1)
+
+    assert mock_process_event.delay.call_count == 0
+    mock_save_event.delay.assert_called_once_with(
+        cache_key="e:1", data=None, start_time=1, event_id=None, project_id=default_project.id
+    )
+
+
+@django_db_all
+@override_options({"store.inline-pipeline-sample-rate": 1.0})
+def test_inline_save_event_not_saved_twice(
+    default_project,
+    mock_process_event,
+    mock_save_event,
+    mock_event_processing_store,
+    register_plugin,
+):
+    register_plugin(globals(), BasicPreprocessorPlugin)
+    data = {
+        "project": default_project.id,
+        "platform": "NOTMATTLANG",
+        "logentry": {"formatted": "test"},
+        "event_id": EVENT_ID,
+        "extra": {"foo": "bar"},
+    }
+
+    with mock.patch.object(EventManager, "save", side_effect=ValueError) as mock_save:
+        preprocess_event(cache_key="e:1", data=data, start_time=1)
+
+    # The event may have been saved partially, so it is not saved again
+    assert mock_save.call_count == 1
+    assert mock_process_event.delay.call_count == 0
+    assert mock_save_event.delay.call_count == 0
+
+
 @django_db_all
 def test_process_event_mutate_and_save(
     default_project, mock_event_processing_store, mock_save_event, register_plugin
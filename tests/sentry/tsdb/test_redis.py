@@ -5,6 +5,8 @@ import pytest
 
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.options import override_options
+from sentry.testutils.pytest.fixtures import django_db_all
+from sentry.testutils.skips import requires_pytest_benchmark
 from sentry.tsdb.base import ONE_DAY, ONE_HOUR, ONE_MINUTE, TSDBModel
 from sentry.tsdb.redis import CountMinScript, RedisTSDB, SuppressionWrapper
 from sentry.utils.dates import to_datetime
@@ -185,6 +187,34 @@ class RedisTSDBTest(TestCase):
         sum_results = self.db.get_sums(TSDBModel.project, [1, 2], dts[0], dts[-1], environment_id=1)
         assert sum_results == {1: 0, 2: 0}
 
+    def test_get_range_series(self):
+        now = datetime.now(timezone.utc) - timedelta(hours=4)
+        dts = [now + timedelta(hours=i) for i in range(4)]
+        keys = [1, "foo", *range(100, 200)]
+
+        for i, key in enumerate(keys):
+            self.db.incr(TSDBModel.project, key, dts[i % 4], count=i + 1)
+        self.db.incr(TSDBModel.project, 1, dts[3], count=5, environment_id=1)
+
+        series = self.db.get_range_series(TSDBModel.project, keys, dts[0], dts[-1])
+
+        assert list(series.timestamps) == [
+            int(dt.timestamp()) - int(dt.timestamp()) % 3600 for dt in dts
+        ]
+        assert list(series.values[1]) == [1, 0, 0, 5]
+        assert list(series.values["foo"]) == [0, 2, 0, 0]
+        assert series.to_points() == self.db.get_range(TSDBModel.project, keys, dts[0], dts[-1])
+        assert series.sums() == self.db.get_sums(TSDBModel.project, keys, dts[0], dts[-1])
+        assert list(series.total()) == [
+            sum(i + 1 for i in range(len(keys)) if i % 4 == j) + (5 if j == 3 else 0)
+            for j in range(4)
+        ]
+
+        series = self.db.get_range_series(
+            TSDBModel.project, [1, "foo"], dts[0], dts[-1], environment_id=1
+        )
+        assert series.sums() == {1: 5, "foo": 0}
+
     def test_count_distinct(self):
         now = datetime.now(timezone.utc) - timedelta(hours=4)
         dts = [now + timedelta(hours=i) for i in range(4)]
@@ -323,6 +353,48 @@ class RedisTSDBTest(TestCase):
         )
         assert results == {1: 0, 2: 0}
 
+    def test_count_distinct_merged_spans(self):
+        model = TSDBModel.users_affected_by_group
+        end = datetime.now(timezone.utc)
+        start = end - timedelta(days=27)
+        for day in range(28):
+            timestamp = start + timedelta(days=day)
+            self.db.record(model, 1, [f"{day % 10}:{i}" for i in range(day)], timestamp)
+            self.db.record(model, 2, [str(day)], timestamp, environment_id=1)
+
+        def get_totals():
+            return [
+                self.db.get_distinct_counts_totals(
+                    model, [1, 2], start, end, rollup=ONE_DAY, environment_id=environment_id
+                )
+                for environment_id in (None, 1)
+            ]
+
+        expected = get_totals()
+
+        def merged_span_exists(index, key):
+            host = self.db.cluster.get_router().get_host_for_key(key)
+            return self.db.cluster.get_local_client(host).exists(
+                self.db.make_merged_distinct_counts_key(model, ONE_DAY, 7, index, key, None)
+            )
+
+        first_span = self.db.normalize_to_rollup(start, ONE_DAY) // 7 + 1
+        with override_options({"tsdb.redis.distinct-counts.merge-span": 7}):
+            # The first query merges the spans, the second one reads them.
+            assert get_totals() == expected
+            assert merged_span_exists(first_span, 1)
+            assert get_totals() == expected
+
+            # Merging counters replaces the outdated spans.
+            self.db.merge_distinct_counts(model, 1, [2], start, environment_ids=[1])
+            assert not merged_span_exists(first_span, 1)
+            with override_options({"tsdb.redis.distinct-counts.merge-span": 0}):
+                expected = get_totals()
+            assert get_totals() == expected
+
+            self.db.delete_distinct_counts([model], [1, 2], start, end, environment_ids=[1])
+            assert get_totals() == [{1: 0, 2: 0}, {1: 0, 2: 0}]
+
     def test_frequency_tables(self):
         now = datetime.now(timezone.utc)
         model = TSDBModel.frequent_issues_by_project
@@ -817,3 +889,33 @@ class RedisTSDBTest(TestCase):
             [b"eta", b"7"],
             [b"bar", b"7"],
         ]
+
+
+@requires_pytest_benchmark
+@pytest.mark.parametrize("days", (30, 90))
+@pytest.mark.parametrize("merge_span", (0, 7), ids=("raw", "merged"))
+@django_db_all
+def test_benchmark_distinct_counts_totals(days, merge_span, benchmark):
+    db = RedisTSDB(rollups=((ONE_HOUR, 24 * 7), (ONE_DAY, 90)))
+    model = TSDBModel.users_affected_by_group
+    keys = list(range(1, 21))
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(days=days - 1)
+
+    for day in range(days):
+        db.record_multi(
+            [(model, key, [f"{day % 30}:{i}" for i in range(200)]) for key in keys],
+            start + timedelta(days=day),
+        )
+
+    try:
+        with override_options({"tsdb.redis.distinct-counts.merge-span": merge_span}):
+            # Merged spans are created by the first query.
+            expected = db.get_distinct_counts_totals(model, keys, start, end, rollup=ONE_DAY)
+            results = benchmark(
+                db.get_distinct_counts_totals, model, keys, start, end, rollup=ONE_DAY
+            )
+        assert results == expected
+    finally:
+        with db.cluster.all() as client:
+            client.flushdb()
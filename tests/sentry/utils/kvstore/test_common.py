@@ -128,3 +128,18 @@ def test_multiple_key_operations(properties: Properties) -> None:
     store.delete_many(all_keys)
 
     assert dict(store.get_many(all_keys)) == {}
+
+
+def test_set_many(properties: Properties) -> None:
+    store = properties.store
+
+    items = dict(itertools.islice(properties.items, 10))
+    store.set_many(list(items.items()), ttl=timedelta(seconds=30))
+
+    assert dict(store.get_many(list(items))) == items
+
+    # Test overwriting a subset of the keys.
+    updated = {key: next(properties.values) for key in list(items)[:5]}
+    store.set_many(list(updated.items()))
+
+    assert dict(store.get_many(list(items))) == {**items, **updated}
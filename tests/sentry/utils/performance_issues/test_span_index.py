@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sentry.testutils.performance_issues.event_generators import (
+    EVENTS,
+    create_event,
+    create_span,
+    get_event,
+    modify_span_start,
+)
+from sentry.testutils.pytest.fixtures import django_db_all
+from sentry.testutils.skips import requires_pytest_benchmark
+from sentry.utils.performance_issues.performance_detection import (
+    DETECTOR_CLASSES,
+    get_detection_settings,
+    run_detector_on_data,
+)
+from sentry.utils.performance_issues.span_index import SpanOpIndex
+
+# Ops of a typical large backend transaction, roughly by frequency.
+SPAN_OPS = ["db", "db", "db", "http.client", "cache.get", "function", "resource.script", "ui.load"]
+
+
+def create_large_event(num_spans: int) -> dict[str, Any]:
+    spans = []
+    for i in range(num_spans):
+        op = SPAN_OPS[i % len(SPAN_OPS)]
+        if op == "http.client":
+            desc = f"GET /api/items/{i % 13}/"
+        else:
+            desc = f"SELECT * FROM table_{i % 7} WHERE id = %s"
+        span = create_span(op, duration=(i % 1200) + 1.0, desc=desc, hash=f"{i % 50:016x}")
+        span["span_id"] = f"{i:016x}"
+        spans.append(modify_span_start(span, i * 2.0))
+    return create_event(spans)
+
+
+def run_detectors(event: dict[str, Any], use_index: bool) -> dict[str, Any]:
+    settings = get_detection_settings()
+    span_index = SpanOpIndex(event.get("spans", [])) if use_index else None
+
+    problems = {}
+    for detector_class in DETECTOR_CLASSES:
+        detector = detector_class(settings, event)
+        run_detector_on_data(detector, event, span_index)
+        problems[detector.type.value] = detector.stored_problems
+    return problems
+
+
+def test_spans_with_op_prefixes():
+    spans = [{"op": "db"}, {"op": "http.client"}, {}, {"op": 1}, {"op": "db.query"}]
+    index = SpanOpIndex(spans)
+    assert index.spans_with_op_prefixes(("db",)) == [spans[0], spans[4]]
+    assert index.spans_with_op_prefixes(("http", "db.")) == [spans[1], spans[4]]
+    assert index.spans_with_op_prefixes(()) == []
+
+
+@django_db_all
+@pytest.mark.parametrize("event_name", sorted(EVENTS))
+def test_same_problems_with_index(event_name):
+    event = get_event(event_name)
+    assert run_detectors(event, use_index=True) == run_detectors(event, use_index=False)
+
+
+@django_db_all
+def test_same_problems_with_index_large_event():
+    event = create_large_event(2_000)
+    assert run_detectors(event, use_index=True) == run_detectors(event, use_index=False)
+
+
+@django_db_all
+@requires_pytest_benchmark
+@pytest.mark.parametrize("num_spans", [1_000, 10_000, 50_000])
+@pytest.mark.parametrize("use_index", [False, True], ids=["visit_all", "span_op_index"])
+def test_benchmark_detectors(num_spans, use_index, benchmark):
+    event = create_large_event(num_spans)
+    benchmark(run_detectors, event, use_index)
@@ -8,6 +8,7 @@ from sentry.api.serializers import serialize
 from sentry.api.serializers.models.group import GroupSerializerSnuba
 from sentry.issues.grouptype import PerformanceNPlusOneGroupType, ProfileFileIOGroupType
 from sentry.models.group import Group, GroupStatus
+from sentry.models.groupbookmark import GroupBookmark
 from sentry.models.groupenvironment import GroupEnvironment
 from sentry.models.grouplink import GroupLink
 from sentry.models.groupresolution import GroupResolution
@@ -18,10 +19,12 @@ from sentry.notifications.types import NotificationSettingsOptionEnum
 from sentry.silo.base import SiloMode
 from sentry.testutils.cases import APITestCase, PerformanceIssueTestCase, SnubaTestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.silo import assume_test_silo_mode
 from sentry.types.group import PriorityLevel
 from sentry.users.models.user_option import UserOption
 from sentry.utils.samples import load_data
+from sentry.utils.snuba import execute_snuba_requests
 from tests.sentry.issues.test_utils import SearchIssueTestMixin
 
 
@@ -424,6 +427,46 @@ class GroupSerializerSnubaTest(APITestCase, SnubaTestCase):
         assert iso_format(result["firstSeen"]) == iso_format(self.week_ago)
         assert result["count"] == "1"
 
+    def test_concurrent_attrs(self):
+        environment = self.create_environment(project=self.project)
+        groups = []
+        for fingerprint, timestamp in [("group1", self.min_ago), ("group2", self.week_ago)]:
+            event = self.store_event(
+                data={
+                    "fingerprint": [fingerprint],
+                    "timestamp": iso_format(timestamp),
+                    "environment": environment.name,
+                    "user": {"id": fingerprint},
+                },
+                project_id=self.project.id,
+            )
+            groups.append(event.group)
+        GroupSnooze.objects.create(
+            group=groups[0], until=timezone.now() + timedelta(minutes=1), actor_id=self.user.id
+        )
+        GroupBookmark.objects.create(user_id=self.user.id, group=groups[1], project=self.project)
+
+        serializer = GroupSerializerSnuba(
+            environment_ids=[environment.id],
+            start=self.day_ago - timedelta(days=7),
+            end=timezone.now(),
+        )
+        with (
+            override_options({"api.group-serializer.concurrent-attrs": True}),
+            mock.patch(
+                "sentry.api.serializers.models.group.execute_snuba_requests",
+                side_effect=execute_snuba_requests,
+            ) as execute,
+        ):
+            concurrent = serialize(groups, self.user, serializer=serializer)
+
+        # The seen stats run as one batch, then the unhandled flags.
+        assert execute.call_count == 2
+        assert concurrent == serialize(groups, self.user, serializer=serializer)
+        assert concurrent[0]["userCount"] == 1
+        assert concurrent[0]["statusDetails"]["actor"]["id"] == str(self.user.id)
+        assert concurrent[1]["isBookmarked"]
+
     def test_get_start_from_seen_stats(self):
         for days, expected in [(None, 30), (0, 14), (1000, 90)]:
             last_seen = None if days is None else before_now(days=days)